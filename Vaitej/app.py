@@ -1,19 +1,59 @@
 from flask import (
     Flask, render_template, redirect,
-    url_for, request, session, flash
+    url_for, request, session, flash,
+    abort, jsonify
 )
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import text
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-from validators import (
-    validate_common,
-    validate_founder,
-    validate_investor
-)
+from validators import REGISTRATION_SCHEMAS
 from config import Config
-from datetime import date,timedelta,datetime
-import os, time
+from matching import (
+    FOUNDER_SQL,
+    FOUNDERS_SQL,
+    investor_match_rows,
+    match_pitch_score,
+    upsert_matches
+)
+from scoring_model import load_model
+from investor_index import InvestorIndex
+from founder_index import FounderIndex, load_feed_investor
+from focus import founder_focus, store_investor_focus
+from jobs import ACTIVE_STATUSES, JobQueue, make_job_store
+from cache import make_cache
+import counters
+from view_events import ViewEventBuffer, write_view_events
+from db_pool import engine_options, pool_status
+from match_listing import MATCH_STATUSES, decode_cursor, list_matches
+from pitch_decks import (
+    SCORING_FAILED,
+    SCORING_PENDING,
+    UploadRequest,
+    find_duplicate_deck,
+    set_deck_score,
+    set_deck_scoring_failed,
+    set_deck_scoring_pending
+)
+from deck_analysis import analysis_for, cached_analysis, latest_deck_scores
+from readiness import founder_readiness
+from instrumentation import Instrumentation
+from template_cache import compile_templates, init_template_caching
+from passwords import HasherBusy, PasswordHasher
+from rate_limit import SlidingWindowLimiter
+from sessions import ServerSessionInterface, make_session_store
+import bulk_io
+import rematch
+from db_routing import (
+    RoutingSession,
+    mark_primary_sticky,
+    replica_binds,
+    replica_reads
+)
+from datetime import date
+from functools import wraps
+import atexit, hmac, json, os, sys, time
+import click
 
 # -------------------------------------------------
 # APP SETUP
@@ -21,8 +61,32 @@ import os, time
 app = Flask(__name__)
 app.config.from_object(Config)
 
-# Session + flash
-app.secret_key = app.config.get("SECRET_KEY", "dev-secret-key")
+# Behind TRUSTED_PROXY_HOPS proxies, request.remote_addr is the real
+# client (rate limits and internal_only key on it)
+if app.config["TRUSTED_PROXY_HOPS"]:
+    app.wsgi_app = ProxyFix(
+        app.wsgi_app,
+        x_for=app.config["TRUSTED_PROXY_HOPS"],
+        x_proto=app.config["TRUSTED_PROXY_HOPS"]
+    )
+
+# Session + flash: data lives in a server-side store, the cookie only
+# carries the session id. The default is a file, not worker memory, so a
+# user stays signed in whichever worker serves the next request.
+session_store_path = app.config["SESSION_STORE_PATH"]
+if not session_store_path:
+    os.makedirs(app.instance_path, exist_ok=True)
+    session_store_path = os.path.join(app.instance_path, "sessions.db")
+
+app.session_interface = ServerSessionInterface(
+    make_session_store(
+        session_store_path,
+        max_entries=app.config["SESSION_STORE_SIZE"],
+        max_anonymous=app.config["ANONYMOUS_SESSION_STORE_SIZE"]
+    ),
+    anonymous_ttl=app.config["ANONYMOUS_SESSION_TTL"]
+)
+
 # -------------------------------------------------
 # FILE UPLOAD CONFIG
 # -------------------------------------------------
@@ -31,54 +95,187 @@ UPLOAD_FOLDER = os.path.join(BASE_DIR, "static", "uploads")
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-db = SQLAlchemy(app)
-def calculate_match_score(founder, investor, pitch_score):
-    score = 0
-    reasons = []
-
-    # 1️⃣ Stage fit (30)
-    if founder["stage"] and founder["stage"] in investor["investment_stage"]:
-        score += 30
-        reasons.append("stage alignment")
-
-    # 2️⃣ Sector fit (25)
-    if founder["sector"] and investor["sector_focus"]:
-        if founder["sector"].lower() in investor["sector_focus"].lower():
-            score += 25
-            reasons.append("sector alignment")
-
-    # 3️⃣ Check size fit (15)
-    if (
-        investor["typical_check_min"]
-        and investor["typical_check_max"]
-        and founder["min_check_size"]
-    ):
-        if investor["typical_check_min"] <= founder["min_check_size"] <= investor["typical_check_max"]:
-            score += 15
-            reasons.append("check size compatibility")
-
-    # 4️⃣ Geography fit (10)
-    if founder["country"] and investor["geography_focus"]:
-        if founder["country"].lower() in investor["geography_focus"].lower():
-            score += 10
-            reasons.append("geographic focus")
-
-    # 5️⃣ Trust & activity (10)
-    if investor["verification_status"] == "verified":
-        score += 6
-        reasons.append("verified investor")
-
-    if investor["activity_status"] == "active":
-        score += 4
-
-    # 6️⃣ Founder readiness boost (10)
-    if pitch_score >= 80:
-        score += 10
-        reasons.append("strong pitch readiness")
-    elif pitch_score >= 60:
-        score += 5
-
-    return score, ", ".join(reasons)
+# Uploaded files are hashed and written into UPLOAD_FOLDER while the
+# multipart body is parsed; the view only renames the finished file
+UploadRequest.upload_dir = UPLOAD_FOLDER
+UploadRequest.max_upload_bytes = app.config["MAX_PITCH_DECK_BYTES"]
+app.request_class = UploadRequest
+
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+app.config.setdefault("SQLALCHEMY_BINDS", {}).update(
+    replica_binds(app.config["SQLALCHEMY_REPLICA_URIS"])
+)
+db = SQLAlchemy(app, session_options={"class_": RoutingSession})
+instrumentation = Instrumentation(app)
+fragment_cache = init_template_caching(app)
+
+# -------------------------------------------------
+# SCORING MODEL, MATCHING INDEX + BACKGROUND JOBS
+# -------------------------------------------------
+scoring_model = load_model(app.config["SCORING_MODEL_PATH"])
+
+investor_index = InvestorIndex(
+    scoring_model, max_age=app.config["INVESTOR_INDEX_MAX_AGE"]
+)
+founder_index = FounderIndex(
+    scoring_model, max_age=app.config["FOUNDER_INDEX_MAX_AGE"]
+)
+
+match_jobs = JobQueue(
+    make_job_store(
+        app.config["MATCH_JOB_STORE_PATH"],
+        result_ttl=app.config["JOB_RESULT_TTL"]
+    ),
+    max_workers=app.config["MATCH_JOB_WORKERS"]
+)
+
+
+# PDF scoring gets its own pool so slow decks never delay matching
+pitch_jobs = JobQueue(
+    make_job_store(
+        app.config["MATCH_JOB_STORE_PATH"],
+        result_ttl=app.config["JOB_RESULT_TTL"]
+    ),
+    max_workers=app.config["PITCH_JOB_WORKERS"]
+)
+
+
+def match_job_key(user_id):
+    return f"matches:{user_id}"
+
+
+def investor_match_job_key(investor_id):
+    return f"investor-matches:{investor_id}"
+
+
+def pitch_job_key(deck_id):
+    return f"pitch:{deck_id}"
+
+# -------------------------------------------------
+# PASSWORD HASHING + AUTH RATE LIMITS
+# -------------------------------------------------
+password_hasher = PasswordHasher(
+    app.config["PASSWORD_HASH_METHOD"],
+    max_workers=app.config["PASSWORD_HASH_WORKERS"],
+    max_queued=app.config["PASSWORD_HASH_MAX_QUEUED"],
+    queue_timeout=app.config["PASSWORD_HASH_QUEUE_TIMEOUT"]
+)
+password_hasher.start()
+
+login_ip_limiter = SlidingWindowLimiter(
+    app.config["LOGIN_LIMIT_PER_IP"], app.config["AUTH_RATE_WINDOW"]
+)
+login_email_limiter = SlidingWindowLimiter(
+    app.config["LOGIN_LIMIT_PER_EMAIL"], app.config["AUTH_RATE_WINDOW"]
+)
+register_ip_limiter = SlidingWindowLimiter(
+    app.config["REGISTER_LIMIT_PER_IP"], app.config["AUTH_RATE_WINDOW"]
+)
+
+TOO_MANY_ATTEMPTS = "Too many attempts. Please wait a few minutes and try again."
+HASHER_BUSY = "We're busy right now. Please try again in a moment."
+
+# -------------------------------------------------
+# DASHBOARD CACHE
+# -------------------------------------------------
+dashboard_cache = make_cache(
+    app.config["DASHBOARD_CACHE_URL"],
+    max_entries=app.config["DASHBOARD_CACHE_SIZE"],
+    default_ttl=app.config["DASHBOARD_CACHE_TTL"],
+    namespace="dashboard"
+)
+
+
+def dashboard_cache_key(user_id):
+    return f"founder-dashboard:{user_id}"
+
+
+def invalidate_founder_dashboard(user_id):
+    dashboard_cache.delete(dashboard_cache_key(user_id))
+
+# -------------------------------------------------
+# INVESTOR FEED CACHE
+# -------------------------------------------------
+# One ranked list per investor, paged from the cache. Founder edits are
+# not pushed to every investor's feed; the TTL bounds how stale it gets.
+# Same backend as the dashboard cache, but its own namespace and size,
+# so heavy feed paging never evicts dashboard entries.
+investor_feed_cache = make_cache(
+    app.config["DASHBOARD_CACHE_URL"],
+    max_entries=app.config["INVESTOR_FEED_CACHE_SIZE"],
+    default_ttl=app.config["INVESTOR_FEED_CACHE_TTL"],
+    namespace="investor-feed"
+)
+
+
+def investor_feed_cache_key(investor_id):
+    return f"investor-feed:{investor_id}"
+
+# -------------------------------------------------
+# PROFILE VIEW EVENTS (BUFFERED)
+# -------------------------------------------------
+def flush_view_events(events):
+    with app.app_context():
+        write_view_events(db.session, events)
+        db.session.commit()
+
+
+def log_view_flush_error(error, events):
+    app.logger.error("Dropped %d profile view events: %s", len(events), error)
+
+
+view_events = ViewEventBuffer(
+    flush_view_events,
+    batch_size=app.config["VIEW_EVENT_BATCH_SIZE"],
+    flush_interval=app.config["VIEW_EVENT_FLUSH_INTERVAL"],
+    capacity=app.config["VIEW_EVENT_BUFFER_CAPACITY"],
+    enqueue_timeout=app.config["VIEW_EVENT_ENQUEUE_TIMEOUT"],
+    on_error=log_view_flush_error
+)
+atexit.register(view_events.close)
+
+# -------------------------------------------------
+# PROFILE CHANGE HOOKS
+# -------------------------------------------------
+def investor_profile_changed(investor_id):
+    # Call after any commit that creates or edits an investor profile
+    investor_feed_cache.delete(investor_feed_cache_key(investor_id))
+
+    if investor_index.refresh(db.session, investor_id) is None:
+        return  # no longer eligible for matching
+
+    match_jobs.submit(
+        investor_match_job_key(investor_id), run_investor_rematch, investor_id
+    )
+
+
+def founder_profile_changed(user_id):
+    # Call after any commit that creates a founder profile (registration
+    # is the only founder write today): match just this founder
+    invalidate_founder_dashboard(user_id)
+    match_jobs.submit(match_job_key(user_id), run_match_generation, user_id)
+
+# -------------------------------------------------
+# SESSION IDENTITY
+# -------------------------------------------------
+PROFILE_ID_SQL = {
+    "founder": text("SELECT id FROM founder_profiles WHERE user_id = :uid"),
+    "investor": text("SELECT id FROM investor_profiles WHERE user_id = :uid"),
+}
+
+
+def profile_id_for(role, user_id):
+    return db.session.execute(PROFILE_ID_SQL[role], {"uid": user_id}).scalar()
+
+
+def current_profile_id():
+    # founder_profiles.id / investor_profiles.id of the signed-in user,
+    # resolved at login and kept in the session
+    profile_id = session.get("profile_id")
+    if profile_id is None:
+        profile_id = profile_id_for(session["role"], session["user_id"])
+        session["profile_id"] = profile_id
+    return profile_id
 
 # -------------------------------------------------
 # ENTRY PAGE
@@ -118,6 +315,13 @@ def login():
                 role=role
             )
 
+        # Both limits are checked before any hashing happens
+        if not (login_ip_limiter.hit(request.remote_addr)
+                and login_email_limiter.hit(email.strip().lower())):
+            return render_template(
+                "login.html", error=TOO_MANY_ATTEMPTS, role=role
+            ), 429
+
         user = db.session.execute(
             text("""
                 SELECT id, role, password_hash
@@ -127,7 +331,14 @@ def login():
             {"email": email}
         ).fetchone()
 
-        if not user or not check_password_hash(user.password_hash, password):
+        try:
+            valid = user is not None and password_hasher.verify(
+                user.password_hash, password
+            )
+        except HasherBusy:
+            return render_template("login.html", error=HASHER_BUSY, role=role), 503
+
+        if not valid:
             return render_template(
                 "login.html",
                 error="Invalid email or password.",
@@ -136,8 +347,11 @@ def login():
 
         # -------- SESSION SET --------
         session.clear()
+        session.regenerate()
         session["user_id"] = user.id
         session["role"] = user.role
+        if user.role in PROFILE_ID_SQL:
+            session["profile_id"] = profile_id_for(user.role, user.id)
 
         # -------- REDIRECT --------
         if user.role == "founder":
@@ -157,27 +371,23 @@ def register(role):
         return redirect(url_for("entry"))
 
     if request.method == "POST":
-        form = request.form
-
-        # ---------- COMMON VALIDATION ----------
-        if not validate_common(form):
+        # ---------- VALIDATION ----------
+        checked = REGISTRATION_SCHEMAS[role].validate(request.form)
+        if not checked.ok:
             return render_template(
                 f"register_{role}.html",
-                error="Please fill all required fields."
+                error="Please fix the fields below.",
+                field_errors=checked.errors
             )
 
-        # ---------- ROLE VALIDATION ----------
-        if role == "founder" and not validate_founder(form):
-            return render_template(
-                "register_founder.html",
-                error="Please complete all founder fields."
-            )
+        # Normalized values from here on: trimmed text, int year and check
+        # size, canonical stage names
+        form = checked.values
 
-        if role == "investor" and not validate_investor(form):
+        if not register_ip_limiter.hit(request.remote_addr):
             return render_template(
-                "register_investor.html",
-                error="Please complete all investor fields."
-            )
+                f"register_{role}.html", error=TOO_MANY_ATTEMPTS
+            ), 429
 
         try:
             # ---------- CHECK EMAIL ----------
@@ -193,6 +403,8 @@ def register(role):
                 )
 
             # ---------- CREATE USER ----------
+            password_hash = password_hasher.hash(form["password"])
+
             result = db.session.execute(
                 text("""
                     INSERT INTO users
@@ -206,7 +418,7 @@ def register(role):
                     "role": role,
                     "full_name": form["full_name"],
                     "email": form["email"],
-                    "password": generate_password_hash(form["password"]),
+                    "password": password_hash,
                     "phone": form["phone"],
                     "country": form["country"],
                     "referral": form.get("referral")
@@ -238,7 +450,7 @@ def register(role):
                 )
 
             if role == "investor":
-                db.session.execute(
+                investor = db.session.execute(
                     text("""
                         INSERT INTO investor_profiles
                         (user_id, fund_name, investment_stage,
@@ -259,12 +471,25 @@ def register(role):
                         "accredited": form["accredited"]
                     }
                 )
+                store_investor_focus(db.session, [investor.lastrowid])
 
             db.session.commit()
 
+            if role == "founder":
+                founder_profile_changed(user_id)
+
+            if role == "investor":
+                investor_profile_changed(investor.lastrowid)
+
             # Show success animation, then user goes to login
             return render_template(f"register_{role}.html", success=True)
 
+        except HasherBusy:
+            db.session.rollback()
+            return render_template(
+                f"register_{role}.html", error=HASHER_BUSY
+            ), 503
+
         except Exception as e:
             db.session.rollback()
             return render_template(
@@ -277,74 +502,56 @@ def register(role):
 # -------------------------------------------------
 # FOUNDER DASHBOARD (PROTECTED)
 # -------------------------------------------------
-@app.route("/founder/home")
-def founder_home():
-    if session.get("role") != "founder":
-        return redirect(url_for("login"))
-
-    user_id = session.get("user_id")
-
+FOUNDER_DASHBOARD_SQL = text("""
+    SELECT 
+        f.id AS founder_id,
+        u.full_name,
+        u.email,
+        u.phone,
+        u.country,
+        f.company_name,
+        f.founding_year,
+        f.stage,
+        f.sector,
+        f.business_model,
+        f.actively_raising,
+        f.raise_target,
+        f.raise_raised,
+        f.fundraising_status,
+        f.fundraising_start_date
+    FROM users u
+    JOIN founder_profiles f ON u.id = f.user_id
+    WHERE u.id = :uid
+""")
+
+
+def build_founder_dashboard(user_id):
     founder = db.session.execute(
-        text("""
-            SELECT 
-                u.full_name,
-                u.email,
-                u.phone,
-                u.country,
-                f.company_name,
-                f.founding_year,
-                f.stage,
-                f.sector,
-                f.business_model,
-                f.actively_raising,
-                f.raise_target,
-                f.raise_raised,
-                f.fundraising_status,
-                f.fundraising_start_date
-            FROM users u
-            JOIN founder_profiles f ON u.id = f.user_id
-            WHERE u.id = :uid
-        """),
-        {"uid": user_id}
+        FOUNDER_DASHBOARD_SQL, {"uid": user_id}
     ).fetchone()
 
-    # ------------------------------------------------
-    # PROFILE COMPLETION (already built)
-    # ------------------------------------------------
-    required_fields = [
-        founder.full_name, founder.email, founder.phone, founder.country,
-        founder.company_name, founder.founding_year, founder.stage,
-        founder.sector, founder.business_model
-    ]
-    completion_percent = int(
-        (sum(1 for f in required_fields if f) / len(required_fields)) * 100
+    # Read from rollups kept by counters.py, not the event tables
+    recent_views = counters.recent_views(db.session, founder.founder_id)
+    expressed_interest = counters.expressed_interest(
+        db.session, founder.founder_id
     )
 
-    missing_fields = []
-    if not founder.phone:
-        missing_fields.append("Phone number")
-    if not founder.sector:
-        missing_fields.append("Sector")
-    if not founder.business_model:
-        missing_fields.append("Business model")
+    return founder_dashboard_context(founder, recent_views, expressed_interest)
+
+
+def founder_dashboard_context(founder, recent_views, expressed_interest):
+    # Everything founder_home renders, from the three query results. Shared
+    # with the async dashboard in asgi.py.
 
     # ------------------------------------------------
-    # PITCH READINESS (already built)
+    # PROFILE COMPLETION + PITCH READINESS
     # ------------------------------------------------
-    pitch_score = 0
-    if founder.company_name: pitch_score += 10
-    if founder.stage: pitch_score += 15
-    if founder.sector: pitch_score += 15
-    if founder.business_model: pitch_score += 15
-    if founder.actively_raising: pitch_score += 15
-    if founder.founding_year: pitch_score += 10
-    if completion_percent >= 80: pitch_score += 20
-
-    pitch_label = (
-        "Investor-Ready" if pitch_score >= 80
-        else "Good" if pitch_score >= 50
-        else "Needs Work"
-    )
+    # Shared with matching, memoized per profile version
+    readiness = founder_readiness(founder)
+    completion_percent = readiness.completion_percent
+    missing_fields = list(readiness.missing_fields)
+    pitch_score = readiness.pitch_score
+    pitch_label = readiness.pitch_label
 
     # ------------------------------------------------
     # RAISE PROGRESS
@@ -361,30 +568,6 @@ def founder_home():
         delta = date.today() - founder.fundraising_start_date
         weeks_elapsed = delta.days // 7
 
-    # ------------------------------------------------
-    # RECENT INVESTOR ACTIVITY (LAST 7 DAYS)
-    # ------------------------------------------------
-    recent_views = db.session.execute(
-        text("""
-            SELECT COUNT(*) 
-            FROM investor_profile_views
-            WHERE founder_id = :fid
-              AND viewed_at >= NOW() - INTERVAL 7 DAY
-        """),
-        {"fid": user_id}
-    ).scalar()
-
-    expressed_interest = db.session.execute(
-    text("""
-        SELECT COUNT(*)
-        FROM matches
-        WHERE founder_id = :fid
-          AND status = 'interested'
-    """),
-    {"fid": user_id}
-).scalar()
-
-
     # Simple text-based AI alert (MVP)
     ai_alert = None
     if completion_percent < 80:
@@ -394,9 +577,9 @@ def founder_home():
     else:
         ai_alert = "Your profile is investor-ready. Start outreach."
 
-    return render_template(
-        "dashboard/founder_home.html",
-        founder=founder,
+    # Plain values only, so shared cache backends can serialize them
+    return dict(
+        founder=dict(founder._mapping),
         completion_percent=completion_percent,
         missing_fields=missing_fields,
         pitch_score=pitch_score,
@@ -410,108 +593,172 @@ def founder_home():
         ai_alert=ai_alert
     )
 
-@app.route("/founder/matches/generate")
-def generate_matches():
+
+@app.route("/founder/home")
+@replica_reads
+def founder_home():
     if session.get("role") != "founder":
         return redirect(url_for("login"))
 
     user_id = session.get("user_id")
 
-    # Founder data
-    founder = db.session.execute(
-        text("""
-            SELECT f.id, f.stage, f.sector, f.min_check_size,
-                   u.country
-            FROM founder_profiles f
-            JOIN users u ON f.user_id = u.id
-            WHERE f.user_id = :uid
-        """),
-        {"uid": user_id}
+    key = dashboard_cache_key(user_id)
+    dashboard = dashboard_cache.get(key)
+    if dashboard is None:
+        dashboard = build_founder_dashboard(user_id)
+        dashboard_cache.set(key, dashboard)
+
+    return render_template("dashboard/founder_home.html", **dashboard)
+
+def load_match_founder(user_id):
+    return db.session.execute(
+        FOUNDER_SQL, {"uid": user_id}
     ).mappings().first()
 
-    pitch_score = 70  # already computed earlier (reuse later)
 
-    # Eligible investors
-    investors = db.session.execute(
-        text("""
-            SELECT
-                ip.id,
-                ip.investment_stage,
-                ip.sector_focus,
-                ip.geography_focus,
-                ip.typical_check_min,
-                ip.typical_check_max,
-                ip.verification_status,
-                ip.activity_status
-            FROM investor_profiles ip
-            WHERE ip.activity_status = 'active'
-              AND ip.verification_status != 'rejected'
-        """)
-    ).mappings().all()
-
-    for investor in investors:
-        score, reason = calculate_match_score(founder, investor, pitch_score)
-
-        if score < 40:
-            continue  # not worth saving
-
-        db.session.execute(
-            text("""
-                INSERT INTO matches
-                (founder_id, investor_id, match_score, status, ai_reason)
-                VALUES
-                (:fid, :iid, :score, 'new', :reason)
-                ON DUPLICATE KEY UPDATE
-                    match_score = :score,
-                    ai_reason = :reason,
-                    updated_at = NOW()
-            """),
-            {
-                "fid": founder["id"],
-                "iid": investor["id"],
-                "score": score,
-                "reason": reason
-            }
-        )
+def founder_pitch_score(founder):
+    return match_pitch_score(
+        founder, latest_deck_scores(db.session, founder["id"])
+    )
+
+
+def generate_founder_matches(user_id):
+    # Founder data
+    founder = load_match_founder(user_id)
+    if founder is None:
+        return
+    founder = founder_focus(db.session, [founder])[0]
+
+    pitch_score = founder_pitch_score(founder)
+
+    # Only investors that can clear the threshold, scored in one pass
+    investors = investor_index.frame_for(db.session, founder, pitch_score)
+    rows = investors.match_rows(founder, pitch_score, scoring_model)
+
+    upsert_matches(db.session, rows)
 
     db.session.commit()
+
+    # Investor feeds rank founders from this index
+    founder_index.update(founder, pitch_score)
+
+
+def rematch_investor(investor_id):
+    # One investor against every founder, instead of a full regeneration
+    investor = investor_index.refresh(db.session, investor_id)
+    if investor is None:
+        return
+
+    founders = founder_focus(
+        db.session, db.session.execute(FOUNDERS_SQL).mappings().all()
+    )
+    deck_scores = latest_deck_scores(db.session)
+    rows = investor_match_rows(
+        investor,
+        founders,
+        lambda f: match_pitch_score(f, deck_scores),
+        scoring_model
+    )
+
+    upsert_matches(db.session, rows)
+
+    db.session.commit()
+
+
+# Job entry points run on pool threads, outside any request
+def run_match_generation(user_id):
+    with app.app_context():
+        generate_founder_matches(user_id)
+
+
+def run_investor_rematch(investor_id):
+    with app.app_context():
+        rematch_investor(investor_id)
+
+
+@app.route("/founder/matches/generate")
+def generate_matches():
+    if session.get("role") != "founder":
+        return redirect(url_for("login"))
+
+    user_id = session.get("user_id")
+
+    # Double-clicks while a run is queued reuse the same job; one that
+    # lands mid-run just makes it run once more
+    match_jobs.submit(match_job_key(user_id), run_match_generation, user_id)
+    mark_primary_sticky()
+
     return redirect(url_for("founder_matches"))
+def match_listing_filters():
+    # ?status=&min_score=&after=<cursor>; bad values fall back to defaults
+    status = request.args.get("status")
+    return {
+        "status": status if status in MATCH_STATUSES else None,
+        "min_score": request.args.get("min_score", 0, type=int),
+        "after": decode_cursor(request.args.get("after")),
+    }
+
+
 @app.route("/founder/matches")
+@replica_reads
 def founder_matches():
     if session.get("role") != "founder":
         return redirect(url_for("login"))
 
     user_id = session.get("user_id")
 
-    matches = db.session.execute(
-        text("""
-            SELECT
-                m.id AS match_id,
-                m.match_score,
-                m.status,
-                m.ai_reason,
-                u.full_name AS investor_name,
-                ip.fund_name,
-                ip.investment_stage,
-                ip.sector_focus,
-                ip.verification_status
-            FROM matches m
-            JOIN investor_profiles ip ON m.investor_id = ip.id
-            JOIN users u ON ip.user_id = u.id
-            WHERE m.founder_id = (
-                SELECT id FROM founder_profiles WHERE user_id = :uid
-            )
-              AND m.status != 'declined'
-            ORDER BY m.match_score DESC
-            LIMIT 10
-        """),
-        {"uid": user_id}
-    ).fetchall()
+    filters = match_listing_filters()
+    matches, next_cursor = list_matches(
+        db.session,
+        current_profile_id(),
+        limit=app.config["MATCHES_PAGE_SIZE"],
+        **filters
+    )
 
     return render_template(
         "dashboard/founder_matches.html",
-        matches=matches
+        matches=matches,
+        next_cursor=next_cursor,
+        status=filters["status"],
+        min_score=filters["min_score"],
+        match_job=match_jobs.status(match_job_key(user_id))
     )
+
+
+@app.route("/api/founder/matches")
+@replica_reads
+def founder_matches_api():
+    if session.get("role") != "founder":
+        return jsonify(error="unauthorized"), 401
+
+    matches, next_cursor = list_matches(
+        db.session,
+        current_profile_id(),
+        limit=app.config["MATCHES_PAGE_SIZE"],
+        **match_listing_filters()
+    )
+
+    return jsonify(
+        matches=[dict(m._mapping) for m in matches],
+        next_cursor=next_cursor
+    )
+
+
+MATCH_STATUS_SQL = "SELECT status FROM matches WHERE id = :mid AND founder_id = :pid"
+
+# Compare-and-set: only the request that actually moves the row from
+# :old to :status gets rowcount 1 and may adjust the rollup
+SET_MATCH_STATUS_SQL = text("""
+    UPDATE matches
+    SET status = :status,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = :mid
+      AND founder_id = :pid
+      AND status = :old
+      AND status <> :status
+""")
+
+
 @app.route("/match/<int:match_id>/<action>")
 def update_match_status(match_id, action):
     if session.get("role") != "founder":
@@ -520,43 +767,59 @@ def update_match_status(match_id, action):
     if action not in ["interested", "saved", "declined"]:
         return redirect(url_for("founder_matches"))
 
-    db.session.execute(
-        text("""
-            UPDATE matches
-            SET status = :status,
-                updated_at = NOW()
-            WHERE id = :mid
-        """),
-        {"status": action, "mid": match_id}
-    )
+    # Scoped to the signed-in founder, so nobody can move (and recount)
+    # another founder's matches. FOR UPDATE holds the row until commit;
+    # SQLite has no row locks but serializes writers, and the
+    # compare-and-set below covers it.
+    founder_id = current_profile_id()
+    lock = "" if db.session.get_bind().dialect.name == "sqlite" else " FOR UPDATE"
+    old_status = db.session.execute(
+        text(MATCH_STATUS_SQL + lock), {"mid": match_id, "pid": founder_id}
+    ).scalar()
+
+    if old_status is None or old_status == action:
+        db.session.rollback()
+        return redirect(url_for("founder_matches"))
+
+    updated = db.session.execute(SET_MATCH_STATUS_SQL, {
+        "status": action, "old": old_status, "mid": match_id, "pid": founder_id
+    }).rowcount
+
+    # Keep the dashboard rollup in the same transaction
+    if updated == 1:
+        counters.match_status_changed(db.session, founder_id, old_status, action)
 
     db.session.commit()
+    mark_primary_sticky()
+    invalidate_founder_dashboard(session.get("user_id"))
     return redirect(url_for("founder_matches"))
 
 
 @app.route("/founder/pitch")
+@replica_reads
 def founder_pitch():
     if session.get("role") != "founder":
         return redirect(url_for("login"))
 
-    user_id = session.get("user_id")
-
     deck = db.session.execute(
         text("""
             SELECT *
             FROM pitch_decks
-            WHERE founder_id = (
-                SELECT id FROM founder_profiles WHERE user_id = :uid
-            )
+            WHERE founder_id = :fid
             ORDER BY created_at DESC
             LIMIT 1
         """),
-        {"uid": user_id}
+        {"fid": current_profile_id()}
     ).fetchone()
 
+    analysis = None
+    if deck and deck.content_hash:
+        analysis = cached_analysis(db.session, deck.content_hash)
+
     return render_template(
         "dashboard/founder_pitch.html",
-        deck=deck
+        deck=deck,
+        analysis=analysis
     )
 
 @app.route("/founder/pitch/upload", methods=["POST"])
@@ -572,48 +835,230 @@ def upload_pitch():
 
     user_id = session.get("user_id")
 
+    # Already on disk and hashed by UploadRequest while the body was
+    # parsed; a file that isn't kept below is deleted when the request ends
+    upload = file.stream
+    content_hash = upload.hexdigest()
+
+    founder_id = current_profile_id()
+
+    # ---------- DUPLICATE CHECK ----------
+    duplicate = find_duplicate_deck(db.session, founder_id, content_hash)
+    # Uploading the same file again retries its scoring when it failed,
+    # or is still pending with no job left to finish it (the process that
+    # held the job died; the in-memory job store goes with it)
+    retry = duplicate is not None and duplicate.scoring_status == SCORING_FAILED
+    if duplicate is not None and duplicate.scoring_status == SCORING_PENDING:
+        job = pitch_jobs.status(pitch_job_key(duplicate.id))
+        retry = job is None or job["status"] not in ACTIVE_STATUSES
+    if retry:
+        set_deck_scoring_pending(db.session, duplicate.id)
+        db.session.commit()
+        mark_primary_sticky()
+        submit_pitch_scoring(
+            duplicate.id,
+            os.path.join(UPLOAD_FOLDER, os.path.basename(duplicate.file_url)),
+            content_hash, user_id
+        )
+        flash("Scoring this pitch deck again.")
+        return redirect(url_for("founder_pitch"))
+
+    if duplicate:
+        flash("This pitch deck is already uploaded.")
+        return redirect(url_for("founder_pitch"))
+
     # ---------- SAFE FILENAME ----------
-    filename = f"pitch_{user_id}_{int(time.time())}.pdf"
+    filename = f"pitch_{user_id}_{int(time.time())}_{content_hash[:12]}.pdf"
 
     # ---------- FILESYSTEM PATH ----------
     file_path = os.path.join(UPLOAD_FOLDER, filename)
-    file.save(file_path)
+    upload.keep(file_path)
 
     # ---------- PUBLIC URL ----------
     file_url = f"/static/uploads/{filename}"
 
-    founder_id = db.session.execute(
-        text("SELECT id FROM founder_profiles WHERE user_id = :uid"),
-        {"uid": user_id}
-    ).scalar()
-
-    pitch_score = 70  # temporary
-
-    db.session.execute(
+    # Score stays empty until the background scorer fills it in
+    deck = db.session.execute(
         text("""
-            INSERT INTO pitch_decks (founder_id, file_url, deck_score)
-            VALUES (:fid, :file_url, :score)
+            INSERT INTO pitch_decks
+            (founder_id, file_url, content_hash, deck_score)
+            VALUES (:fid, :file_url, :hash, NULL)
         """),
         {
             "fid": founder_id,
             "file_url": file_url,
-            "score": pitch_score
+            "hash": content_hash
         }
     )
 
     db.session.commit()
+    mark_primary_sticky()
+    invalidate_founder_dashboard(user_id)
+
+    submit_pitch_scoring(deck.lastrowid, file_path, content_hash, user_id)
+
     flash("Pitch deck uploaded successfully.")
     return redirect(url_for("founder_pitch"))
 
+
+def pitch_deck_too_large_message():
+    limit_mb = app.config["MAX_PITCH_DECK_BYTES"] // (1024 * 1024)
+    return f"Pitch decks must be {limit_mb} MB or smaller."
+
+
+@app.errorhandler(413)
+def request_too_large(e):
+    # Body rejected by MAX_CONTENT_LENGTH, or a file over
+    # MAX_PITCH_DECK_BYTES while it was being parsed
+    flash(pitch_deck_too_large_message())
+    return redirect(url_for("founder_pitch"))
+
+
+def submit_pitch_scoring(deck_id, file_path, content_hash, user_id):
+    pitch_jobs.submit(
+        pitch_job_key(deck_id),
+        run_pitch_scoring,
+        deck_id, file_path, content_hash, user_id
+    )
+
+
+def run_pitch_scoring(deck_id, file_path, content_hash, user_id):
+    with app.app_context():
+        try:
+            analysis = analysis_for(db.session, content_hash, file_path)
+            set_deck_score(db.session, deck_id, analysis["deck_score"])
+            db.session.commit()
+        except Exception:
+            # Shown on the Pitch Hub; uploading the same file retries
+            db.session.rollback()
+            set_deck_scoring_failed(db.session, deck_id)
+            db.session.commit()
+            raise
+
+    # Match scores include the deck score, so rescore this founder
+    match_jobs.submit(match_job_key(user_id), run_match_generation, user_id)
+
 # -------------------------------------------------
-# INVESTOR DASHBOARD (PLACEHOLDER)
+# INVESTOR DASHBOARD (RANKED FOUNDER FEED)
 # -------------------------------------------------
+def build_investor_feed(investor):
+    # Top INVESTOR_FEED_SIZE founders by the same score founders see,
+    # as plain values so shared cache backends can serialize them
+    ranked = founder_index.top_matches(
+        db.session, investor, app.config["INVESTOR_FEED_SIZE"]
+    )
+    return [
+        {
+            "founder_id": founder["id"],
+            "company_name": founder["company_name"],
+            "full_name": founder["full_name"],
+            "stage": founder["stage"],
+            "sector": founder["sector"],
+            "country": founder["country"],
+            "match_score": score,
+            "reason": reason
+        }
+        for score, reason, founder in ranked
+    ]
+
+
 @app.route("/investor/home")
+@replica_reads
 def investor_home():
     if session.get("role") != "investor":
         return redirect(url_for("login"))
 
-    return "Investor Dashboard (Coming Soon)"
+    investor_id = current_profile_id()
+
+    key = investor_feed_cache_key(investor_id)
+    feed = investor_feed_cache.get(key)
+    if feed is None:
+        investor = load_feed_investor(db.session, investor_id)
+        if investor is None:
+            return redirect(url_for("login"))
+        feed = build_investor_feed(investor)
+        investor_feed_cache.set(key, feed)
+
+    page_size = app.config["INVESTOR_FEED_PAGE_SIZE"]
+    page = max(request.args.get("page", 1, type=int), 1)
+    start = (page - 1) * page_size
+
+    return render_template(
+        "dashboard/investor_home.html",
+        founders=feed[start:start + page_size],
+        page=page,
+        has_next=start + page_size < len(feed),
+        total=len(feed)
+    )
+
+
+@app.route("/investor/founders/<int:founder_id>/view", methods=["POST"])
+def record_founder_view(founder_id):
+    if session.get("role") != "investor":
+        return redirect(url_for("login"))
+
+    investor_id = current_profile_id()
+    if investor_id is None:
+        abort(403)
+
+    # The founder id comes from the URL; check it here, since an unknown
+    # one would only fail later, inside the flusher's batch insert
+    exists = db.session.execute(
+        text("SELECT 1 FROM founder_profiles WHERE id = :fid"), {"fid": founder_id}
+    ).scalar()
+    if not exists:
+        abort(404)
+
+    # Buffered; written in bulk by the flusher thread
+    if not view_events.record(founder_id, investor_id):
+        return "", 503
+
+    return "", 202
+
+# -------------------------------------------------
+# INTERNAL ENDPOINTS
+# -------------------------------------------------
+def internal_request_allowed():
+    # A forwarded request with no trusted proxies configured came through
+    # a proxy we can't see past: its remote_addr is the proxy's (often
+    # 127.0.0.1), not the client's
+    if not app.config["TRUSTED_PROXY_HOPS"] and "X-Forwarded-For" in request.headers:
+        return False
+    if request.remote_addr not in app.config["INTERNAL_ALLOWED_IPS"]:
+        return False
+
+    token = app.config["INTERNAL_API_TOKEN"]
+    if token:
+        sent = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        return hmac.compare_digest(sent.encode(), token.encode())
+    return True
+
+
+def internal_only(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not internal_request_allowed():
+            abort(404)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@app.route("/metrics")
+@internal_only
+def metrics():
+    return app.response_class(
+        instrumentation.metrics.render(),
+        mimetype="text/plain; version=0.0.4"
+    )
+
+
+@app.route("/internal/db/pool")
+@internal_only
+def db_pool_stats():
+    return jsonify({
+        bind or "primary": pool_status(engine)
+        for bind, engine in db.engines.items()
+    })
 
 # -------------------------------------------------
 # LOGOUT
@@ -623,6 +1068,170 @@ def logout():
     session.clear()
     return redirect(url_for("entry"))
 
+# -------------------------------------------------
+# CLI: BULK IMPORT / EXPORT
+# -------------------------------------------------
+# flask --app app import-users investor partners.csv --errors rejected.jsonl
+# flask --app app export-users founder founders.jsonl
+@app.cli.command("import-users")
+@click.argument("role", type=click.Choice(["founder", "investor"]))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "fmt", type=click.Choice(bulk_io.FORMATS),
+              help="Defaults to the file extension.")
+@click.option("--batch-size", default=1000, show_default=True)
+@click.option("--hash-workers", default=os.cpu_count() or 1, show_default=True,
+              help="Processes used to hash imported passwords.")
+@click.option("--errors", "errors_path", type=click.Path(dir_okay=False),
+              help="Write rejected rows here as JSONL instead of stderr.")
+def import_users_command(role, path, fmt, batch_size, hash_workers, errors_path):
+    """Create users and profiles from a CSV or JSONL file."""
+    fmt = bulk_io.detect_format(path, fmt)
+    hasher = PasswordHasher(
+        app.config["PASSWORD_HASH_METHOD"], max_workers=hash_workers
+    )
+    errors_out = open(errors_path, "w") if errors_path else sys.stderr
+
+    def report_error(line_no, message):
+        errors_out.write(json.dumps({"line": line_no, "error": message}) + "\n")
+
+    started = time.perf_counter()
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            report = bulk_io.import_users(
+                db.session, role, bulk_io.read_records(f, fmt), hasher,
+                batch_size=batch_size, on_error=report_error
+            )
+    finally:
+        if errors_path:
+            errors_out.close()
+
+    click.echo(
+        f"{report.read} rows read, {report.imported} imported, "
+        f"{report.failed} rejected in {report.batches} batches "
+        f"({time.perf_counter() - started:.1f}s)"
+    )
+
+
+@app.cli.command("export-users")
+@click.argument("role", type=click.Choice(["founder", "investor"]))
+@click.argument("path", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option("--format", "fmt", type=click.Choice(bulk_io.FORMATS),
+              help="Defaults to the file extension.")
+@click.option("--chunk-size", default=1000, show_default=True)
+def export_users_command(role, path, fmt, chunk_size):
+    """Write every founder or investor to a CSV or JSONL file ("-" for stdout)."""
+    fmt = bulk_io.detect_format(path, fmt)
+
+    if path == "-":
+        written = bulk_io.export_users(db.session, role, sys.stdout, fmt, chunk_size)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as out:
+            written = bulk_io.export_users(db.session, role, out, fmt, chunk_size)
+
+    click.echo(f"{written} {role}s exported", err=True)
+
+@app.cli.command("backfill-investor-focus")
+@click.option("--batch-size", default=1000, show_default=True)
+@click.option("--all", "rebuild_all", is_flag=True,
+              help="Re-tokenize every investor, not just rows never tokenized.")
+def backfill_investor_focus_command(batch_size, rebuild_all):
+    """Fill the investor focus token columns (after migration 005)."""
+    where = "" if rebuild_all else "AND stage_token_ids IS NULL"
+    last_id = 0
+    done = 0
+    while True:
+        ids = db.session.execute(
+            text(f"""
+                SELECT id FROM investor_profiles
+                WHERE id > :last_id {where}
+                ORDER BY id
+                LIMIT :limit
+            """),
+            {"last_id": last_id, "limit": batch_size}
+        ).scalars().all()
+        if not ids:
+            break
+
+        done += store_investor_focus(db.session, ids)
+        db.session.commit()
+        last_id = ids[-1]
+        click.echo(f"{done} investors tokenized", err=True)
+
+    click.echo(f"done: {done} investors tokenized")
+
+
+@app.cli.command("rematch-all")
+@click.option("--workers", default=4, show_default=True,
+              help="Scoring processes; 0 scores in this process.")
+@click.option("--shard-size", default=500, show_default=True,
+              help="Founders per shard (and per checkpoint step).")
+@click.option("--batch-size", default=5000, show_default=True,
+              help="Match rows per upsert.")
+@click.option("--checkpoint", "checkpoint_path",
+              default=lambda: app.config["REMATCH_CHECKPOINT_PATH"],
+              show_default="REMATCH_CHECKPOINT_PATH")
+@click.option("--restart", is_flag=True,
+              help="Ignore an unfinished run's checkpoint and start over.")
+def rematch_all_command(workers, shard_size, batch_size, checkpoint_path, restart):
+    """Rescore every founder / investor pair, e.g. nightly or after a weight change."""
+    def report(state, run_pairs, elapsed):
+        rate = run_pairs / elapsed if elapsed else 0
+        click.echo(
+            f"shard {len(state['done'])}/{len(state['shards'])}  "
+            f"{state['founders']} founders  {state['pairs']} pairs  "
+            f"{state['rows']} matches  {rate:,.0f} pairs/s",
+            err=True
+        )
+
+    if not restart and os.path.exists(checkpoint_path):
+        click.echo(f"resuming from {checkpoint_path}", err=True)
+
+    try:
+        result = rematch.rematch_all(
+            app.config["SQLALCHEMY_DATABASE_URI"],
+            scoring_model,
+            checkpoint_path,
+            workers=workers,
+            shard_size=shard_size,
+            batch_size=batch_size,
+            restart=restart,
+            on_progress=report
+        )
+    except rematch.CheckpointMismatch as e:
+        raise click.ClickException(f"{e}; rerun with --restart")
+
+    rate = result["run_pairs"] / result["seconds"] if result["seconds"] else 0
+    click.echo(
+        f"done: {result['founders']} founders, {result['pairs']} pairs scored, "
+        f"{result['rows']} matches written; this run {result['run_pairs']} pairs "
+        f"in {result['seconds']:.1f}s ({rate:,.0f} pairs/s)"
+    )
+
+
+@app.cli.command("compile-templates")
+def compile_templates_command():
+    """Compile every template into the bytecode cache, e.g. before starting workers."""
+    started = time.perf_counter()
+    count = compile_templates(app)
+    click.echo(f"done: {count} templates compiled in {time.perf_counter() - started:.2f}s")
+
+
+@app.cli.command("rescore-matches")
+@click.option("--batch-size", default=5000, show_default=True)
+def rescore_matches_command(batch_size):
+    """Rescore only the matches scored by another scoring model version."""
+    def report(rescored, elapsed):
+        rate = rescored / elapsed if elapsed else 0
+        click.echo(f"{rescored} matches rescored  {rate:,.0f} rows/s", err=True)
+
+    rescored, seconds = rematch.rescore_stale(
+        db.session, scoring_model, batch_size=batch_size, on_progress=report
+    )
+    click.echo(
+        f"done: {rescored} matches rescored to model v{scoring_model.version} "
+        f"in {seconds:.1f}s"
+    )
+
 # -------------------------------------------------
 # RUN APP
 # -------------------------------------------------
@@ -0,0 +1,222 @@
+"""
+Optional ASGI entry point:
+
+    uvicorn asgi:application --workers 4
+
+GET /founder/home is served natively async: its three queries (profile,
+recent views, interest count; the profile id comes from the session) run
+concurrently on an async driver, and the worker keeps serving other requests while they wait.
+Every other route goes to the regular Flask app through asgiref's WSGI
+adapter. WSGI deployments (gunicorn app:app) are unaffected.
+
+Needs asgiref, greenlet and the async driver for the database: aiomysql
+for MySQL, aiosqlite for SQLite.
+"""
+import asyncio
+import io
+import random
+import sys
+import time
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import redirect, render_template, session, url_for
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import counters
+from sessions import PRELOADED_SESSION
+from app import (
+    FOUNDER_DASHBOARD_SQL,
+    app,
+    current_profile_id,
+    dashboard_cache,
+    dashboard_cache_key,
+    founder_dashboard_context
+)
+
+# Sync driver in SQLALCHEMY_DATABASE_URI -> its async counterpart
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def async_uri(uri):
+    scheme, rest = uri.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+def make_async_engine(uri, config):
+    options = {}
+    if not uri.startswith("sqlite"):
+        options.update(
+            pool_size=config["ASYNC_DB_POOL_SIZE"],
+            max_overflow=config["ASYNC_DB_MAX_OVERFLOW"],
+            pool_timeout=config["DB_POOL_TIMEOUT"],
+            pool_recycle=config["DB_POOL_RECYCLE"],
+            pool_pre_ping=config["DB_POOL_PRE_PING"],
+        )
+    return create_async_engine(async_uri(uri), **options)
+
+
+# -------------------------------------------------
+# FOUNDER DASHBOARD (ASYNC)
+# -------------------------------------------------
+async def _fetch(engine, statement, params, scalar=False):
+    # One connection per query: a connection runs one statement at a time
+    async with engine.connect() as conn:
+        result = await conn.execute(statement, params)
+        return result.scalar() if scalar else result.fetchone()
+
+
+async def build_founder_dashboard_async(engine, user_id, founder_id):
+    founder, recent_views, expressed_interest = await asyncio.gather(
+        _fetch(engine, FOUNDER_DASHBOARD_SQL, {"uid": user_id}),
+        _fetch(
+            engine, counters.RECENT_VIEWS_SQL,
+            {"fid": founder_id, "since": counters.recent_view_since()}, scalar=True
+        ),
+        _fetch(engine, counters.EXPRESSED_INTEREST_SQL, {"fid": founder_id}, scalar=True),
+    )
+    return founder_dashboard_context(
+        founder, recent_views, expressed_interest or 0
+    )
+
+
+# -------------------------------------------------
+# ASGI APP
+# -------------------------------------------------
+def wsgi_environ(scope):
+    """Just enough of a WSGI environ for Flask's request context."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        key = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if key not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            key = f"HTTP_{key}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class DashboardASGI:
+    """Async founder dashboard in front of the WSGI Flask app."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+
+        config = flask_app.config
+        self.primary = make_async_engine(config["SQLALCHEMY_DATABASE_URI"], config)
+        self.replicas = [
+            make_async_engine(uri, config)
+            for uri in config["SQLALCHEMY_REPLICA_URIS"]
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+
+        if (
+            scope["type"] == "http"
+            and scope["path"] == "/founder/home"
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            return await self.founder_home(scope, send)
+
+        return await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for engine in [self.primary] + self.replicas:
+                    await engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def read_engine(self):
+        # Same policy as @replica_reads, including read-your-writes
+        if self.replicas and time.time() >= session.get("primary_until", 0):
+            return random.choice(self.replicas)
+        return self.primary
+
+    async def dashboard_view(self):
+        if session.get("role") != "founder":
+            return redirect(url_for("login"))
+
+        user_id = session.get("user_id")
+
+        # Cache backends (Redis), the session store and the profile id
+        # fallback are blocking; they run in threads so the event loop
+        # keeps serving other requests. to_thread copies the context
+        # variables, so session and db.session work there as usual.
+        key = dashboard_cache_key(user_id)
+        dashboard = await asyncio.to_thread(dashboard_cache.get, key)
+        if dashboard is None:
+            profile_id = session.get("profile_id")
+            if profile_id is None:
+                profile_id = await asyncio.to_thread(current_profile_id)
+            dashboard = await build_founder_dashboard_async(
+                self.read_engine(), user_id, profile_id
+            )
+            await asyncio.to_thread(dashboard_cache.set, key, dashboard)
+
+        return render_template("dashboard/founder_home.html", **dashboard)
+
+    async def founder_home(self, scope, send):
+        flask_app = self.flask_app
+
+        # A real Flask request context, so session, url_for, templates and
+        # the before/after_request hooks behave as in the WSGI view. The
+        # session is loaded before the push and saved (in process_response)
+        # in a thread, since the store may be a SQLite file.
+        environ = wsgi_environ(scope)
+        interface = flask_app.session_interface
+        environ[PRELOADED_SESSION] = await asyncio.to_thread(
+            interface.open_session, flask_app, flask_app.request_class(environ)
+        )
+
+        with flask_app.request_context(environ):
+            try:
+                response = flask_app.preprocess_request()
+                if response is None:
+                    response = await self.dashboard_view()
+                response = flask_app.make_response(response)
+                response = await asyncio.to_thread(flask_app.process_response, response)
+            except Exception as e:
+                response = flask_app.make_response(flask_app.handle_exception(e))
+
+        body = b"" if scope["method"] == "HEAD" else response.get_data()
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [
+                (k.lower().encode("latin-1"), v.encode("latin-1"))
+                for k, v in response.headers.items()
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+application = DashboardASGI(app)
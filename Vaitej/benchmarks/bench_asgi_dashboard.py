@@ -0,0 +1,215 @@
+"""
+founder_home requests per second, WSGI vs ASGI mode, under simulated DB
+latency.
+
+    python benchmarks/bench_asgi_dashboard.py --latency-ms 20 --concurrency 50
+
+Each mode runs as one worker in its own process, against the same seeded
+SQLite stand-in (see seed.py), with the dashboard cache off so every
+request hits the database:
+
+  wsgi  app:app on a single-threaded server, like one gunicorn sync worker
+  asgi  asgi:application on uvicorn, one process
+
+Every SELECT sleeps --latency-ms on the connection's own thread, the way a
+network round-trip to MySQL would block it, without blocking the event loop
+of the async worker. Needs uvicorn, httpx, asgiref, greenlet and aiosqlite.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, HERE)
+
+from stats import summarize  # noqa: E402
+
+
+# -------------------------------------------------
+# SERVER SIDE
+# -------------------------------------------------
+def add_latency(engine, latency_s):
+    """Sleep latency_s before every SELECT run on this engine's connections."""
+    from sqlalchemy import event
+
+    def delay(statement):
+        if statement.lstrip()[:6].upper() == "SELECT":
+            time.sleep(latency_s)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, record):
+        raw = dbapi_connection
+        # aiosqlite: adapter -> aiosqlite.Connection -> sqlite3.Connection
+        if hasattr(raw, "driver_connection"):
+            raw = raw.driver_connection._conn
+        raw.set_trace_callback(delay)
+
+
+def serve(mode, port, latency_ms):
+    # Runs in the child process; config is read at import time
+    latency_s = latency_ms / 1000
+
+    if mode == "wsgi":
+        from werkzeug.serving import make_server
+
+        import app as vaitej
+
+        with vaitej.app.app_context():
+            add_latency(vaitej.db.engine, latency_s)
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        make_server("127.0.0.1", port, vaitej.app, threaded=False).serve_forever()
+    else:
+        import uvicorn
+
+        import asgi
+
+        add_latency(asgi.application.primary.sync_engine, latency_s)
+        uvicorn.run(asgi.application, host="127.0.0.1", port=port, log_level="warning")
+
+
+# -------------------------------------------------
+# CLIENT SIDE
+# -------------------------------------------------
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def founder_cookie(user_id):
+    import app as vaitej
+
+    # Written to the SQLite session store the server process shares;
+    # seed.py gives each founder profile its user's id
+    sid = vaitej.app.session_interface.create(
+        vaitej.app, {"role": "founder", "user_id": user_id, "profile_id": user_id}
+    )
+    return {vaitej.app.config["SESSION_COOKIE_NAME"]: sid}
+
+
+async def drive(port, concurrency, duration, n_founders):
+    import httpx
+
+    cookies = [founder_cookie(uid) for uid in range(1, n_founders + 1)]
+    samples = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client(worker):
+        nonlocal errors
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60) as http:
+            i = worker
+            while time.monotonic() < deadline:
+                http.cookies.update(cookies[i % len(cookies)])
+                start = time.perf_counter()
+                response = await http.get("/founder/home")
+                samples.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+                i += concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result = summarize(samples)
+    # Wall-clock rate with all clients in flight, not 1 / mean latency
+    result["throughput_per_s"] = round(len(samples) / elapsed, 2)
+    result["errors"] = errors
+    return result
+
+
+def run_mode(mode, args, env):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", mode, "--port", str(port),
+         "--latency-ms", str(args.latency_ms)],
+        env=env, cwd=APP_DIR
+    )
+    try:
+        wait_for_port(port)
+        asyncio.run(drive(port, 1, 1, args.founders))  # warm up
+        return asyncio.run(drive(port, args.concurrency, args.duration, args.founders))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare WSGI and ASGI dashboard throughput")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--modes", nargs="+", default=["wsgi", "asgi"])
+    parser.add_argument("--output", help="JSON results path")
+    parser.add_argument("--serve", choices=["wsgi", "asgi"], help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.latency_ms)
+        return
+
+    db_path = os.path.join(tempfile.gettempdir(), f"vaitej-asgi-bench-{os.getpid()}.db")
+    sessions_path = f"{db_path}.sessions"
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{db_path}",
+        SESSION_STORE_PATH=sessions_path,
+        DASHBOARD_CACHE_TTL="0",
+        PYTHONPATH=APP_DIR
+    )
+    env = dict(os.environ)
+
+    from seed import seed
+    counts = seed(db_path, args.scale)
+    args.founders = counts["founders"]
+
+    report = {
+        "latency_ms": args.latency_ms,
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "seed": counts,
+        "modes": {},
+    }
+    try:
+        for mode in args.modes:
+            print(f"{mode} ...", flush=True)
+            report["modes"][mode] = run_mode(mode, args, env)
+    finally:
+        for path in (db_path, sessions_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    for mode, s in report["modes"].items():
+        print(
+            f"{mode:5s} {s['throughput_per_s']:>9} req/s  p50 {s['p50_ms']:9.2f} ms  "
+            f"p95 {s['p95_ms']:9.2f} ms  p99 {s['p99_ms']:9.2f} ms  errors {s['errors']}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
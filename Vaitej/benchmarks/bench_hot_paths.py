@@ -0,0 +1,274 @@
+"""
+Latency and throughput of the hot paths at growing data sizes.
+
+    python benchmarks/bench_hot_paths.py --scales 1000 10000 100000
+
+Each scale reseeds a SQLite stand-in (see seed.py) and drives the app
+through the Flask test client. Results go to a JSON file named after the
+scale(s) and current commit, so two commits can be diffed directly. By
+default that is benchmarks/results/ (ignored by git); --output overrides.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(HERE)
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, HERE)
+
+# The app reads its database URL at import time
+BENCH_DB = os.path.join(tempfile.gettempdir(), f"vaitej-bench-{os.getpid()}.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{BENCH_DB}"
+
+import app as vaitej  # noqa: E402
+from matching import ELIGIBLE_INVESTORS_SQL, InvestorFrame, calculate_match_score  # noqa: E402
+from seed import seed  # noqa: E402
+from stats import summarize  # noqa: E402
+
+app = vaitej.app
+db = vaitej.db
+
+
+# -------------------------------------------------
+# MEASUREMENT
+# -------------------------------------------------
+def measure(fn, iterations, warmup=3):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def reset_app_state():
+    # Fresh database file: drop pooled connections and every in-process cache
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    vaitej.investor_index._built_at = None
+    vaitej.founder_index._built_at = None
+    vaitej.dashboard_cache.clear()
+    vaitej.investor_feed_cache.clear()
+
+    # Every benchmark registration comes from the test client's one address
+    vaitej.register_ip_limiter.limit = 0
+
+
+# What login stores. seed.py numbers founder users and profiles alike,
+# and investor profiles from 1 right after the founder users.
+def login_as_founder(client, user_id):
+    with client.session_transaction() as s:
+        s.clear()
+        s["role"] = "founder"
+        s["user_id"] = user_id
+        s["profile_id"] = user_id
+
+
+def login_as_investor(client, user_id, n_founders):
+    with client.session_transaction() as s:
+        s.clear()
+        s["role"] = "investor"
+        s["user_id"] = user_id
+        s["profile_id"] = user_id - n_founders
+
+
+# -------------------------------------------------
+# HOT PATHS
+# -------------------------------------------------
+def bench_calculate_match_score(counts, rng, iterations):
+    with app.app_context():
+        investors = db.session.execute(ELIGIBLE_INVESTORS_SQL).mappings().all()
+        founders = vaitej.founder_focus(db.session, [
+            vaitej.load_match_founder(uid)
+            for uid in rng.sample(range(1, counts["founders"] + 1), 10)
+        ])
+
+    pairs = [(rng.choice(founders), rng.choice(investors)) for _ in range(iterations)]
+    pairs_iter = iter(pairs * 2)
+
+    scalar = measure(
+        lambda: calculate_match_score(*next(pairs_iter), 70, vaitej.scoring_model),
+        iterations, warmup=0
+    )
+
+    frame = InvestorFrame(investors)
+    founder_iter = iter(founders * (iterations + 10))
+    batch = measure(
+        lambda: frame.match_rows(next(founder_iter), 70, vaitej.scoring_model),
+        min(iterations, 200)
+    )
+    batch["investors_per_call"] = len(frame)
+
+    return {"scalar": scalar, "batch_all_investors": batch}
+
+
+def bench_generate_matches(client, counts, rng, iterations):
+    def run():
+        user_id = rng.randint(1, counts["founders"])
+        login_as_founder(client, user_id)
+        client.get("/founder/matches/generate")
+
+        # End to end: the request only enqueues, so wait for the job
+        key = vaitej.match_job_key(user_id)
+        while vaitej.match_jobs.status(key)["status"] in ("queued", "running"):
+            time.sleep(0.0005)
+
+    return measure(run, iterations)
+
+
+def bench_founder_home(client, counts, rng, iterations):
+    user_ids = [rng.randint(1, counts["founders"]) for _ in range(iterations + 3)]
+
+    def cold():
+        user_id = user_ids.pop()
+        login_as_founder(client, user_id)
+        vaitej.invalidate_founder_dashboard(user_id)
+        assert client.get("/founder/home").status_code == 200
+
+    results = {"cold_cache": measure(cold, iterations)}
+
+    login_as_founder(client, 1)
+    results["warm_cache"] = measure(lambda: client.get("/founder/home"), iterations)
+    return results
+
+
+def bench_investor_home(client, counts, rng, iterations):
+    # Investor users are seeded right after the founders
+    first = counts["founders"] + 1
+    user_ids = [
+        rng.randint(first, first + counts["investors"] - 1)
+        for _ in range(iterations + 3)
+    ]
+
+    def cold():
+        login_as_investor(client, user_ids.pop(), counts["founders"])
+        vaitej.investor_feed_cache.clear()
+        assert client.get("/investor/home").status_code == 200
+
+    results = {"cold_cache": measure(cold, iterations)}
+
+    login_as_investor(client, first, counts["founders"])
+    results["warm_cache"] = measure(
+        lambda: client.get("/investor/home?page=2"), iterations
+    )
+    return results
+
+
+def bench_register(client, rng, iterations):
+    def run():
+        n = rng.getrandbits(48)
+        client.get("/logout")
+        response = client.post("/register/investor", data={
+            "full_name": f"New Investor {n}",
+            "email": f"new{n}@bench.test",
+            "password": "bench-password",
+            "phone": "+15550000000",
+            "country": "India",
+            "fund_name": f"New Fund {n}",
+            "investment_stage": "Seed",
+            "sector_focus": "AI, SaaS",
+            "geography_focus": "India",
+            "check_size": "50000",
+            "accredited": "yes",
+        })
+        assert response.status_code == 200
+
+    return measure(run, iterations)
+
+
+def run_scale(scale, args):
+    rng = random.Random(args.seed)
+
+    seed_start = time.perf_counter()
+    counts = seed(BENCH_DB, scale, seed=args.seed)
+    seed_secs = time.perf_counter() - seed_start
+    reset_app_state()
+
+    client = app.test_client()
+    result = {
+        "seed": {**counts, "seconds": round(seed_secs, 2)},
+        "calculate_match_score": bench_calculate_match_score(counts, rng, args.iterations * 50),
+        "generate_matches": bench_generate_matches(client, counts, rng, args.iterations),
+        "founder_home": bench_founder_home(client, counts, rng, args.iterations),
+        "investor_home": bench_investor_home(client, counts, rng, args.iterations),
+        "register": bench_register(client, rng, args.register_iterations),
+    }
+
+    # Let rematch jobs queued by register finish before the next reseed
+    vaitej.match_jobs.wait_idle()
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the app's hot paths")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--register-iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "scales": {},
+    }
+
+    try:
+        for scale in args.scales:
+            print(f"scale {scale:,} ...", flush=True)
+            report["scales"][str(scale)] = run_scale(scale, args)
+    finally:
+        if os.path.exists(BENCH_DB):
+            os.remove(BENCH_DB)
+
+    output = args.output or os.path.join(
+        HERE, "results",
+        f"hot-paths-{'-'.join(map(str, args.scales))}-{commit or 'nogit'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for scale, paths in report["scales"].items():
+        print(f"\n== scale {int(scale):,} ==")
+        for name, stats in paths.items():
+            if name == "seed":
+                continue
+            for variant, s in (stats.items() if "p50_ms" not in stats else [("", stats)]):
+                label = f"{name} {variant}".strip()
+                print(
+                    f"{label:40s} p50 {s['p50_ms']:10.3f} ms  "
+                    f"p95 {s['p95_ms']:10.3f} ms  p99 {s['p99_ms']:10.3f} ms  "
+                    f"{s['throughput_per_s']:>10} /s"
+                )
+    print(f"\nresults: {output}")
+
+
+if __name__ == "__main__":
+    main()
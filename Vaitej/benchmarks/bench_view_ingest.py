@@ -0,0 +1,121 @@
+"""
+Profile-view ingestion: one INSERT + COMMIT per event vs ViewEventBuffer.
+
+    python benchmarks/bench_view_ingest.py --events 20000
+
+Runs against a throwaway SQLite file, so absolute numbers are lower
+bounds for MySQL; the ratio between the two paths is what matters.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from view_events import ViewEventBuffer, write_view_events
+
+SCHEMA = [
+    """
+    CREATE TABLE investor_profile_views (
+        id INTEGER PRIMARY KEY,
+        founder_id INT NOT NULL,
+        investor_id INT NOT NULL,
+        viewed_at TIMESTAMP NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE founder_view_counts (
+        founder_id INT NOT NULL,
+        day DATE NOT NULL,
+        views INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (founder_id, day)
+    )
+    """,
+]
+
+
+def make_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for ddl in SCHEMA:
+            conn.execute(text(ddl))
+    return engine
+
+
+def make_events(n, founders=500, investors=5000):
+    rng = random.Random(42)
+    return [
+        (rng.randint(1, founders), rng.randint(1, investors))
+        for _ in range(n)
+    ]
+
+
+def bench_single_row(engine, events):
+    start = time.perf_counter()
+    with Session(engine) as session:
+        for fid, iid in events:
+            write_view_events(session, [(fid, iid, datetime.now())])
+            session.commit()
+    return time.perf_counter() - start
+
+
+def bench_buffered(engine, events, batch_size):
+    def flush(batch):
+        with Session(engine) as session:
+            write_view_events(session, batch)
+            session.commit()
+
+    buffer = ViewEventBuffer(
+        flush,
+        batch_size=batch_size,
+        capacity=batch_size * 20,
+        enqueue_timeout=5
+    )
+
+    start = time.perf_counter()
+    for fid, iid in events:
+        if not buffer.record(fid, iid):
+            raise RuntimeError("buffer rejected an event")
+    buffer.close()
+    return time.perf_counter() - start
+
+
+def count_rows(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT COUNT(*) FROM investor_profile_views")
+        ).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = make_engine(os.path.join(tmp, "single.db"))
+        buffered = make_engine(os.path.join(tmp, "buffered.db"))
+
+        single_secs = bench_single_row(single, events)
+        buffered_secs = bench_buffered(buffered, events, args.batch_size)
+
+        assert count_rows(single) == count_rows(buffered) == len(events)
+
+    print(f"events:           {len(events)}")
+    print(f"single-row:       {len(events) / single_secs:12,.0f} events/s")
+    print(f"buffered (x{args.batch_size}): {len(events) / buffered_secs:12,.0f} events/s")
+    print(f"speedup:          {single_secs / buffered_secs:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+-- -------------------------------------------------
+-- SQLITE STAND-IN SCHEMA (benchmarks / local runs)
+-- Mirrors the MySQL tables app.py and database/migrations use.
+-- -------------------------------------------------
+
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY,
+    role TEXT NOT NULL,
+    full_name TEXT,
+    email TEXT NOT NULL UNIQUE,
+    password_hash TEXT,
+    phone TEXT,
+    country TEXT,
+    referral_source TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE founder_profiles (
+    id INTEGER PRIMARY KEY,
+    user_id INT NOT NULL,
+    company_name TEXT,
+    founding_year INT,
+    stage TEXT,
+    sector TEXT,
+    business_model TEXT,
+    actively_raising TEXT,
+    raise_target NUMERIC,
+    raise_raised NUMERIC,
+    fundraising_status TEXT DEFAULT 'not_started',
+    fundraising_start_date DATE,
+    min_check_size NUMERIC
+);
+CREATE UNIQUE INDEX idx_founder_profiles_user ON founder_profiles (user_id);
+
+CREATE TABLE investor_profiles (
+    id INTEGER PRIMARY KEY,
+    user_id INT NOT NULL,
+    fund_name TEXT,
+    investment_stage TEXT,
+    sector_focus TEXT,
+    geography_focus TEXT,
+    typical_check_min NUMERIC,
+    typical_check_max NUMERIC,
+    accredited TEXT,
+    verification_status TEXT DEFAULT 'pending',
+    activity_status TEXT DEFAULT 'active',
+    stage_token_ids TEXT,
+    sector_token_ids TEXT,
+    geography_token_ids TEXT
+);
+CREATE UNIQUE INDEX idx_investor_profiles_user ON investor_profiles (user_id);
+
+CREATE TABLE focus_tokens (
+    id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE matches (
+    id INTEGER PRIMARY KEY,
+    founder_id INT NOT NULL,
+    investor_id INT NOT NULL,
+    match_score INT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'new',
+    ai_reason TEXT,
+    model_version INT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (founder_id, investor_id)
+);
+CREATE INDEX idx_matches_founder_status_score
+    ON matches (founder_id, status, match_score, id);
+CREATE INDEX idx_matches_founder_score
+    ON matches (founder_id, match_score, id, status);
+
+CREATE TABLE investor_profile_views (
+    id INTEGER PRIMARY KEY,
+    founder_id INT NOT NULL,
+    investor_id INT NOT NULL,
+    viewed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE pitch_decks (
+    id INTEGER PRIMARY KEY,
+    founder_id INT NOT NULL,
+    file_url TEXT,
+    content_hash TEXT,
+    deck_score INT,
+    scoring_status TEXT NOT NULL DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX idx_pitch_decks_founder_hash ON pitch_decks (founder_id, content_hash);
+
+CREATE TABLE pitch_deck_analysis (
+    content_hash TEXT PRIMARY KEY,
+    page_count INT NOT NULL,
+    sections TEXT NOT NULL,
+    deck_score INT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE founder_view_counts (
+    founder_id INT NOT NULL,
+    day DATE NOT NULL,
+    views INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (founder_id, day)
+);
+
+CREATE TABLE founder_match_counts (
+    founder_id INT NOT NULL PRIMARY KEY,
+    interested INT NOT NULL DEFAULT 0
+);
@@ -0,0 +1,209 @@
+"""
+Synthetic data for the benchmarks, in a SQLite stand-in database.
+
+A scale of N seeds N investors, N // 10 founders, and 2N profile views
+and matches:
+
+    python benchmarks/seed.py --scale 10000 --db /tmp/vaitej-bench.db
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+
+from werkzeug.security import generate_password_hash
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focus import FOCUS_FIELDS, encode_ids, investor_tokens  # noqa: E402
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema_sqlite.sql")
+
+STAGES = ["Pre-Seed", "Seed", "Series A", "Series B"]
+SECTORS = ["AI", "Fintech", "HealthTech", "SaaS", "Climate", "EdTech", "Retail", "Logistics"]
+COUNTRIES = ["India", "US", "UK", "Singapore", "Germany", "Brazil"]
+BUSINESS_MODELS = ["B2B", "B2C", "Marketplace", "B2B2C"]
+MATCH_STATUSES = ["new", "new", "new", "interested", "saved", "declined"]
+
+# Every seeded user shares this password
+PASSWORD = "bench-password"
+
+BATCH = 5000
+
+
+def create_schema(conn):
+    with open(SCHEMA_PATH) as f:
+        conn.executescript(f.read())
+
+
+def _batched(conn, sql, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH:
+            conn.executemany(sql, batch)
+            batch = []
+    if batch:
+        conn.executemany(sql, batch)
+
+
+def tokenize_investors(conn):
+    # Same result as focus.store_investor_focus, without a SQLAlchemy session
+    columns = [column for _, column, _ in FOCUS_FIELDS]
+    rows = conn.execute(
+        f"SELECT id, {', '.join(columns)} FROM investor_profiles"
+    ).fetchall()
+
+    vocabulary = {}
+    updates = []
+    for row in rows:
+        per_field = [
+            encode_ids(
+                vocabulary.setdefault(token, len(vocabulary) + 1)
+                for token in investor_tokens(value)
+            )
+            for value in row[1:]
+        ]
+        updates.append((*per_field, row[0]))
+
+    conn.executemany(
+        "INSERT INTO focus_tokens (id, token) VALUES (?, ?)",
+        ((i, token) for token, i in vocabulary.items())
+    )
+    _batched(conn, f"""
+        UPDATE investor_profiles
+        SET {', '.join(f"{ids} = ?" for _, _, ids in FOCUS_FIELDS)}
+        WHERE id = ?
+    """, updates)
+
+
+def seed(path, scale, seed=42):
+    """Create a fresh database at path. Returns the seeded counts."""
+    if os.path.exists(path):
+        os.remove(path)
+
+    rng = random.Random(seed)
+    password_hash = generate_password_hash(PASSWORD)
+    n_investors = scale
+    n_founders = max(scale // 10, 10)
+    now = datetime.now()
+
+    conn = sqlite3.connect(path)
+    create_schema(conn)
+
+    # ---------- FOUNDERS ----------
+    _batched(conn, """
+        INSERT INTO users (id, role, full_name, email, password_hash, phone, country)
+        VALUES (?, 'founder', ?, ?, ?, ?, ?)
+    """, (
+        (i, f"Founder {i}", f"founder{i}@bench.test", password_hash,
+         f"+1555{i:07d}", rng.choice(COUNTRIES))
+        for i in range(1, n_founders + 1)
+    ))
+    _batched(conn, """
+        INSERT INTO founder_profiles
+        (id, user_id, company_name, founding_year, stage, sector,
+         business_model, actively_raising, raise_target, raise_raised,
+         fundraising_status, min_check_size)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 'yes', ?, ?, 'raising', ?)
+    """, (
+        (i, i, f"Startup {i}", rng.randint(2015, 2025), rng.choice(STAGES),
+         rng.choice(SECTORS), rng.choice(BUSINESS_MODELS),
+         1_000_000, rng.randint(0, 900_000), rng.choice([50_000, 100_000, 250_000, 500_000]))
+        for i in range(1, n_founders + 1)
+    ))
+
+    # ---------- INVESTORS ----------
+    first_investor_user = n_founders + 1
+    _batched(conn, """
+        INSERT INTO users (id, role, full_name, email, password_hash, phone, country)
+        VALUES (?, 'investor', ?, ?, ?, ?, ?)
+    """, (
+        (first_investor_user + i, f"Investor {i}", f"investor{i}@bench.test",
+         password_hash, f"+1666{i:07d}", rng.choice(COUNTRIES))
+        for i in range(n_investors)
+    ))
+
+    def investor_row(i):
+        check_min = rng.choice([10_000, 25_000, 100_000, 250_000])
+        return (
+            i + 1, first_investor_user + i, f"Fund {i}",
+            ", ".join(rng.sample(STAGES, rng.randint(1, 2))),
+            ", ".join(rng.sample(SECTORS, rng.randint(1, 3))),
+            ", ".join(rng.sample(COUNTRIES, rng.randint(1, 2))),
+            check_min, check_min * rng.choice([4, 10, 20]),
+            rng.choice(["verified", "verified", "pending", "rejected"]),
+            rng.choice(["active", "active", "active", "dormant"]),
+        )
+
+    _batched(conn, """
+        INSERT INTO investor_profiles
+        (id, user_id, fund_name, investment_stage, sector_focus,
+         geography_focus, typical_check_min, typical_check_max,
+         accredited, verification_status, activity_status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'yes', ?, ?)
+    """, (investor_row(i) for i in range(n_investors)))
+    tokenize_investors(conn)
+
+    # ---------- VIEWS ----------
+    n_views = scale * 2
+    _batched(conn, """
+        INSERT INTO investor_profile_views (founder_id, investor_id, viewed_at)
+        VALUES (?, ?, ?)
+    """, (
+        (rng.randint(1, n_founders), rng.randint(1, n_investors),
+         (now - timedelta(minutes=rng.randint(0, 14 * 24 * 60))).strftime("%Y-%m-%d %H:%M:%S"))
+        for _ in range(n_views)
+    ))
+
+    # ---------- MATCHES ----------
+    pairs = set()
+    target = min(scale * 2, n_founders * n_investors)
+    while len(pairs) < target:
+        pairs.add((rng.randint(1, n_founders), rng.randint(1, n_investors)))
+    _batched(conn, """
+        INSERT INTO matches (founder_id, investor_id, match_score, status, ai_reason)
+        VALUES (?, ?, ?, ?, 'stage alignment')
+    """, (
+        (fid, iid, rng.randint(40, 100), rng.choice(MATCH_STATUSES))
+        for fid, iid in sorted(pairs)
+    ))
+
+    # ---------- DASHBOARD ROLLUPS (same backfill as migration 001) ----------
+    conn.execute("""
+        INSERT INTO founder_view_counts (founder_id, day, views)
+        SELECT founder_id, DATE(viewed_at), COUNT(*)
+        FROM investor_profile_views
+        GROUP BY founder_id, DATE(viewed_at)
+    """)
+    conn.execute("""
+        INSERT INTO founder_match_counts (founder_id, interested)
+        SELECT founder_id, COUNT(*)
+        FROM matches
+        WHERE status = 'interested'
+        GROUP BY founder_id
+    """)
+
+    conn.commit()
+    conn.close()
+
+    return {
+        "founders": n_founders,
+        "investors": n_investors,
+        "views": n_views,
+        "matches": len(pairs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a benchmark database")
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--db", default="vaitej-bench.db")
+    args = parser.parse_args()
+    print(seed(args.db, args.scale))
+
+
+if __name__ == "__main__":
+    main()
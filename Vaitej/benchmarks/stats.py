@@ -0,0 +1,24 @@
+"""Latency summaries shared by the benchmark scripts."""
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(samples):
+    """Latency percentiles (ms) and throughput for per-call durations (s)."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "throughput_per_s": round(len(ordered) / total, 2) if total else None,
+        "mean_ms": round(total * 1000 / len(ordered), 4) if ordered else None,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 4),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 4),
+    }
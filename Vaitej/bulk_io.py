@@ -0,0 +1,283 @@
+import csv
+import json
+import os
+
+from sqlalchemy import bindparam, text
+
+from focus import store_investor_focus
+from validators import REGISTRATION_SCHEMAS
+
+# Rows use the register forms' field names (REGISTRATION_SCHEMAS), so a row
+# is exactly one form post
+FORMATS = ("csv", "jsonl")
+
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return "jsonl" if ext in ("jsonl", "ndjson") else "csv"
+
+
+# -------------------------------------------------
+# READING
+# -------------------------------------------------
+def read_records(f, fmt):
+    """Yield (line number, record dict) from an open file, one at a time."""
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_no, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, ValueError(f"invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield line_no, ValueError("expected a JSON object")
+            continue
+        yield line_no, record
+
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# -------------------------------------------------
+# IMPORT
+# -------------------------------------------------
+INSERT_USER_SQL = text("""
+    INSERT INTO users
+    (role, full_name, email, password_hash, phone, country, referral_source)
+    VALUES
+    (:role, :full_name, :email, :password, :phone, :country, :referral)
+""")
+
+INSERT_PROFILE_SQL = {
+    "founder": text("""
+        INSERT INTO founder_profiles
+        (user_id, company_name, founding_year,
+         stage, sector, business_model, actively_raising)
+        VALUES
+        (:user_id, :company_name, :founding_year,
+         :stage, :sector, :business_model, :actively_raising)
+    """),
+    "investor": text("""
+        INSERT INTO investor_profiles
+        (user_id, fund_name, investment_stage,
+         sector_focus, geography_focus,
+         typical_check_min, accredited)
+        VALUES
+        (:user_id, :fund_name, :investment_stage,
+         :sector_focus, :geography_focus,
+         :check_size, :accredited)
+    """),
+}
+
+USER_IDS_SQL = text(
+    "SELECT id, email FROM users WHERE email IN :emails"
+).bindparams(bindparam("emails", expanding=True))
+
+INVESTOR_IDS_SQL = text(
+    "SELECT id FROM investor_profiles WHERE user_id IN :user_ids"
+).bindparams(bindparam("user_ids", expanding=True))
+
+
+class ImportReport:
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.failed = 0
+        self.batches = 0
+
+
+def _insert_rows(session, role, rows, hasher):
+    # Passwords are hashed here, not at validation time, so rows rejected
+    # as duplicates never pay for a hash
+    hashes = hasher.hash_many([row["password"] for row in rows])
+    session.execute(INSERT_USER_SQL, [
+        {**row, "role": role, "password": pw}
+        for row, pw in zip(rows, hashes)
+    ])
+
+    user_ids = dict(
+        (r.email, r.id) for r in session.execute(
+            USER_IDS_SQL, {"emails": [row["email"] for row in rows]}
+        )
+    )
+    session.execute(INSERT_PROFILE_SQL[role], [
+        {**row, "user_id": user_ids[row["email"]]} for row in rows
+    ])
+
+    if role == "investor":
+        investor_ids = session.execute(
+            INVESTOR_IDS_SQL, {"user_ids": list(user_ids.values())}
+        ).scalars().all()
+        store_investor_focus(session, investor_ids)
+
+
+def import_batch(session, role, batch, hasher, on_error):
+    """
+    Insert one batch of (line number, row) in a single transaction.
+
+    If the batch fails as a whole, each row is retried in its own
+    transaction so the bad ones can be reported and the rest still land.
+    Returns how many rows were inserted.
+    """
+    existing = {
+        r.email for r in session.execute(
+            USER_IDS_SQL, {"emails": [row["email"] for _, row in batch]}
+        )
+    }
+
+    rows = []
+    seen = set()
+    for line_no, row in batch:
+        if row["email"] in existing:
+            on_error(line_no, "an account with this email already exists")
+        elif row["email"] in seen:
+            on_error(line_no, "duplicate email earlier in this batch")
+        else:
+            seen.add(row["email"])
+            rows.append((line_no, row))
+
+    if not rows:
+        return 0
+
+    try:
+        _insert_rows(session, role, [row for _, row in rows], hasher)
+        session.commit()
+        return len(rows)
+    except Exception:
+        session.rollback()
+
+    inserted = 0
+    for line_no, row in rows:
+        try:
+            _insert_rows(session, role, [row], hasher)
+            session.commit()
+            inserted += 1
+        except Exception as e:
+            session.rollback()
+            on_error(line_no, f"insert failed: {e.__class__.__name__}: {e}")
+    return inserted
+
+
+def import_users(session, role, records, hasher, batch_size=1000, on_error=None):
+    """
+    Validate and insert a stream of (line number, record) for one role.
+    Only one batch is held in memory at a time.
+    """
+    report = ImportReport()
+    schema = REGISTRATION_SCHEMAS[role]
+
+    def failed(line_no, message):
+        report.failed += 1
+        if on_error is not None:
+            on_error(line_no, message)
+
+    for chunk in batched(records, batch_size):
+        report.read += len(chunk)
+
+        parsed = []
+        for line_no, record in chunk:
+            if isinstance(record, Exception):
+                failed(line_no, str(record))
+            else:
+                parsed.append((line_no, record))
+
+        # One validate_many call per batch; it also normalizes the values
+        batch = []
+        results = schema.validate_many([record for _, record in parsed])
+        for (line_no, _), result in zip(parsed, results):
+            if result.ok:
+                batch.append((line_no, result.values))
+            else:
+                failed(line_no, "; ".join(result.messages()))
+
+        if batch:
+            report.imported += import_batch(session, role, batch, hasher, failed)
+        report.batches += 1
+
+    return report
+
+
+# -------------------------------------------------
+# EXPORT
+# -------------------------------------------------
+EXPORT_SQL = {
+    "founder": """
+        SELECT u.id, u.full_name, u.email, u.phone, u.country,
+               u.referral_source AS referral,
+               f.company_name, f.founding_year, f.stage, f.sector,
+               f.business_model, f.actively_raising
+        FROM users u
+        JOIN founder_profiles f ON f.user_id = u.id
+        WHERE u.role = 'founder'
+        ORDER BY u.id
+    """,
+    "investor": """
+        SELECT u.id, u.full_name, u.email, u.phone, u.country,
+               u.referral_source AS referral,
+               ip.fund_name, ip.investment_stage, ip.sector_focus,
+               ip.geography_focus, ip.typical_check_min AS check_size,
+               ip.accredited
+        FROM users u
+        JOIN investor_profiles ip ON ip.user_id = u.id
+        WHERE u.role = 'investor'
+        ORDER BY u.id
+    """,
+}
+
+
+def export_fields(role):
+    # Password hashes never leave the database
+    return ["id"] + [f for f in REGISTRATION_SCHEMAS[role].names if f != "password"]
+
+
+def _jsonable(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)  # Decimal, dates
+
+
+def export_users(session, role, out, fmt, chunk_size=1000):
+    """
+    Stream every user of role to the open file out. Rows come off a
+    server-side cursor chunk_size at a time. Returns the number written.
+    """
+    fields = export_fields(role)
+    result = session.execute(
+        text(EXPORT_SQL[role]).execution_options(
+            stream_results=True, yield_per=chunk_size
+        )
+    )
+
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(fields)
+        write = writer.writerow
+    else:
+        def write(values):
+            out.write(json.dumps(
+                {f: _jsonable(v) for f, v in zip(fields, values)}
+            ) + "\n")
+
+    written = 0
+    for row in result:
+        write(tuple(row))
+        written += 1
+    return written
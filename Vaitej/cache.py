@@ -0,0 +1,87 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryCache:
+    """
+    In-process TTL cache with LRU eviction.
+
+    Each worker process has its own copy, so an invalidation only reaches
+    the worker that handled the write; the TTL bounds staleness elsewhere.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=60):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache:
+    """Cache shared by every worker, backed by Redis."""
+
+    def __init__(self, url, default_ttl=60, prefix="vaitej:"):
+        import redis  # only needed when a shared cache is configured
+
+        self.client = redis.Redis.from_url(url)
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        self.client.set(
+            self.prefix + key,
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+            ex=max(1, int(ttl))
+        )
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+def make_cache(url=None, max_entries=1024, default_ttl=60, namespace="default"):
+    # Each cache gets its own key prefix in Redis, so clear() on one
+    # never touches another's entries
+    if url:
+        return RedisCache(url, default_ttl=default_ttl, prefix=f"vaitej:{namespace}:")
+    return MemoryCache(max_entries=max_entries, default_ttl=default_ttl)
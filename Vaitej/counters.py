@@ -0,0 +1,105 @@
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+# Window shown on the founder dashboard, in daily buckets (today included)
+RECENT_VIEW_DAYS = 7
+
+
+def _is_sqlite(session):
+    return session.get_bind().dialect.name == "sqlite"
+
+
+# -------------------------------------------------
+# PROFILE VIEWS (DAILY BUCKETS)
+# -------------------------------------------------
+MYSQL_ADD_VIEWS_SQL = text("""
+    INSERT INTO founder_view_counts (founder_id, day, views)
+    VALUES (:fid, :day, :views)
+    ON DUPLICATE KEY UPDATE views = views + VALUES(views)
+""")
+
+SQLITE_ADD_VIEWS_SQL = text("""
+    INSERT INTO founder_view_counts (founder_id, day, views)
+    VALUES (:fid, :day, :views)
+    ON CONFLICT (founder_id, day) DO UPDATE SET
+        views = views + excluded.views
+""")
+
+
+def add_views(session, buckets):
+    """
+    Add view counts in bulk.
+
+    buckets maps (founder_id, day) -> number of new views. Runs in the
+    caller's transaction, next to the inserts it rolls up.
+    """
+    if not buckets:
+        return
+
+    statement = SQLITE_ADD_VIEWS_SQL if _is_sqlite(session) else MYSQL_ADD_VIEWS_SQL
+    session.execute(statement, [
+        {"fid": fid, "day": day, "views": views}
+        for (fid, day), views in buckets.items()
+    ])
+
+
+def recent_view_since(days=RECENT_VIEW_DAYS):
+    return date.today() - timedelta(days=days - 1)
+
+
+RECENT_VIEWS_SQL = text("""
+    SELECT COALESCE(SUM(views), 0)
+    FROM founder_view_counts
+    WHERE founder_id = :fid
+      AND day >= :since
+""")
+
+
+def recent_views(session, founder_id, days=RECENT_VIEW_DAYS):
+    since = recent_view_since(days)
+    return session.execute(
+        RECENT_VIEWS_SQL, {"fid": founder_id, "since": since}
+    ).scalar()
+
+
+# -------------------------------------------------
+# MATCH INTEREST
+# -------------------------------------------------
+MYSQL_ADD_INTEREST_SQL = text("""
+    INSERT INTO founder_match_counts (founder_id, interested)
+    VALUES (:fid, :delta)
+    ON DUPLICATE KEY UPDATE interested = interested + VALUES(interested)
+""")
+
+SQLITE_ADD_INTEREST_SQL = text("""
+    INSERT INTO founder_match_counts (founder_id, interested)
+    VALUES (:fid, :delta)
+    ON CONFLICT (founder_id) DO UPDATE SET
+        interested = interested + excluded.interested
+""")
+
+
+def match_status_changed(session, founder_id, old_status, new_status):
+    delta = (new_status == "interested") - (old_status == "interested")
+    if not delta:
+        return
+
+    statement = (
+        SQLITE_ADD_INTEREST_SQL if _is_sqlite(session)
+        else MYSQL_ADD_INTEREST_SQL
+    )
+    session.execute(statement, {"fid": founder_id, "delta": delta})
+
+
+EXPRESSED_INTEREST_SQL = text("""
+    SELECT interested
+    FROM founder_match_counts
+    WHERE founder_id = :fid
+""")
+
+
+def expressed_interest(session, founder_id):
+    return session.execute(
+        EXPRESSED_INTEREST_SQL, {"fid": founder_id}
+    ).scalar() or 0
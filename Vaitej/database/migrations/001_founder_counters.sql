@@ -0,0 +1,29 @@
+-- -------------------------------------------------
+-- FOUNDER DASHBOARD COUNTERS
+-- Rollups kept current by counters.py as views and match status
+-- changes are written, so founder_home never scans the event tables.
+-- -------------------------------------------------
+
+CREATE TABLE founder_view_counts (
+    founder_id INT NOT NULL,
+    day DATE NOT NULL,
+    views INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (founder_id, day)
+);
+
+CREATE TABLE founder_match_counts (
+    founder_id INT NOT NULL PRIMARY KEY,
+    interested INT NOT NULL DEFAULT 0
+);
+
+-- Backfill from existing events
+INSERT INTO founder_view_counts (founder_id, day, views)
+SELECT founder_id, DATE(viewed_at), COUNT(*)
+FROM investor_profile_views
+GROUP BY founder_id, DATE(viewed_at);
+
+INSERT INTO founder_match_counts (founder_id, interested)
+SELECT founder_id, COUNT(*)
+FROM matches
+WHERE status = 'interested'
+GROUP BY founder_id;
@@ -0,0 +1,8 @@
+-- -------------------------------------------------
+-- MATCH LISTING INDEX
+-- Serves founder_matches / the matches API: equality on founder_id and
+-- status, then (match_score, id) in the order keyset pagination seeks.
+-- -------------------------------------------------
+
+CREATE INDEX idx_matches_founder_status_score
+    ON matches (founder_id, status, match_score, id);
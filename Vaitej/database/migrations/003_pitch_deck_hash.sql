@@ -0,0 +1,12 @@
+-- -------------------------------------------------
+-- PITCH DECK CONTENT HASH
+-- SHA-256 of the uploaded file, computed while streaming it to disk.
+-- deck_score is NULL until the background scorer has run.
+-- -------------------------------------------------
+
+ALTER TABLE pitch_decks
+    ADD COLUMN content_hash CHAR(64) NULL,
+    MODIFY deck_score INT NULL;
+
+CREATE INDEX idx_pitch_decks_founder_hash
+    ON pitch_decks (founder_id, content_hash);
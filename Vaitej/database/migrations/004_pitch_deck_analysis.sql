@@ -0,0 +1,13 @@
+-- -------------------------------------------------
+-- PITCH DECK ANALYSIS CACHE
+-- One row per distinct file (by SHA-256), so a deck that is uploaded
+-- again, by anyone, is never parsed twice.
+-- -------------------------------------------------
+
+CREATE TABLE pitch_deck_analysis (
+    content_hash CHAR(64) NOT NULL PRIMARY KEY,
+    page_count INT NOT NULL,
+    sections VARCHAR(255) NOT NULL,
+    deck_score INT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
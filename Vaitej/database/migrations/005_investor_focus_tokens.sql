@@ -0,0 +1,22 @@
+-- -------------------------------------------------
+-- INVESTOR FOCUS TOKENS
+-- Stage / sector / geography focus parsed into normalized tokens, each
+-- interned once in focus_tokens. Investors keep the ids as a sorted,
+-- space-separated list ("3 17 42"), written whenever the focus text is.
+-- NULL means "not tokenized yet".
+--
+-- Tokenizing needs the same normalization as focus.py, so the backfill
+-- runs from the app after this migration:
+--     flask --app app backfill-investor-focus
+-- -------------------------------------------------
+
+CREATE TABLE focus_tokens (
+    id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    token VARCHAR(100) NOT NULL,
+    UNIQUE KEY uq_focus_tokens_token (token)
+);
+
+ALTER TABLE investor_profiles
+    ADD COLUMN stage_token_ids VARCHAR(255) NULL,
+    ADD COLUMN sector_token_ids VARCHAR(255) NULL,
+    ADD COLUMN geography_token_ids VARCHAR(255) NULL;
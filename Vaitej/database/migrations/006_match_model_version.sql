@@ -0,0 +1,11 @@
+-- -------------------------------------------------
+-- MATCH SCORING MODEL VERSION
+-- The scoring model version (see scoring_models/) that produced each
+-- row's match_score and ai_reason. NULL means scored before models were
+-- versioned. After deploying a new model version, rescore only the rows
+-- it did not write:
+--     flask --app app rescore-matches
+-- -------------------------------------------------
+
+ALTER TABLE matches
+    ADD COLUMN model_version INT NULL;
@@ -0,0 +1,11 @@
+-- -------------------------------------------------
+-- DEFAULT MATCH LISTING INDEX
+-- The unfiltered listing hides declined matches with status <> 'declined'.
+-- That is a range on status, so idx_matches_founder_status_score can't
+-- return rows in (match_score, id) order and every page sorts all of the
+-- founder's matches. This index is in listing order; status rides along
+-- at the end so the filter is checked without reading the row.
+-- -------------------------------------------------
+
+CREATE INDEX idx_matches_founder_score
+    ON matches (founder_id, match_score, id, status);
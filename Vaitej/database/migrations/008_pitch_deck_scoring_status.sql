@@ -0,0 +1,13 @@
+-- -------------------------------------------------
+-- PITCH DECK SCORING STATUS
+-- pending until the background scorer runs, then scored or failed. A
+-- failed deck is shown as such on the Pitch Hub; uploading the same
+-- file again retries it.
+-- -------------------------------------------------
+
+ALTER TABLE pitch_decks
+    ADD COLUMN scoring_status VARCHAR(16) NOT NULL DEFAULT 'pending';
+
+UPDATE pitch_decks
+SET scoring_status = 'scored'
+WHERE deck_score IS NOT NULL;
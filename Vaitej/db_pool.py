@@ -0,0 +1,124 @@
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """Counters a pool updates on every checkout / checkin."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.overflow_checkouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def record_checkout(self, waited, checked_out, overflow):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_timeout(self, waited):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(
+                    self.wait_total * 1000 / self.checkouts, 3
+                ) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            self.stats.record_timeout(time.perf_counter() - start)
+            raise
+
+        self.stats.record_checkout(
+            time.perf_counter() - start,
+            self.checkedout(),
+            self.overflow()
+        )
+        return conn
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self.stats.record_checkin()
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS built from the DB_* settings in Config."""
+    uri = config["SQLALCHEMY_DATABASE_URI"]
+
+    # In-memory SQLite runs on a single shared connection; nothing to size
+    if uri.startswith("sqlite") and (":memory:" in uri or uri.endswith("://")):
+        return {}
+
+    options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
+
+    timeout_ms = config["DB_STATEMENT_TIMEOUT_MS"]
+    if timeout_ms and uri.startswith("mysql"):
+        # Applies to SELECTs, which is what piles up under load
+        options["connect_args"] = {
+            "init_command": f"SET SESSION max_execution_time = {int(timeout_ms)}"
+        }
+
+    return options
+
+
+def pool_status(engine):
+    pool = engine.pool
+    status = {"pool": pool.status()}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0)
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.stats.snapshot())
+    return status
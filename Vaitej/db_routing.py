@@ -0,0 +1,49 @@
+import random
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, session
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND_PREFIX = "replica_"
+
+
+def replica_binds(uris):
+    """SQLALCHEMY_BINDS entries for each configured replica URI."""
+    return {f"{REPLICA_BIND_PREFIX}{i}": uri for i, uri in enumerate(uris)}
+
+
+class RoutingSession(Session):
+    """
+    Session that sends a request's statements to a read replica when the
+    view opted in with @replica_reads. Everything else, including work
+    done outside a request (jobs, CLI), goes to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            replica = g.get("db_replica")
+            if replica is not None:
+                return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def mark_primary_sticky():
+    # Read-your-writes: keep this user's reads on the primary for a while,
+    # long enough for replicas to catch up with what they just wrote
+    window = current_app.config["READ_YOUR_WRITES_SECONDS"]
+    session["primary_until"] = time.time() + window
+
+
+def replica_reads(view):
+    """Route the view's queries to one replica unless the user just wrote."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        replicas = current_app.config["SQLALCHEMY_REPLICA_URIS"]
+        if replicas and time.time() >= session.get("primary_until", 0):
+            # One replica per request, so all its reads see the same state
+            g.db_replica = f"{REPLICA_BIND_PREFIX}{random.randrange(len(replicas))}"
+        return view(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,377 @@
+import mmap
+import re
+import zlib
+
+from sqlalchemy import text
+
+from cache import MemoryCache
+
+# -------------------------------------------------
+# PDF PARSING
+# -------------------------------------------------
+# Just enough PDF to count pages and pull visible text out of content
+# streams; no rendering, fonts or layout. Files are memory-mapped, so a
+# large deck is never read into a Python bytes object in one piece.
+#
+# The result is approximate: strings are taken as single-byte text, so
+# decks whose fonts map glyph ids through a ToUnicode CMap (common for
+# embedded CID fonts) yield little text and score on page count alone.
+PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+OBJECT_STREAM_RE = re.compile(rb"/Type\s*/ObjStm(?![a-zA-Z])")
+STREAM_RE = re.compile(
+    rb"<<(?P<dict>(?:(?!>>\s*stream).){0,512}?)>>\s*stream\r?\n",
+    re.DOTALL
+)
+ENDSTREAM = b"endstream"
+# Literal (...) and hex <...> strings shown by Tj, ', " and TJ arrays.
+# Content streams are scanned token by token rather than with one
+# pattern per operator: a lazy match from every "(" re-scans to the end
+# of the stream when nothing closes it, which is quadratic.
+TEXT_START_RE = re.compile(rb"[(<\[]")
+ARRAY_ITEM_RE = re.compile(rb"[(<\]]")
+LITERAL_RE = re.compile(rb"\(([^()\\]*(?:\\.[^()\\]*)*)\)", re.DOTALL)
+LITERAL_DELIM_RE = re.compile(rb"[()\\]")
+HEX_RE = re.compile(rb"[0-9A-Fa-f\s]*")
+SHOW_RE = re.compile(rb"\s*(?:Tj|'|\")")
+SHOW_ARRAY_RE = re.compile(rb"\s*TJ")
+WHITESPACE_RE = re.compile(rb"\s+")
+ESCAPE_RE = re.compile(rb"\\([nrtbf()\\]|[0-7]{1,3})")
+
+_ESCAPES = {
+    b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f",
+    b"(": b"(", b")": b")", b"\\": b"\\",
+}
+
+# Stop extracting once this much text is collected; it is plenty to find
+# section headings and bounds the work for huge decks
+MAX_TEXT_BYTES = 512 * 1024
+MAX_STREAM_BYTES = 4 * 1024 * 1024
+# Content stream bytes scanned for text per document, found or not, so
+# streams full of strings that are never shown can't keep a worker busy
+MAX_SCAN_BYTES = 4 * 1024 * 1024
+# Inflated bytes per document, across every stream. A few KB of deflate
+# can expand to gigabytes, so inflating is always capped.
+MAX_INFLATED_BYTES = 16 * 1024 * 1024
+
+
+def _unescape(raw):
+    def repl(m):
+        token = m.group(1)
+        if token in _ESCAPES:
+            return _ESCAPES[token]
+        return bytes([int(token, 8) & 0xFF])
+    return ESCAPE_RE.sub(repl, raw)
+
+
+def _hex_string(raw):
+    digits = WHITESPACE_RE.sub(b"", raw)
+    if len(digits) % 2:
+        digits += b"0"  # odd length: the last digit is followed by 0
+    return bytes.fromhex(digits.decode("ascii"))
+
+
+def _literal_end(data, start):
+    """Index just past the ")" closing the literal opened at start, or -1."""
+    depth = 0
+    pos = start
+    while True:
+        m = LITERAL_DELIM_RE.search(data, pos)
+        if m is None:
+            return -1
+        pos = m.end()
+        if m.group() == b"\\":
+            pos += 1  # escaped character
+            continue
+        depth += 1 if m.group() == b"(" else -1
+        if depth == 0:
+            return pos
+
+
+def _read_string(data, start):
+    """
+    (string or None, end) for the string token at start. end is -1 when
+    the string never closes, so nothing after it can be read either.
+    """
+    if data[start:start + 1] == b"(":
+        m = LITERAL_RE.match(data, start)
+        if m is not None:
+            return _unescape(m.group(1)), m.end()
+        end = _literal_end(data, start)  # nested parentheses
+        if end == -1:
+            return None, -1
+        return _unescape(data[start + 1:end - 1]), end
+
+    if data[start + 1:start + 2] == b"<":
+        return None, start + 2  # "<<" opens a dictionary
+    m = HEX_RE.match(data, start + 1)
+    if data[m.end():m.end() + 1] != b">":
+        return None, start + 1  # not a hex string
+    return _hex_string(m.group()), m.end() + 1
+
+
+def _read_array(data, pos):
+    """(strings, end) for the array whose "[" ends at pos; end as above."""
+    strings = []
+    while True:
+        m = ARRAY_ITEM_RE.search(data, pos)
+        if m is None:
+            return strings, -1
+        if m.group() == b"]":
+            return strings, m.end()
+        found, pos = _read_string(data, m.start())
+        if pos == -1:
+            return strings, -1
+        if found is not None:
+            strings.append(found)
+
+
+def _stream_text(data):
+    """Text shown by Tj, ', " and TJ in one content stream, in one pass."""
+    parts = []
+    pos = 0
+    while True:
+        m = TEXT_START_RE.search(data, pos)
+        if m is None:
+            break
+
+        if m.group() == b"[":
+            strings, pos = _read_array(data, m.end())
+            if pos == -1:
+                break
+            if SHOW_ARRAY_RE.match(data, pos):
+                parts.extend(strings)
+        else:
+            found, pos = _read_string(data, m.start())
+            if pos == -1:
+                break
+            if found is not None and SHOW_RE.match(data, pos):
+                parts.append(found)
+    return b" ".join(parts)
+
+
+def _inflate(raw, limit):
+    """
+    Inflate at most limit bytes of raw. Returns None if raw is not valid
+    deflate; a stream that inflates past limit is cut off there.
+    """
+    try:
+        return zlib.decompressobj().decompress(raw, limit)
+    except zlib.error:
+        return None
+
+
+def extract_pdf(path):
+    """(page count, extracted text) for the PDF at path."""
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return 0, ""  # empty file
+
+        with data:
+            pages = sum(1 for _ in PAGE_RE.finditer(data))
+
+            chunks = []
+            collected = 0
+            scanned = 0
+            inflated = 0
+            for m in STREAM_RE.finditer(data):
+                if inflated >= MAX_INFLATED_BYTES:
+                    break
+
+                start = m.end()
+                end = data.find(ENDSTREAM, start)
+                if end == -1 or end - start > MAX_STREAM_BYTES:
+                    continue
+
+                info = m.group("dict")
+                # Compressed object streams hold objects, page objects
+                # included, that the scan of the raw file can't see
+                is_objects = OBJECT_STREAM_RE.search(info) is not None
+                if not is_objects and (collected >= MAX_TEXT_BYTES
+                                       or scanned >= MAX_SCAN_BYTES):
+                    continue
+
+                if not is_objects and b"/Filter" not in info:
+                    # Uncompressed text also gets only the budget left
+                    end = min(end, start + MAX_TEXT_BYTES - collected)
+                raw = data[start:end]
+                if b"/FlateDecode" in info:
+                    # Text streams get no more than the text budget left
+                    limit = MAX_INFLATED_BYTES - inflated
+                    if not is_objects:
+                        limit = min(limit, MAX_TEXT_BYTES - collected)
+                    raw = _inflate(raw, limit)
+                    if raw is None:
+                        continue
+                    inflated += len(raw)
+                elif b"/Filter" in info:
+                    continue  # images and other encodings carry no text
+
+                if is_objects:
+                    pages += sum(1 for _ in PAGE_RE.finditer(raw))
+                    continue
+
+                found = _stream_text(raw)
+                scanned += len(raw)
+                if found:
+                    chunks.append(found)
+                    collected += len(found)
+
+    return pages, b" ".join(chunks).decode("latin-1")
+
+
+# -------------------------------------------------
+# SCORING
+# -------------------------------------------------
+# Sections investors look for, with the words that usually head them
+SECTIONS = {
+    "problem": ("problem", "pain point", "challenge"),
+    "solution": ("solution", "our product", "how it works"),
+    "market": ("market", "tam", "sam", "som"),
+    "business_model": ("business model", "revenue model", "pricing", "monetization"),
+    "traction": ("traction", "customers", "revenue", "growth", "mrr", "arr", "users"),
+    "team": ("team", "founder", "co-founder", "ceo", "cto"),
+    "competition": ("competition", "competitor", "landscape"),
+    "ask": ("the ask", "raising", "use of funds", "funding", "investment"),
+}
+
+SECTION_POINTS = {
+    "problem": 10,
+    "solution": 10,
+    "market": 12,
+    "business_model": 10,
+    "traction": 14,
+    "team": 12,
+    "competition": 4,
+    "ask": 8,
+}
+
+# Decks in this page range read as focused rather than thin or bloated
+IDEAL_PAGES = (10, 20)
+ACCEPTABLE_PAGES = (7, 30)
+
+
+def detect_sections(content):
+    lowered = content.lower()
+    return [
+        name for name, keywords in SECTIONS.items()
+        if any(re.search(rf"\b{re.escape(k)}\b", lowered) for k in keywords)
+    ]
+
+
+def score_deck(pages, sections):
+    score = sum(SECTION_POINTS[s] for s in sections)
+
+    if IDEAL_PAGES[0] <= pages <= IDEAL_PAGES[1]:
+        score += 20
+    elif ACCEPTABLE_PAGES[0] <= pages <= ACCEPTABLE_PAGES[1]:
+        score += 10
+
+    return min(score, 100)
+
+
+def analyze_pdf(path):
+    pages, content = extract_pdf(path)
+    sections = detect_sections(content)
+    return {
+        "page_count": pages,
+        "sections": sections,
+        "deck_score": score_deck(pages, sections),
+    }
+
+
+# -------------------------------------------------
+# CONTENT-HASH CACHE
+# -------------------------------------------------
+# Analyses are keyed by file hash: a small per-worker LRU in front of the
+# pitch_deck_analysis table, so identical files are parsed exactly once.
+_memory = MemoryCache(max_entries=512, default_ttl=24 * 3600)
+
+
+def _from_row(row):
+    return {
+        "page_count": row.page_count,
+        "sections": row.sections.split(",") if row.sections else [],
+        "deck_score": row.deck_score,
+    }
+
+
+def cached_analysis(session, content_hash):
+    analysis = _memory.get(content_hash)
+    if analysis is not None:
+        return analysis
+
+    row = session.execute(
+        text("""
+            SELECT page_count, sections, deck_score
+            FROM pitch_deck_analysis
+            WHERE content_hash = :hash
+        """),
+        {"hash": content_hash}
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    analysis = _from_row(row)
+    _memory.set(content_hash, analysis)
+    return analysis
+
+
+def analysis_for(session, content_hash, path):
+    """Cached analysis for content_hash, parsing path only on a miss."""
+    analysis = cached_analysis(session, content_hash)
+    if analysis is not None:
+        return analysis
+
+    analysis = analyze_pdf(path)
+
+    dialect = session.get_bind().dialect.name
+    insert = "INSERT OR IGNORE" if dialect == "sqlite" else "INSERT IGNORE"
+    session.execute(
+        text(f"""
+            {insert} INTO pitch_deck_analysis
+            (content_hash, page_count, sections, deck_score)
+            VALUES (:hash, :pages, :sections, :score)
+        """),
+        {
+            "hash": content_hash,
+            "pages": analysis["page_count"],
+            "sections": ",".join(analysis["sections"]),
+            "score": analysis["deck_score"],
+        }
+    )
+    _memory.set(content_hash, analysis)
+    return analysis
+
+
+# -------------------------------------------------
+# FOUNDER DECK SCORES
+# -------------------------------------------------
+LATEST_DECK_SCORES_SQL = """
+    SELECT d.founder_id, d.deck_score
+    FROM pitch_decks d
+    JOIN (
+        SELECT founder_id, MAX(id) AS id
+        FROM pitch_decks
+        WHERE deck_score IS NOT NULL
+        {founder_filter}
+        GROUP BY founder_id
+    ) latest ON latest.id = d.id
+"""
+
+
+def latest_deck_scores(session, founder_id=None):
+    """founder_id -> score of their newest scored deck."""
+    params = {}
+    founder_filter = ""
+    if founder_id is not None:
+        founder_filter = "AND founder_id = :fid"
+        params["fid"] = founder_id
+
+    rows = session.execute(
+        text(LATEST_DECK_SCORES_SQL.format(founder_filter=founder_filter)),
+        params
+    ).fetchall()
+    return {row.founder_id: row.deck_score for row in rows}
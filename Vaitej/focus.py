@@ -0,0 +1,167 @@
+import re
+
+from sqlalchemy import bindparam, text
+
+# -------------------------------------------------
+# TOKENS
+# -------------------------------------------------
+# Focus fields are free text like "Seed, Series A", "Fintech / SaaS" or
+# "US & Canada". Each part becomes one normalized token, so "AI" only
+# ever matches "ai", never the "ai" inside "retail". Investor parts also
+# offer each of their words, so a founder in "SaaS" matches "B2B SaaS".
+TOKEN_SEPARATORS = re.compile(r"[,;/|&+]|\band\b", re.IGNORECASE)
+# "+" is noise too, so "Series A+" matches an investor's "Series A"
+TOKEN_NOISE = re.compile(r"[^\w]+")
+MAX_TOKEN_LENGTH = 100  # focus_tokens.token
+
+# (founder field, investor text column, investor token id column)
+FOCUS_FIELDS = [
+    ("stage", "investment_stage", "stage_token_ids"),
+    ("sector", "sector_focus", "sector_token_ids"),
+    ("country", "geography_focus", "geography_token_ids"),
+]
+
+
+def normalize_token(value):
+    # "Pre-Seed", "pre seed" and " PRE_SEED " all become "pre seed"
+    return " ".join(TOKEN_NOISE.sub(" ", value.lower()).replace("_", " ").split())
+
+
+def tokenize(value):
+    if not value:
+        return set()
+    tokens = (
+        normalize_token(t)[:MAX_TOKEN_LENGTH] for t in TOKEN_SEPARATORS.split(value)
+    )
+    return {t for t in tokens if t}
+
+
+def investor_tokens(value):
+    """tokenize(value) plus every word of its multi-word parts."""
+    tokens = tokenize(value)
+    return tokens | {word for t in tokens for word in t.split()}
+
+
+# Token ids are stored as a space-separated, sorted list: "3 17 42"
+def encode_ids(ids):
+    return " ".join(str(i) for i in sorted(ids))
+
+
+def decode_ids(value):
+    if not value:
+        return frozenset()
+    return frozenset(int(i) for i in value.split())
+
+
+def investor_focus(row):
+    """Founder field -> token id set for an investor row."""
+    if "focus" in row:
+        return row["focus"]  # decoded once by InvestorIndex
+    return {field: decode_ids(row[ids]) for field, _, ids in FOCUS_FIELDS}
+
+
+# -------------------------------------------------
+# VOCABULARY
+# -------------------------------------------------
+TOKEN_IDS_SQL = text(
+    "SELECT id, token FROM focus_tokens WHERE token IN :tokens"
+).bindparams(bindparam("tokens", expanding=True))
+
+
+def token_ids(session, tokens):
+    """token -> id for the tokens already in the vocabulary."""
+    if not tokens:
+        return {}
+    rows = session.execute(TOKEN_IDS_SQL, {"tokens": list(tokens)})
+    return {row.token: row.id for row in rows}
+
+
+def intern_tokens(session, tokens):
+    """token -> id, adding any tokens the vocabulary has not seen yet."""
+    ids = token_ids(session, tokens)
+    missing = [t for t in tokens if t not in ids]
+    if missing:
+        dialect = session.get_bind().dialect.name
+        insert = "INSERT OR IGNORE" if dialect == "sqlite" else "INSERT IGNORE"
+        session.execute(
+            text(f"{insert} INTO focus_tokens (token) VALUES (:token)"),
+            [{"token": t} for t in missing]
+        )
+        ids.update(token_ids(session, missing))
+    return ids
+
+
+def founder_focus(session, founders):
+    """
+    Attach token id sets to founder rows, as a list of dicts with a
+    "focus" entry. Tokens no investor uses have no id and cannot match.
+    """
+    founders = [dict(f) for f in founders]
+    tokens = [
+        {field: tokenize(f[field]) for field, _, _ in FOCUS_FIELDS}
+        for f in founders
+    ]
+    ids = token_ids(session, set().union(*(
+        t for per_field in tokens for t in per_field.values()
+    )))
+
+    for founder, per_field in zip(founders, tokens):
+        founder["focus"] = {
+            field: frozenset(ids[t] for t in field_tokens if t in ids)
+            for field, field_tokens in per_field.items()
+        }
+    return founders
+
+
+# -------------------------------------------------
+# INVESTOR TOKEN COLUMNS
+# -------------------------------------------------
+INVESTOR_FOCUS_TEXT_SQL = text("""
+    SELECT id, investment_stage, sector_focus, geography_focus
+    FROM investor_profiles
+    WHERE id IN :ids
+""").bindparams(bindparam("ids", expanding=True))
+
+UPDATE_INVESTOR_FOCUS_SQL = text("""
+    UPDATE investor_profiles
+    SET stage_token_ids = :stage,
+        sector_token_ids = :sector,
+        geography_token_ids = :country
+    WHERE id = :id
+""")
+
+
+def store_investor_focus(session, investor_ids):
+    """
+    Tokenize the focus fields of these investors and store the token ids.
+    Call in the same transaction as any write to those fields.
+    """
+    if not investor_ids:
+        return 0
+
+    rows = session.execute(
+        INVESTOR_FOCUS_TEXT_SQL, {"ids": list(investor_ids)}
+    ).mappings().all()
+
+    tokens = [
+        (
+            row["id"],
+            {field: investor_tokens(row[column]) for field, column, _ in FOCUS_FIELDS}
+        )
+        for row in rows
+    ]
+    ids = intern_tokens(session, set().union(*(
+        t for _, per_field in tokens for t in per_field.values()
+    )))
+
+    session.execute(UPDATE_INVESTOR_FOCUS_SQL, [
+        {
+            "id": investor_id,
+            **{
+                field: encode_ids(ids[t] for t in field_tokens)
+                for field, field_tokens in per_field.items()
+            }
+        }
+        for investor_id, per_field in tokens
+    ])
+    return len(rows)
@@ -0,0 +1,172 @@
+import heapq
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import text
+
+from deck_analysis import latest_deck_scores
+from focus import FOCUS_FIELDS, founder_focus, investor_focus
+from matching import (
+    RAISING_FOUNDERS_SQL,
+    calculate_match_score,
+    is_raising,
+    match_pitch_score
+)
+
+INDEXED_FIELDS = [field for field, _, _ in FOCUS_FIELDS]
+
+# Everything calculate_match_score reads from the investor side
+FEED_INVESTOR_SQL = text("""
+    SELECT
+        ip.id,
+        ip.stage_token_ids,
+        ip.sector_token_ids,
+        ip.geography_token_ids,
+        ip.typical_check_min,
+        ip.typical_check_max,
+        ip.verification_status,
+        ip.activity_status
+    FROM investor_profiles ip
+    WHERE ip.id = :iid
+""")
+
+
+def load_feed_investor(session, investor_id):
+    return session.execute(FEED_INVESTOR_SQL, {"iid": investor_id}).mappings().first()
+
+
+class FounderIndex:
+    """
+    In-process inverted index of founders, the reverse of InvestorIndex.
+
+    Maps stage / sector / country token ids to founder ids, with each
+    founder's pitch score worked out at build time, so ranking founders
+    for one investor only scores those that can clear the scoring model's
+    threshold.
+    Every worker keeps its own copy; max_age bounds how stale it can get.
+    """
+
+    def __init__(self, model, max_age=300):
+        self.model = model
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._built_at = None
+        self._rows = {}
+        self._postings = {field: defaultdict(set) for field in INDEXED_FIELDS}
+
+    # -------------------------------------------------
+    # BUILD / MAINTAIN
+    # -------------------------------------------------
+    def build(self, session):
+        founders = founder_focus(
+            session, session.execute(RAISING_FOUNDERS_SQL).mappings().all()
+        )
+        deck_scores = latest_deck_scores(session)
+
+        with self._lock:
+            self._rows = {}
+            self._postings = {f: defaultdict(set) for f in INDEXED_FIELDS}
+            for founder in founders:
+                self._add(founder, match_pitch_score(founder, deck_scores))
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self, session):
+        with self._lock:
+            stale = (
+                self._built_at is None
+                or time.monotonic() - self._built_at > self.max_age
+            )
+        if stale:
+            self.build(session)
+
+    def update(self, founder, pitch_score):
+        """
+        Replace one founder after its match inputs change. founder is a
+        row from founder_focus(), as generate_founder_matches has it.
+        """
+        with self._lock:
+            self._remove(founder["id"])
+            if is_raising(founder):
+                self._add(founder, pitch_score)
+
+    def remove(self, founder_id):
+        with self._lock:
+            self._remove(founder_id)
+
+    def _add(self, founder, pitch_score):
+        row = dict(founder)
+        row["pitch_score"] = pitch_score
+        self._rows[row["id"]] = row
+        for field, ids in row["focus"].items():
+            for token_id in ids:
+                self._postings[field][token_id].add(row["id"])
+
+    def _remove(self, founder_id):
+        row = self._rows.pop(founder_id, None)
+        if row is None:
+            return
+        for field, token_ids in row["focus"].items():
+            postings = self._postings[field]
+            for token_id in token_ids:
+                ids = postings.get(token_id)
+                if ids is None:
+                    continue
+                ids.discard(founder_id)
+                if not ids:
+                    del postings[token_id]
+
+    # -------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------
+    def __len__(self):
+        return len(self._rows)
+
+    def candidates(self, investor):
+        """Founders that can reach the model's threshold with this investor."""
+        model = self.model
+        offers = investor_focus(investor)
+        with self._lock:
+            # Best score a founder can get without any stage / sector /
+            # geography fit. If that alone clears the bar, nothing can
+            # be pruned.
+            untokenized = model.weights["check_size"] + model.max_pitch_points
+            if investor["verification_status"] == "verified":
+                untokenized += model.weights["verified"]
+            if investor["activity_status"] == "active":
+                untokenized += model.weights["active"]
+            if untokenized >= model.threshold:
+                return list(self._rows.values())
+
+            ids = set()
+            for field in INDEXED_FIELDS:
+                postings = self._postings[field]
+                for token_id in offers[field]:
+                    ids |= postings.get(token_id, set())
+            return [self._rows[fid] for fid in ids]
+
+    def top_matches(self, session, investor, k):
+        """
+        The k best founders for this investor, best first, as
+        (score, reason, founder) tuples. Ties go to the older profile.
+        """
+        self.ensure_fresh(session)
+
+        # Min-heap of the best k so far: O(n log k) instead of sorting
+        # every candidate
+        model = self.model
+        heap = []
+        for founder in self.candidates(investor):
+            score, reason = calculate_match_score(
+                founder, investor, founder["pitch_score"], model
+            )
+            if score < model.threshold:
+                continue
+            entry = (score, -founder["id"], reason, founder)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        heap.sort(key=lambda e: e[:2], reverse=True)
+        return [(score, reason, founder) for score, _, reason, founder in heap]
@@ -0,0 +1,302 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+
+from flask import (
+    before_render_template,
+    g,
+    has_request_context,
+    request,
+    template_rendered
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# -------------------------------------------------
+# METRICS REGISTRY
+# -------------------------------------------------
+# Prometheus text exposition without the client library: a handful of
+# counters and histograms, each a dict of label values -> numbers.
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+TEMPLATE_BUCKETS = SQL_BUCKETS
+
+# Label for statements run outside a request: jobs, CLI, buffer flushes
+NO_ROUTE = "-"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name, doc, labels=()):
+        self.name = name
+        self.doc = doc
+        self.label_names = labels
+        self._values = {}
+
+    def inc(self, labels=(), amount=1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, doc, buckets, labels=()):
+        self.name = name
+        self.doc = doc
+        self.buckets = buckets
+        self.label_names = labels
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values = {}
+
+    def observe(self, labels, value):
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}"
+                )
+            label_text = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class Metrics:
+    """
+    The app's request, SQL and template metrics, safe to update from any
+    thread.
+
+    The registry lives in the worker process: under several gunicorn
+    workers each scrape of /metrics sees only the worker that served it.
+    Scrape every worker (e.g. one port each), or aggregate with
+    sum/rate across scrapes, which stays correct as long as each series
+    is scraped from the same worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = Counter(
+            "vaitej_http_requests_total", "HTTP requests served.",
+            ("route", "method", "status")
+        )
+        self.request_seconds = Histogram(
+            "vaitej_http_request_duration_seconds", "Time to handle a request.",
+            REQUEST_BUCKETS, ("route",)
+        )
+        self.request_statements = Counter(
+            "vaitej_http_request_sql_statements_total",
+            "SQL statements executed while handling requests.", ("route",)
+        )
+        self.statement_seconds = Histogram(
+            "vaitej_sql_statement_duration_seconds", "Time per SQL statement.",
+            SQL_BUCKETS, ("route",)
+        )
+        self.slow_statements = Counter(
+            "vaitej_sql_slow_statements_total",
+            "SQL statements over the slow query threshold.", ("route",)
+        )
+        self.template_seconds = Histogram(
+            "vaitej_template_render_duration_seconds",
+            "Time to render a template.",
+            TEMPLATE_BUCKETS, ("route", "template")
+        )
+
+    def record_request(self, route, method, status, seconds, statement_seconds):
+        with self._lock:
+            self.requests.inc((route, method, str(status)))
+            self.request_seconds.observe((route,), seconds)
+            self.request_statements.inc((route,), len(statement_seconds))
+            for s in statement_seconds:
+                self.statement_seconds.observe((route,), s)
+
+    def record_statement(self, route, seconds):
+        # Statements outside a request have no after_request to report them
+        with self._lock:
+            self.statement_seconds.observe((route,), seconds)
+
+    def record_slow(self, route):
+        with self._lock:
+            self.slow_statements.inc((route,))
+
+    def record_template(self, route, template, seconds):
+        with self._lock:
+            self.template_seconds.observe((route, template), seconds)
+
+    def render(self):
+        with self._lock:
+            lines = []
+            for metric in (
+                self.requests, self.request_seconds, self.request_statements,
+                self.statement_seconds, self.slow_statements, self.template_seconds,
+            ):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# -------------------------------------------------
+# REQUEST + SQL HOOKS
+# -------------------------------------------------
+_WHITESPACE_RE = re.compile(r"\s+")
+SLOW_QUERY_LOG_CHARS = 500
+
+
+def _route():
+    rule = request.url_rule
+    return rule.rule if rule is not None else "unmatched"
+
+
+class Instrumentation:
+    """
+    Times every request and every SQL statement it runs. Statements are
+    timed on the engine's cursor events, so raw text() SQL is covered; the
+    per-request totals land in Metrics from teardown_request, which also
+    runs for requests that end in an exception (counted as 500). Statements
+    slower than SLOW_QUERY_MS are logged with the route that ran them.
+    Template renders are timed on Flask's render signals, per route and
+    template.
+    """
+
+    def __init__(self, app=None):
+        self.metrics = Metrics()
+        self.slow_query_seconds = None
+        self.server_timing = False
+        self.logger = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        slow_ms = app.config["SLOW_QUERY_MS"]
+        self.slow_query_seconds = slow_ms / 1000 if slow_ms else None
+        self.server_timing = app.config["SERVER_TIMING_HEADER"]
+        self.logger = app.logger
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+        # On the Engine class, so the primary and every replica bind are
+        # covered, including engines created after this call
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(Engine, "handle_error", self._handle_error)
+
+        # Sent by render_template / stream_template around template.render(),
+        # so the time excludes loading (and compiling) the template
+        before_render_template.connect(self._before_render, app, weak=False)
+        template_rendered.connect(self._after_render, app, weak=False)
+
+    # ---------- Flask ----------
+    def _before_request(self):
+        g.instrument_start = time.perf_counter()
+        g.instrument_sql = []
+        g.instrument_render = 0.0
+
+    def _after_request(self, response):
+        # Recorded in teardown; a view that raised never gets here
+        start = g.get("instrument_start")
+        if start is None:
+            return response
+        g.instrument_status = response.status_code
+
+        elapsed = time.perf_counter() - start
+        statements = g.instrument_sql
+        if self.server_timing:
+            sql_ms = sum(statements) * 1000
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={sql_ms:.2f};desc="{len(statements)} queries", '
+                f"tpl;dur={g.instrument_render * 1000:.2f}, "
+                f"total;dur={elapsed * 1000:.2f}"
+            )
+        return response
+
+    def _teardown_request(self, exc):
+        start = g.pop("instrument_start", None)
+        if start is None:
+            return
+
+        status = g.get("instrument_status")
+        if status is None or exc is not None:
+            status = 500
+        self.metrics.record_request(
+            _route(), request.method, status,
+            time.perf_counter() - start, g.instrument_sql
+        )
+
+    # ---------- Templates ----------
+    def _before_render(self, sender, template, context, **extra):
+        g.setdefault("instrument_render_start", []).append(time.perf_counter())
+
+    def _after_render(self, sender, template, context, **extra):
+        starts = g.get("instrument_render_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+
+        in_request = has_request_context() and "instrument_render" in g
+        self.metrics.record_template(
+            _route() if in_request else NO_ROUTE, template.name or "<string>", elapsed
+        )
+        # Only outermost renders count toward the request total
+        if in_request and not starts:
+            g.instrument_render += elapsed
+
+    # ---------- SQLAlchemy ----------
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("instrument_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["instrument_start"].pop()
+
+        in_request = has_request_context() and "instrument_sql" in g
+        if in_request:
+            g.instrument_sql.append(elapsed)
+        else:
+            self.metrics.record_statement(NO_ROUTE, elapsed)
+
+        if self.slow_query_seconds is not None and elapsed >= self.slow_query_seconds:
+            self._log_slow(_route() if in_request else NO_ROUTE, statement, elapsed, executemany)
+
+    def _handle_error(self, exception_context):
+        # A statement that raises never reaches _after_cursor_execute; drop
+        # its start time, or it stays on the pooled connection for good
+        conn = exception_context.connection
+        if conn is None or exception_context.statement is None:
+            return
+        starts = conn.info.get("instrument_start")
+        if starts:
+            starts.pop()
+
+    def _log_slow(self, route, statement, elapsed, executemany):
+        self.metrics.record_slow(route)
+        # Parameters are left out: they carry emails and password hashes
+        sql = _WHITESPACE_RE.sub(" ", statement).strip()[:SLOW_QUERY_LOG_CHARS]
+        self.logger.warning(
+            "Slow query (%.1f ms%s) on %s: %s",
+            elapsed * 1000, ", executemany" if executemany else "", route, sql
+        )
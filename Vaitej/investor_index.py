@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import defaultdict
+
+from sqlalchemy import text
+
+from focus import FOCUS_FIELDS, investor_focus
+from matching import ELIGIBLE_INVESTORS_SQL, InvestorFrame
+
+INDEXED_FIELDS = [field for field, _, _ in FOCUS_FIELDS]
+
+ELIGIBLE_INVESTOR_SQL = text("""
+    SELECT
+        ip.id,
+        ip.stage_token_ids,
+        ip.sector_token_ids,
+        ip.geography_token_ids,
+        ip.typical_check_min,
+        ip.typical_check_max,
+        ip.verification_status,
+        ip.activity_status
+    FROM investor_profiles ip
+    WHERE ip.id = :iid
+      AND ip.activity_status = 'active'
+      AND ip.verification_status != 'rejected'
+""")
+
+
+class InvestorIndex:
+    """
+    In-process inverted index of eligible investors.
+
+    Maps stage / sector / country token ids (see focus.py) to investor ids so
+    matching only scores investors that can clear the scoring model's
+    threshold.
+    Every worker keeps its own copy; max_age bounds how stale a copy can
+    get when another worker registers or edits an investor.
+    """
+
+    def __init__(self, model, max_age=300):
+        self.model = model
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._built_at = None
+        self._rows = {}
+        self._postings = {field: defaultdict(set) for field in INDEXED_FIELDS}
+
+    # -------------------------------------------------
+    # BUILD / MAINTAIN
+    # -------------------------------------------------
+    def build(self, session):
+        rows = session.execute(ELIGIBLE_INVESTORS_SQL).mappings().all()
+
+        with self._lock:
+            self._rows = {}
+            self._postings = {f: defaultdict(set) for f in INDEXED_FIELDS}
+            for row in rows:
+                self._add(dict(row))
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self, session):
+        with self._lock:
+            stale = (
+                self._built_at is None
+                or time.monotonic() - self._built_at > self.max_age
+            )
+        if stale:
+            self.build(session)
+
+    def refresh(self, session, investor_id):
+        """
+        Re-read one investor after it is created or its profile changes.
+
+        Returns the eligible row, or None if the investor dropped out.
+        """
+        row = session.execute(
+            ELIGIBLE_INVESTOR_SQL, {"iid": investor_id}
+        ).mappings().first()
+
+        with self._lock:
+            self._remove(investor_id)
+            if row:
+                row = dict(row)
+                self._add(row)
+        return row
+
+    def remove(self, investor_id):
+        with self._lock:
+            self._remove(investor_id)
+
+    def _add(self, row):
+        row["focus"] = investor_focus(row)
+        self._rows[row["id"]] = row
+        for field, ids in row["focus"].items():
+            for token_id in ids:
+                self._postings[field][token_id].add(row["id"])
+
+    def _remove(self, investor_id):
+        row = self._rows.pop(investor_id, None)
+        if row is None:
+            return
+        for field, token_ids in row["focus"].items():
+            postings = self._postings[field]
+            for token_id in token_ids:
+                ids = postings.get(token_id)
+                if ids is None:
+                    continue
+                ids.discard(investor_id)
+                if not ids:
+                    del postings[token_id]
+
+    # -------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------
+    def __len__(self):
+        return len(self._rows)
+
+    def candidates(self, founder, pitch_score):
+        """Investors that can reach the model's threshold for this founder."""
+        model = self.model
+        with self._lock:
+            # Points an investor can earn without any stage / sector /
+            # geography fit. If that alone clears the bar, nothing can
+            # be pruned.
+            untokenized = (
+                model.weights["check_size"]
+                + model.weights["verified"]
+                + model.weights["active"]
+                + model.pitch_points(pitch_score)
+            )
+            if untokenized >= model.threshold:
+                return list(self._rows.values())
+
+            ids = set()
+            for field in INDEXED_FIELDS:
+                postings = self._postings[field]
+                for token_id in founder["focus"][field]:
+                    ids |= postings.get(token_id, set())
+            return [self._rows[iid] for iid in ids]
+
+    def frame_for(self, session, founder, pitch_score):
+        self.ensure_fresh(session)
+        return InvestorFrame(self.candidates(founder, pitch_score))
@@ -0,0 +1,372 @@
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+FINISHED_STATUSES = (DONE, FAILED)
+
+
+# -------------------------------------------------
+# JOB STORES
+# -------------------------------------------------
+# claim(key) -> (job, created):
+#   no job, or a finished one  -> a new QUEUED job, created
+#   QUEUED                     -> that job; it has not read its inputs yet
+#   RUNNING                    -> that job, flagged to run once more when
+#                                 it finishes, since it may have read the
+#                                 inputs from before this submit
+# finish(key, status, error) records the outcome, or puts a flagged job
+# back to QUEUED and returns True so the queue runs it again.
+# touch(keys) refreshes updated_at of those still active, so a live job is
+# never mistaken for one a dead worker left behind.
+#
+# Finished jobs are kept for result_ttl seconds so pages can show them,
+# then swept out.
+class InMemoryJobStore:
+    """Job state for a single process (local runs, one worker)."""
+
+    def __init__(self, result_ttl=3600):
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._swept_at = time.time()
+
+    def claim(self, key):
+        with self._lock:
+            now = time.time()
+            self._sweep(now)
+
+            job = self._jobs.get(key)
+            if job and job["status"] == QUEUED:
+                return dict(job), False
+            if job and job["status"] == RUNNING:
+                job["rerun"] = True
+                return dict(job), False
+
+            job = {
+                "key": key,
+                "status": QUEUED,
+                "error": None,
+                "rerun": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            self._jobs[key] = job
+            return dict(job), True
+
+    def update(self, key, status, error=None):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job:
+                job.update(status=status, error=error, updated_at=time.time())
+
+    def finish(self, key, status, error=None):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return False
+            if job["rerun"]:
+                job.update(status=QUEUED, error=None, rerun=False, updated_at=time.time())
+                return True
+            job.update(status=status, error=error, updated_at=time.time())
+            return False
+
+    def touch(self, keys):
+        with self._lock:
+            now = time.time()
+            for key in keys:
+                job = self._jobs.get(key)
+                if job and job["status"] in ACTIVE_STATUSES:
+                    job["updated_at"] = now
+
+    def get(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            return dict(job) if job else None
+
+    def _sweep(self, now):
+        # At most once per result_ttl, so claim() stays O(1) amortized
+        if now - self._swept_at < self.result_ttl:
+            return
+        self._swept_at = now
+        cutoff = now - self.result_ttl
+        for key in [
+            k for k, job in self._jobs.items()
+            if job["status"] in FINISHED_STATUSES and job["updated_at"] < cutoff
+        ]:
+            del self._jobs[key]
+
+
+class SQLiteJobStore:
+    """Job state shared by every worker process on one host."""
+
+    # Finished jobs are swept on every SWEEP_EVERY-th claim
+    SWEEP_EVERY = 1000
+
+    def __init__(self, path, stale_after=600, result_ttl=3600):
+        self.path = path
+        # A job still "active" this long after its last heartbeat (see
+        # JobQueue) belongs to a dead worker
+        self.stale_after = stale_after
+        self.result_ttl = result_ttl
+        self._claims = 0
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS match_jobs (
+                    key TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    rerun INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            # Store files created before the rerun flag existed
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(match_jobs)")]
+            if "rerun" not in columns:
+                conn.execute(
+                    "ALTER TABLE match_jobs ADD COLUMN rerun INTEGER NOT NULL DEFAULT 0"
+                )
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # One short-lived connection per call keeps the store thread-safe
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _job(self, row):
+        job = dict(row)
+        job["rerun"] = bool(job["rerun"])
+        return job
+
+    def claim(self, key):
+        self._claims += 1
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            if self._claims % self.SWEEP_EVERY == 0:
+                conn.execute(
+                    "DELETE FROM match_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                    FINISHED_STATUSES + (now - self.result_ttl,)
+                )
+
+            row = conn.execute(
+                "SELECT * FROM match_jobs WHERE key = ?", (key,)
+            ).fetchone()
+
+            if (
+                row
+                and row["status"] in ACTIVE_STATUSES
+                and now - row["updated_at"] < self.stale_after
+            ):
+                if row["status"] == RUNNING:
+                    conn.execute("UPDATE match_jobs SET rerun = 1 WHERE key = ?", (key,))
+                conn.execute("COMMIT")
+                return self._job(row), False
+
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO match_jobs
+                (key, status, error, rerun, created_at, updated_at)
+                VALUES (?, ?, NULL, 0, ?, ?)
+                """,
+                (key, QUEUED, now, now)
+            )
+            conn.execute("COMMIT")
+            return {
+                "key": key,
+                "status": QUEUED,
+                "error": None,
+                "rerun": False,
+                "created_at": now,
+                "updated_at": now,
+            }, True
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def update(self, key, status, error=None):
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                UPDATE match_jobs
+                SET status = ?, error = ?, updated_at = ?
+                WHERE key = ?
+                """,
+                (status, error, time.time(), key)
+            )
+        finally:
+            conn.close()
+
+    def finish(self, key, status, error=None):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT rerun FROM match_jobs WHERE key = ?", (key,)
+            ).fetchone()
+            rerun = bool(row and row["rerun"])
+            if rerun:
+                conn.execute(
+                    """
+                    UPDATE match_jobs
+                    SET status = ?, error = NULL, rerun = 0, updated_at = ?
+                    WHERE key = ?
+                    """,
+                    (QUEUED, time.time(), key)
+                )
+            else:
+                conn.execute(
+                    """
+                    UPDATE match_jobs
+                    SET status = ?, error = ?, updated_at = ?
+                    WHERE key = ?
+                    """,
+                    (status, error, time.time(), key)
+                )
+            conn.execute("COMMIT")
+            return rerun
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def touch(self, keys):
+        keys = list(keys)
+        conn = self._connect()
+        try:
+            conn.execute(
+                f"""
+                UPDATE match_jobs SET updated_at = ?
+                WHERE status IN (?, ?)
+                  AND key IN ({", ".join("?" * len(keys))})
+                """,
+                (time.time(), *ACTIVE_STATUSES, *keys)
+            )
+        finally:
+            conn.close()
+
+    def get(self, key):
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT * FROM match_jobs WHERE key = ?", (key,)
+            ).fetchone()
+            return self._job(row) if row else None
+        finally:
+            conn.close()
+
+
+# -------------------------------------------------
+# QUEUE
+# -------------------------------------------------
+class JobQueue:
+    """
+    Runs jobs on a thread pool, at most one active job per key.
+
+    A second submit for a key that is still queued returns the existing
+    job instead of scheduling the work again. A submit while the job is
+    running makes it run once more after it finishes, so changes made
+    mid-run are never dropped.
+
+    Every heartbeat_interval seconds a heartbeat thread touches the jobs
+    this queue has queued or running, however long they take, so other
+    workers sharing the store never treat them as stale. Keep it well
+    under the store's stale_after.
+    """
+
+    def __init__(self, store, max_workers=4, heartbeat_interval=60):
+        self.store = store
+        self.heartbeat_interval = heartbeat_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="job"
+        )
+        self._idle = threading.Condition()
+        self._in_flight = 0
+        # key -> runs of it in flight; a key can be claimed again between
+        # one run's finish() and the end of its _run()
+        self._active = Counter()
+        self._stopped = threading.Event()
+        self._heartbeat = None
+
+    def submit(self, key, fn, *args):
+        job, created = self.store.claim(key)
+        if created:
+            with self._idle:
+                self._in_flight += 1
+                self._active[key] += 1
+                self._ensure_heartbeat()
+            self._executor.submit(self._run, key, fn, args)
+        return job
+
+    def _ensure_heartbeat(self):
+        if self._heartbeat is None:
+            self._heartbeat = threading.Thread(
+                target=self._beat, name="job-heartbeat", daemon=True
+            )
+            self._heartbeat.start()
+
+    def _beat(self):
+        while not self._stopped.wait(self.heartbeat_interval):
+            with self._idle:
+                keys = list(self._active)
+            if not keys:
+                continue
+            try:
+                self.store.touch(keys)
+            except Exception:
+                pass  # e.g. the store is locked; the next beat retries
+
+    def _run(self, key, fn, args):
+        try:
+            while True:
+                self.store.update(key, RUNNING)
+                try:
+                    fn(*args)
+                except Exception as e:
+                    rerun = self.store.finish(key, FAILED, error=str(e))
+                else:
+                    rerun = self.store.finish(key, DONE)
+                if not rerun:
+                    break
+        finally:
+            with self._idle:
+                self._in_flight -= 1
+                self._active[key] -= 1
+                if not self._active[key]:
+                    del self._active[key]
+                self._idle.notify_all()
+
+    def wait_idle(self, timeout=None):
+        """Block until every job this queue started has finished."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def status(self, key):
+        return self.store.get(key)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+        self._stopped.set()
+
+
+def make_job_store(path=None, result_ttl=3600):
+    if path:
+        return SQLiteJobStore(path, result_ttl=result_ttl)
+    return InMemoryJobStore(result_ttl=result_ttl)
@@ -0,0 +1,80 @@
+from sqlalchemy import text
+
+MATCH_STATUSES = ("new", "interested", "saved", "declined")
+
+# Matches are ranked by (match_score, id), highest first. A cursor is the
+# last row of a page; the next page seeks strictly past it, so every page
+# costs one index range scan however deep it is. A status filter scans
+# idx_matches_founder_status_score; the default listing scans
+# idx_matches_founder_score (migration 007) and skips declined rows.
+LIST_MATCHES_SQL = """
+    SELECT
+        m.id AS match_id,
+        m.match_score,
+        m.status,
+        m.ai_reason,
+        u.full_name AS investor_name,
+        ip.fund_name,
+        ip.investment_stage,
+        ip.sector_focus,
+        ip.verification_status
+    FROM matches m
+    JOIN investor_profiles ip ON m.investor_id = ip.id
+    JOIN users u ON ip.user_id = u.id
+    WHERE m.founder_id = :fid
+      AND {status_filter}
+      AND m.match_score >= :min_score
+      {seek}
+    ORDER BY m.match_score DESC, m.id DESC
+    LIMIT :limit
+"""
+
+SEEK_SQL = """
+      AND (
+          m.match_score < :after_score
+          OR (m.match_score = :after_score AND m.id < :after_id)
+      )
+"""
+
+
+def encode_cursor(row):
+    return f"{row.match_score}-{row.match_id}"
+
+
+def decode_cursor(cursor):
+    """(score, id) from a cursor string, or None if it is malformed."""
+    try:
+        score, match_id = cursor.split("-", 1)
+        return int(score), int(match_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def list_matches(session, founder_id, status=None, min_score=0,
+                 after=None, limit=10):
+    """
+    One page of a founder's matches and the cursor for the next page.
+
+    With no status filter, declined matches are hidden.
+    """
+    params = {"fid": founder_id, "min_score": min_score, "limit": limit + 1}
+
+    if status:
+        status_filter = "m.status = :status"
+        params["status"] = status
+    else:
+        status_filter = "m.status != 'declined'"
+
+    seek = ""
+    if after:
+        params["after_score"], params["after_id"] = after
+        seek = SEEK_SQL
+
+    rows = session.execute(
+        text(LIST_MATCHES_SQL.format(status_filter=status_filter, seek=seek)),
+        params
+    ).fetchall()
+
+    # The extra row only tells us whether another page exists
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
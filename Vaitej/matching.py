@@ -0,0 +1,264 @@
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy import text
+
+from focus import investor_focus
+from readiness import founder_readiness
+from scoring_model import (
+    ACTIVE,
+    CHECK_FIT,
+    GEO_FIT,
+    SECTOR_FIT,
+    STAGE_FIT,
+    VERIFIED
+)
+
+# Criteria decided by focus token overlap, keyed by founder field
+FOCUS_BITS = [("stage", STAGE_FIT), ("sector", SECTOR_FIT), ("country", GEO_FIT)]
+
+
+def match_bits(founder, investor):
+    """The criteria (and active) bits one founder / investor pair earns."""
+    # Focus fits compare token id sets (see focus.py); founder rows carry
+    # theirs under "focus", from founder_focus()
+    wants = founder["focus"]
+    offers = investor_focus(investor)
+    bits = 0
+
+    for field, bit in FOCUS_BITS:
+        if not wants[field].isdisjoint(offers[field]):
+            bits |= bit
+
+    if (
+        investor["typical_check_min"]
+        and investor["typical_check_max"]
+        and founder["min_check_size"]
+    ):
+        if investor["typical_check_min"] <= founder["min_check_size"] <= investor["typical_check_max"]:
+            bits |= CHECK_FIT
+
+    if investor["verification_status"] == "verified":
+        bits |= VERIFIED
+
+    if investor["activity_status"] == "active":
+        bits |= ACTIVE
+
+    return bits
+
+
+def calculate_match_score(founder, investor, pitch_score, model):
+    # Points, reasons and pitch boost all come from the scoring model
+    return model.evaluate(match_bits(founder, investor), pitch_score)
+
+
+# -------------------------------------------------
+# BATCH SCORING
+# -------------------------------------------------
+# Each investor gets the same bits as match_bits, a column at a time;
+# the model's lookup tables turn them into scores and reasons without
+# touching Python per row.
+ELIGIBLE_INVESTORS_SQL = text("""
+    SELECT
+        ip.id,
+        ip.stage_token_ids,
+        ip.sector_token_ids,
+        ip.geography_token_ids,
+        ip.typical_check_min,
+        ip.typical_check_max,
+        ip.verification_status,
+        ip.activity_status
+    FROM investor_profiles ip
+    WHERE ip.activity_status = 'active'
+      AND ip.verification_status != 'rejected'
+""")
+
+
+class InvestorFrame:
+    """Column-oriented snapshot of investor rows for batch scoring."""
+
+    def __init__(self, investors):
+        investors = list(investors)
+
+        self.ids = np.array([i["id"] for i in investors], dtype=np.int64)
+
+        # Per focus field: token id -> positions of the investors holding it
+        postings = {field: defaultdict(list) for field, _ in FOCUS_BITS}
+        for idx, investor in enumerate(investors):
+            for field, ids in investor_focus(investor).items():
+                for token_id in ids:
+                    postings[field][token_id].append(idx)
+        self.postings = {
+            field: {t: np.array(rows, dtype=np.int64) for t, rows in by_token.items()}
+            for field, by_token in postings.items()
+        }
+
+        self.check_min = np.array(
+            [float(i["typical_check_min"] or 0) for i in investors]
+        )
+        self.check_max = np.array(
+            [float(i["typical_check_max"] or 0) for i in investors]
+        )
+
+        self.verified = np.array(
+            [i["verification_status"] == "verified" for i in investors],
+            dtype=bool
+        )
+        self.active = np.array(
+            [i["activity_status"] == "active" for i in investors],
+            dtype=bool
+        )
+
+    @classmethod
+    def load(cls, session):
+        return cls(session.execute(ELIGIBLE_INVESTORS_SQL).mappings().all())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def match_bits(self, founder):
+        masks = np.zeros(len(self), dtype=np.int64)
+
+        # Set intersection: only investors sharing a founder token are touched
+        for field, bit in FOCUS_BITS:
+            postings = self.postings[field]
+            for token_id in founder["focus"][field]:
+                rows = postings.get(token_id)
+                if rows is not None:
+                    masks[rows] |= bit
+
+        if founder["min_check_size"]:
+            check = float(founder["min_check_size"])
+            hit = (
+                (self.check_min != 0)
+                & (self.check_max != 0)
+                & (self.check_min <= check)
+                & (check <= self.check_max)
+            )
+            masks |= hit * CHECK_FIT
+
+        masks |= self.verified * VERIFIED
+        masks |= self.active * ACTIVE
+        return masks
+
+    def score(self, founder, pitch_score, model):
+        """Scores and lookup codes for every investor in the frame."""
+        return model.evaluate_many(self.match_bits(founder), pitch_score)
+
+    def match_rows(self, founder, pitch_score, model, threshold=None):
+        """Upsert rows for every investor scoring at or above threshold."""
+        if threshold is None:
+            threshold = model.threshold
+        scores, codes = self.score(founder, pitch_score, model)
+
+        keep = np.flatnonzero(scores >= threshold)
+        return [
+            {
+                "fid": founder["id"],
+                "iid": int(self.ids[idx]),
+                "score": int(scores[idx]),
+                "status": "new",
+                "reason": model.reasons[codes[idx]],
+                "model": model.version
+            }
+            for idx in keep
+        ]
+
+
+# -------------------------------------------------
+# INCREMENTAL REMATCH
+# -------------------------------------------------
+# Match inputs plus the profile fields readiness.py needs for the
+# founder's pitch score
+MATCH_FOUNDER_SELECT = """
+    SELECT f.id, f.stage, f.sector, f.min_check_size,
+           u.country,
+           u.full_name, u.email, u.phone,
+           f.company_name, f.founding_year,
+           f.business_model, f.actively_raising
+    FROM founder_profiles f
+    JOIN users u ON f.user_id = u.id
+"""
+
+FOUNDERS_SQL = text(MATCH_FOUNDER_SELECT)
+FOUNDER_SQL = text(MATCH_FOUNDER_SELECT + "WHERE f.user_id = :uid")
+
+# Founders shown to investors: only those actively raising, the founder
+# side's counterpart of ELIGIBLE_INVESTORS_SQL. Registration stores the
+# flag as "1"; older rows and imports may say "yes".
+RAISING_VALUES = ("1", "yes", "y", "true")
+RAISING_FOUNDERS_SQL = text(
+    MATCH_FOUNDER_SELECT
+    + "WHERE LOWER(f.actively_raising) IN ('1', 'yes', 'y', 'true')"
+)
+
+
+def is_raising(founder):
+    return str(founder["actively_raising"] or "").lower() in RAISING_VALUES
+
+
+def match_pitch_score(founder, deck_scores):
+    # A scored pitch deck wins; otherwise profile-based readiness
+    score = deck_scores.get(founder["id"])
+    if score is None:
+        score = founder_readiness(founder).pitch_score
+    return score
+
+
+def investor_match_rows(investor, founders, pitch_score_for, model):
+    """Upsert rows for one investor scored against many founders."""
+    rows = []
+    for founder in founders:
+        score, reason = calculate_match_score(
+            founder, investor, pitch_score_for(founder), model
+        )
+        if score < model.threshold:
+            continue
+        rows.append({
+            "fid": founder["id"],
+            "iid": investor["id"],
+            "score": score,
+            "status": "new",
+            "reason": reason,
+            "model": model.version
+        })
+    return rows
+
+
+# -------------------------------------------------
+# BULK UPSERT
+# -------------------------------------------------
+MYSQL_UPSERT_SQL = text("""
+    INSERT INTO matches
+    (founder_id, investor_id, match_score, status, ai_reason, model_version)
+    VALUES
+    (:fid, :iid, :score, :status, :reason, :model)
+    ON DUPLICATE KEY UPDATE
+        match_score = VALUES(match_score),
+        ai_reason = VALUES(ai_reason),
+        model_version = VALUES(model_version),
+        updated_at = NOW()
+""")
+
+SQLITE_UPSERT_SQL = text("""
+    INSERT INTO matches
+    (founder_id, investor_id, match_score, status, ai_reason, model_version)
+    VALUES
+    (:fid, :iid, :score, :status, :reason, :model)
+    ON CONFLICT (founder_id, investor_id) DO UPDATE SET
+        match_score = excluded.match_score,
+        ai_reason = excluded.ai_reason,
+        model_version = excluded.model_version,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
+
+def upsert_matches(session, rows):
+    """Write all rows in one executemany (a multi-row INSERT on PyMySQL)."""
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    statement = SQLITE_UPSERT_SQL if dialect == "sqlite" else MYSQL_UPSERT_SQL
+    session.execute(statement, rows)
+    return len(rows)
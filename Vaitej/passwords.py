@@ -0,0 +1,107 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """Every hashing slot is taken; the caller should ask the user to retry."""
+
+
+class PasswordHasher:
+    """
+    Password hashing on a small process pool, so the deliberately slow
+    hashes run outside the web worker and never hold its GIL.
+
+    At most max_workers + max_queued hashes are admitted at once; beyond
+    that, callers wait up to queue_timeout for a slot and then get
+    HasherBusy instead of piling more work onto the CPU. With max_workers
+    set to 0 hashing runs inline, which is handy for scripts and local runs.
+
+    Pool processes come from a forkserver, not a fork of the web worker:
+    by the time the pool exists the worker runs job, flusher and DB pool
+    threads, and a fork could copy one of their locks while it is held.
+    If a pool process dies (OOM kill, segfault) the pool is replaced and
+    the hash retried once.
+    """
+
+    def __init__(self, method, max_workers=2, max_queued=8, queue_timeout=2.0):
+        self.method = method
+        self.max_workers = max_workers
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_queued)
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+
+    def start(self):
+        """Create the pool now rather than on the first login."""
+        if self.max_workers:
+            self._executor()
+
+    def _executor(self):
+        # One pool per process: a pool inherited through a fork (e.g. a
+        # preloaded app under gunicorn) has no live threads, so replace it
+        with self._pool_lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("forkserver")
+                )
+                self._pool_pid = os.getpid()
+                atexit.register(self._pool.shutdown, wait=False)
+            return self._pool
+
+    def _discard(self, pool):
+        # A broken pool fails every later submit, so drop it; the next
+        # _executor() call starts a fresh one
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def _submit(self, fn, *args):
+        pool = self._executor()
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._discard(pool)
+            raise
+
+    def _run(self, fn, *args):
+        if not self.max_workers:
+            return fn(*args)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise HasherBusy()
+        try:
+            try:
+                return self._submit(fn, *args)
+            except BrokenProcessPool:
+                pass
+            try:
+                return self._submit(fn, *args)
+            except BrokenProcessPool:
+                raise HasherBusy()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def hash_many(self, passwords, chunksize=16):
+        """Hash a whole batch across the pool, for offline jobs like imports."""
+        if not self.max_workers:
+            return [generate_password_hash(p, self.method) for p in passwords]
+        return list(self._executor().map(
+            generate_password_hash, passwords, repeat(self.method),
+            chunksize=chunksize
+        ))
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
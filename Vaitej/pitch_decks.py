@@ -0,0 +1,127 @@
+import hashlib
+import os
+import tempfile
+
+from flask import Request
+from sqlalchemy import text
+from werkzeug.exceptions import RequestEntityTooLarge
+
+SCORING_PENDING = "pending"
+SCORING_DONE = "scored"
+SCORING_FAILED = "failed"
+
+
+# -------------------------------------------------
+# STREAMING UPLOAD
+# -------------------------------------------------
+class HashingUpload:
+    """
+    Werkzeug's container for one uploaded file: a temp file in directory
+    that hashes and counts bytes as the multipart parser writes them.
+
+    Past max_bytes it removes itself and raises RequestEntityTooLarge.
+    keep(path) moves the finished file into place; anything not kept is
+    deleted on close(), which Flask calls when the request ends.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self.path = tempfile.mkstemp(suffix=".part", dir=directory)
+        self._file = os.fdopen(fd, "w+b")
+        self._kept = False
+
+    def write(self, data):
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.close()
+            raise RequestEntityTooLarge()
+        self._digest.update(data)
+        return self._file.write(data)
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
+
+    def keep(self, path):
+        self._file.close()
+        os.replace(self.path, path)
+        self._kept = True
+
+    def close(self):
+        self._file.close()
+        if not self._kept and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __getattr__(self, name):
+        # read / seek / tell / ... for FileStorage
+        return getattr(self._file, name)
+
+
+class UploadRequest(Request):
+    """
+    Request whose multipart file fields land in a HashingUpload while the
+    body is parsed, so an upload is written to disk once and its hash is
+    ready when the view runs. Configure with upload_dir / max_upload_bytes.
+    """
+
+    upload_dir = None
+    max_upload_bytes = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Also tracked outside request.files, so a parse that fails
+        # half-way still has its temp files removed
+        self._uploads = []
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        upload = HashingUpload(self.upload_dir, self.max_upload_bytes)
+        self._uploads.append(upload)
+        return upload
+
+    def close(self):
+        super().close()
+        for upload in self._uploads:
+            upload.close()
+
+
+def find_duplicate_deck(session, founder_id, content_hash):
+    return session.execute(
+        text("""
+            SELECT id, file_url, scoring_status
+            FROM pitch_decks
+            WHERE founder_id = :fid
+              AND content_hash = :hash
+            LIMIT 1
+        """),
+        {"fid": founder_id, "hash": content_hash}
+    ).fetchone()
+
+
+# -------------------------------------------------
+# BACKGROUND SCORING
+# -------------------------------------------------
+def set_deck_score(session, deck_id, score):
+    session.execute(
+        text("""
+            UPDATE pitch_decks
+            SET deck_score = :score, scoring_status = :status
+            WHERE id = :did
+        """),
+        {"score": score, "status": SCORING_DONE, "did": deck_id}
+    )
+
+
+def set_deck_scoring_failed(session, deck_id):
+    session.execute(
+        text("UPDATE pitch_decks SET scoring_status = :status WHERE id = :did"),
+        {"status": SCORING_FAILED, "did": deck_id}
+    )
+
+
+def set_deck_scoring_pending(session, deck_id):
+    session.execute(
+        text("UPDATE pitch_decks SET scoring_status = :status WHERE id = :did"),
+        {"status": SCORING_PENDING, "did": deck_id}
+    )
@@ -0,0 +1,73 @@
+import threading
+import time
+
+
+class SlidingWindowLimiter:
+    """
+    Approximate sliding-window rate limit: at most `limit` hits per key in
+    any `window` seconds.
+
+    Only two fixed windows are kept, the current and the previous one, as
+    dicts of hash(key) -> count. The previous window's count is weighted by
+    how much of it still overlaps the sliding window. Rolling over drops
+    every older key at once, so nothing needs sweeping, and memory is
+    bounded by the keys seen in the last two windows. Past max_keys in the
+    current window, the least recently hit key is evicted, so a flood of
+    fresh keys can't switch the limit off for new ones. Keys are stored as
+    their hash, not as the email or address itself.
+
+    Counts live in the worker process: with N workers a client that is
+    spread across them gets up to N * limit attempts.
+    """
+
+    def __init__(self, limit, window, max_keys=100000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._window_start = self._current_window_start()
+        self._current = {}
+        self._previous = {}
+
+    def _current_window_start(self):
+        now = time.monotonic()
+        return now - (now % self.window)
+
+    def _roll(self):
+        start = self._current_window_start()
+        if start == self._window_start:
+            return
+        # Skipped a whole window: nothing from before it still counts
+        if start - self._window_start > self.window:
+            self._previous = {}
+        else:
+            self._previous = self._current
+        self._current = {}
+        self._window_start = start
+
+    def _estimate(self, h, now):
+        overlap = 1 - (now - self._window_start) / self.window
+        return self._current.get(h, 0) + self._previous.get(h, 0) * overlap
+
+    def hit(self, key):
+        """Count one attempt for key. False once key is over its limit."""
+        if not self.limit:
+            return True
+
+        h = hash(key)
+        with self._lock:
+            self._roll()
+            if self._estimate(h, time.monotonic()) >= self.limit:
+                return False
+
+            # Re-inserted on every hit, so the dict stays in LRU order
+            self._current[h] = self._current.pop(h, 0) + 1
+            if len(self._current) > self.max_keys:
+                del self._current[next(iter(self._current))]
+            return True
+
+    def reset(self, key):
+        h = hash(key)
+        with self._lock:
+            self._current.pop(h, None)
+            self._previous.pop(h, None)
@@ -0,0 +1,70 @@
+from collections import namedtuple
+from functools import lru_cache
+
+# Profile fields readiness depends on. The memo is keyed on their values,
+# so any profile edit that touches one of them is a new version with its
+# own entry, and untouched profiles are never recomputed.
+READINESS_FIELDS = (
+    "full_name", "email", "phone", "country",
+    "company_name", "founding_year", "stage",
+    "sector", "business_model", "actively_raising",
+)
+
+Readiness = namedtuple(
+    "Readiness",
+    ["completion_percent", "missing_fields", "pitch_score", "pitch_label"]
+)
+
+
+def founder_readiness(profile):
+    """Readiness for any mapping or row carrying READINESS_FIELDS."""
+    if hasattr(profile, "_mapping"):
+        profile = profile._mapping
+    return _readiness(*(profile[f] for f in READINESS_FIELDS))
+
+
+@lru_cache(maxsize=65536)
+def _readiness(full_name, email, phone, country, company_name,
+               founding_year, stage, sector, business_model,
+               actively_raising):
+    # ------------------------------------------------
+    # PROFILE COMPLETION
+    # ------------------------------------------------
+    required_fields = [
+        full_name, email, phone, country,
+        company_name, founding_year, stage,
+        sector, business_model
+    ]
+    completion_percent = int(
+        (sum(1 for f in required_fields if f) / len(required_fields)) * 100
+    )
+
+    missing_fields = []
+    if not phone:
+        missing_fields.append("Phone number")
+    if not sector:
+        missing_fields.append("Sector")
+    if not business_model:
+        missing_fields.append("Business model")
+
+    # ------------------------------------------------
+    # PITCH READINESS
+    # ------------------------------------------------
+    pitch_score = 0
+    if company_name: pitch_score += 10
+    if stage: pitch_score += 15
+    if sector: pitch_score += 15
+    if business_model: pitch_score += 15
+    if actively_raising: pitch_score += 15
+    if founding_year: pitch_score += 10
+    if completion_percent >= 80: pitch_score += 20
+
+    pitch_label = (
+        "Investor-Ready" if pitch_score >= 80
+        else "Good" if pitch_score >= 50
+        else "Needs Work"
+    )
+
+    return Readiness(
+        completion_percent, tuple(missing_fields), pitch_score, pitch_label
+    )
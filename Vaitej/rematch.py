@@ -0,0 +1,298 @@
+"""
+Offline rescoring of every founder / investor pair, for after the match
+weights change.
+
+Founders are split into id-range shards and spread over a process pool.
+Each worker loads the eligible investors into one InvestorFrame when it
+starts, scores whole shards against it and upserts the rows in batches,
+committing each batch so no worker holds write locks for long. Finished
+shards are recorded in a JSON checkpoint, so a crashed run picks up where
+it stopped; upserts are idempotent, so a half-written shard is just redone.
+A checkpoint only resumes under the scoring model version that wrote it.
+
+rescore_stale() is the cheaper path after a model change: it rescores
+only the existing rows written by another model version.
+"""
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.orm import Session
+
+from deck_analysis import latest_deck_scores
+from focus import founder_focus
+from matching import (
+    MATCH_FOUNDER_SELECT,
+    InvestorFrame,
+    calculate_match_score,
+    match_pitch_score,
+    upsert_matches
+)
+
+FOUNDER_IDS_SQL = text("SELECT id FROM founder_profiles ORDER BY id")
+SHARD_FOUNDERS_SQL = text(MATCH_FOUNDER_SELECT + "WHERE f.id BETWEEN :lo AND :hi")
+
+
+# -------------------------------------------------
+# SHARDS + CHECKPOINT
+# -------------------------------------------------
+def plan_shards(founder_ids, shard_size):
+    """[first_id, last_id] ranges of shard_size founders each."""
+    return [
+        [founder_ids[i], founder_ids[min(i + shard_size, len(founder_ids)) - 1]]
+        for i in range(0, len(founder_ids), shard_size)
+    ]
+
+
+class CheckpointMismatch(Exception):
+    """The checkpoint was written under another scoring model version."""
+
+
+def new_state(shards, model_version):
+    # The shard plan is fixed for the life of a run, so a resumed run
+    # covers the same founders even if new ones registered meanwhile
+    return {
+        "shards": shards, "model_version": model_version,
+        "done": [], "founders": 0, "pairs": 0, "rows": 0
+    }
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    # Write-then-rename, so a crash mid-write never leaves a torn file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+# -------------------------------------------------
+# WORKER
+# -------------------------------------------------
+_worker = {}
+
+
+def init_worker(database_uri, model, batch_size):
+    # Runs once per pool process: its own engine, investors loaded once
+    engine = create_engine(database_uri)
+    with Session(engine) as session:
+        frame = InvestorFrame.load(session)
+        deck_scores = latest_deck_scores(session)
+    _worker.update(
+        engine=engine, frame=frame, deck_scores=deck_scores,
+        model=model, batch_size=batch_size
+    )
+
+
+def score_shard(index, lo, hi):
+    """Rescore founders lo..hi. Returns (index, founders, pairs, rows)."""
+    frame = _worker["frame"]
+    deck_scores = _worker["deck_scores"]
+    model = _worker["model"]
+    batch_size = _worker["batch_size"]
+
+    with Session(_worker["engine"]) as session:
+        founders = founder_focus(
+            session,
+            session.execute(SHARD_FOUNDERS_SQL, {"lo": lo, "hi": hi}).mappings().all()
+        )
+
+        rows = 0
+        batch = []
+        for founder in founders:
+            batch.extend(frame.match_rows(
+                founder, match_pitch_score(founder, deck_scores), model
+            ))
+            if len(batch) >= batch_size:
+                rows += upsert_matches(session, batch)
+                session.commit()
+                batch = []
+        rows += upsert_matches(session, batch)
+        session.commit()
+
+    return index, len(founders), len(founders) * len(frame), rows
+
+
+# -------------------------------------------------
+# DRIVER
+# -------------------------------------------------
+def rematch_all(database_uri, model, checkpoint_path, workers=4, shard_size=500,
+                batch_size=5000, restart=False, on_progress=None):
+    """
+    Rescore every founder against every eligible investor.
+
+    Resumes from checkpoint_path unless restart is set, and removes it
+    once every shard is done. Raises CheckpointMismatch when the
+    checkpoint was written under another model version, since its done
+    shards were scored with other weights. on_progress(state, run_pairs,
+    elapsed) is called after each shard. With workers set to 0 shards
+    run inline. Returns the final state plus this run's pairs and seconds.
+    """
+    state = None if restart else load_checkpoint(checkpoint_path)
+    if state is not None and state.get("model_version") != model.version:
+        raise CheckpointMismatch(
+            f"{checkpoint_path} was written by scoring model "
+            f"{state.get('model_version')!r}, not {model.version!r}"
+        )
+    if state is None:
+        engine = create_engine(database_uri)
+        with engine.connect() as conn:
+            founder_ids = conn.execute(FOUNDER_IDS_SQL).scalars().all()
+        engine.dispose()
+        state = new_state(plan_shards(founder_ids, shard_size), model.version)
+        save_checkpoint(checkpoint_path, state)
+
+    done = set(state["done"])
+    pending = [i for i in range(len(state["shards"])) if i not in done]
+
+    run_pairs = 0
+    started = time.perf_counter()
+
+    def record(result):
+        nonlocal run_pairs
+        index, founders, pairs, rows = result
+        state["done"].append(index)
+        state["founders"] += founders
+        state["pairs"] += pairs
+        state["rows"] += rows
+        save_checkpoint(checkpoint_path, state)
+
+        run_pairs += pairs
+        if on_progress:
+            on_progress(state, run_pairs, time.perf_counter() - started)
+
+    if not workers:
+        init_worker(database_uri, model, batch_size)
+        for i in pending:
+            record(score_shard(i, *state["shards"][i]))
+    else:
+        # Not fork: the CLI process already has the app's background
+        # threads (job runner, view buffer) and their locks
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=init_worker,
+            initargs=(database_uri, model, batch_size)
+        )
+        try:
+            futures = [
+                pool.submit(score_shard, i, *state["shards"][i]) for i in pending
+            ]
+            for future in as_completed(futures):
+                record(future.result())
+        finally:
+            # On failure, drop queued shards; the checkpoint has the rest
+            pool.shutdown(cancel_futures=True)
+
+    os.remove(checkpoint_path)
+    return dict(state, run_pairs=run_pairs, seconds=time.perf_counter() - started)
+
+
+# -------------------------------------------------
+# STALE ROWS ONLY
+# -------------------------------------------------
+STALE_MATCHES_SQL = text("""
+    SELECT id, founder_id, investor_id
+    FROM matches
+    WHERE id > :last_id
+      AND (model_version IS NULL OR model_version <> :version)
+    ORDER BY id
+    LIMIT :limit
+""")
+
+MATCH_FOUNDERS_BY_ID_SQL = text(
+    MATCH_FOUNDER_SELECT + "WHERE f.id IN :ids"
+).bindparams(bindparam("ids", expanding=True))
+
+# Like ELIGIBLE_INVESTORS_SQL, but rows for since-deactivated investors
+# are rescored too
+MATCH_INVESTORS_BY_ID_SQL = text("""
+    SELECT
+        ip.id,
+        ip.stage_token_ids,
+        ip.sector_token_ids,
+        ip.geography_token_ids,
+        ip.typical_check_min,
+        ip.typical_check_max,
+        ip.verification_status,
+        ip.activity_status
+    FROM investor_profiles ip
+    WHERE ip.id IN :ids
+""").bindparams(bindparam("ids", expanding=True))
+
+RESCORE_MATCH_SQL = text("""
+    UPDATE matches
+    SET match_score = :score,
+        ai_reason = :reason,
+        model_version = :model,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = :id
+""")
+
+
+def rescore_stale(session, model, batch_size=5000, on_progress=None):
+    """
+    Rescore the existing matches rows scored by any other model version,
+    keeping their status. Rows that now fall below the threshold keep
+    their new, lower score. Pairs that only clear the threshold under
+    the new model have no row yet; rematch_all() creates those.
+
+    Commits per batch, so an interrupted run just continues next time.
+    Returns (rows rescored, seconds).
+    """
+    deck_scores = latest_deck_scores(session)
+    started = time.perf_counter()
+    last_id = 0
+    rescored = 0
+
+    while True:
+        stale = session.execute(STALE_MATCHES_SQL, {
+            "last_id": last_id, "version": model.version, "limit": batch_size
+        }).fetchall()
+        if not stale:
+            break
+        last_id = stale[-1].id
+
+        founders = {
+            f["id"]: f for f in founder_focus(session, session.execute(
+                MATCH_FOUNDERS_BY_ID_SQL, {"ids": list({m.founder_id for m in stale})}
+            ).mappings().all())
+        }
+        investors = {
+            i["id"]: i for i in session.execute(
+                MATCH_INVESTORS_BY_ID_SQL, {"ids": list({m.investor_id for m in stale})}
+            ).mappings().all()
+        }
+
+        updates = []
+        for match in stale:
+            founder = founders.get(match.founder_id)
+            investor = investors.get(match.investor_id)
+            if founder is None or investor is None:
+                continue  # profile deleted; nothing to score against
+            score, reason = calculate_match_score(
+                founder, investor, match_pitch_score(founder, deck_scores), model
+            )
+            updates.append({
+                "id": match.id, "score": score, "reason": reason,
+                "model": model.version
+            })
+
+        if updates:
+            session.execute(RESCORE_MATCH_SQL, updates)
+        session.commit()
+
+        rescored += len(updates)
+        if on_progress:
+            on_progress(rescored, time.perf_counter() - started)
+
+    return rescored, time.perf_counter() - started
@@ -0,0 +1,135 @@
+import json
+import os
+
+import numpy as np
+
+# -------------------------------------------------
+# CRITERIA
+# -------------------------------------------------
+# Each explainable criterion gets one bit; matching.py works out which
+# bits a founder / investor pair earns. Everything else about the score
+# (points, cutoff, pitch boost) comes from a versioned model file.
+STAGE_FIT = 1
+SECTOR_FIT = 2
+CHECK_FIT = 4
+GEO_FIT = 8
+VERIFIED = 16
+
+# (bit, weight name in the model file, reason), in reason order
+CRITERIA = [
+    (STAGE_FIT, "stage", "stage alignment"),
+    (SECTOR_FIT, "sector", "sector alignment"),
+    (CHECK_FIT, "check_size", "check size compatibility"),
+    (GEO_FIT, "geography", "geographic focus"),
+    (VERIFIED, "verified", "verified investor"),
+]
+ACTIVE = 1 << len(CRITERIA)  # active investor: points, but no reason
+
+WEIGHT_NAMES = [name for _, name, _ in CRITERIA] + ["active"]
+
+DEFAULT_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "scoring_models", "v1.json"
+)
+
+
+class ScoringModel:
+    """
+    A match scoring model compiled into lookup tables.
+
+    A pair's criteria bits, its active bit and the founder's pitch tier
+    combine into one code; scores[code] and reasons[code] hold the final
+    score and reason text, so scoring never re-walks the weights.
+    """
+
+    def __init__(self, version, threshold, weights, pitch_boost):
+        self.version = version
+        self.threshold = threshold
+        self.weights = dict(weights)
+
+        # Highest tier first; the implicit last tier scores 0
+        self.tiers = sorted(
+            (
+                (t["min_pitch_score"], t["points"], t.get("reason"))
+                for t in pitch_boost
+            ),
+            key=lambda tier: tier[0],
+            reverse=True
+        )
+        tier_options = self.tiers + [(None, 0, None)]
+
+        self.scores = np.zeros(len(tier_options) * 2 * ACTIVE, dtype=np.int64)
+        self.reasons = [None] * len(self.scores)
+        for tier, (_, boost, boost_reason) in enumerate(tier_options):
+            for bits in range(2 * ACTIVE):
+                code = self.code(bits, tier)
+                self.scores[code] = boost + sum(
+                    self.weights[name] for name in WEIGHT_NAMES
+                    if bits & self.bit(name)
+                )
+                labels = [
+                    label for bit, name, label in CRITERIA
+                    if bits & bit and self.weights[name]
+                ]
+                if boost_reason and boost:
+                    labels.append(boost_reason)
+                self.reasons[code] = ", ".join(labels)
+
+    @staticmethod
+    def bit(name):
+        if name == "active":
+            return ACTIVE
+        return next(bit for bit, n, _ in CRITERIA if n == name)
+
+    @staticmethod
+    def code(bits, tier):
+        return tier * 2 * ACTIVE + bits
+
+    def pitch_tier(self, pitch_score):
+        for tier, (minimum, _, _) in enumerate(self.tiers):
+            if pitch_score >= minimum:
+                return tier
+        return len(self.tiers)
+
+    def pitch_points(self, pitch_score):
+        return int(self.scores[self.code(0, self.pitch_tier(pitch_score))])
+
+    @property
+    def max_pitch_points(self):
+        return max([points for _, points, _ in self.tiers] + [0])
+
+    def evaluate(self, bits, pitch_score):
+        """(score, reason) for one pair's criteria + active bits."""
+        code = self.code(bits, self.pitch_tier(pitch_score))
+        return int(self.scores[code]), self.reasons[code]
+
+    def evaluate_many(self, bits, pitch_score):
+        """Scores and codes for an array of bits, one founder's pitch score."""
+        codes = bits + self.code(0, self.pitch_tier(pitch_score))
+        return self.scores[codes], codes
+
+
+# -------------------------------------------------
+# LOADING
+# -------------------------------------------------
+def model_from_dict(config):
+    try:
+        version = int(config["version"])
+        threshold = int(config["threshold"])
+        weights = {name: int(config["weights"][name]) for name in WEIGHT_NAMES}
+        pitch_boost = [
+            {
+                "min_pitch_score": int(t["min_pitch_score"]),
+                "points": int(t["points"]),
+                "reason": t.get("reason"),
+            }
+            for t in config.get("pitch_boost", [])
+        ]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"invalid scoring model: {e!r}")
+
+    return ScoringModel(version, threshold, weights, pitch_boost)
+
+
+def load_model(path=None):
+    with open(path or DEFAULT_MODEL_PATH) as f:
+        return model_from_dict(json.load(f))
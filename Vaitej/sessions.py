@@ -0,0 +1,237 @@
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+
+# WSGI environ key for a session opened ahead of the request context,
+# e.g. by asgi.py off the event loop; open_session() then reuses it
+PRELOADED_SESSION = "vaitej.session"
+
+
+def new_session_id():
+    # 256 random bits: unguessable, so the cookie needs no signature
+    return secrets.token_urlsafe(32)
+
+
+# -------------------------------------------------
+# SESSION STORES
+# -------------------------------------------------
+# Stores map session id -> (JSON data, expires_at as a Unix time).
+# save() is told whether the session is anonymous (no signed-in user).
+class MemorySessionStore:
+    """
+    Sessions for a single process (tests, one worker), LRU-bounded.
+    Anonymous sessions have their own, smaller LRU, so a flood of them
+    (e.g. failed logins leaving a flash) never evicts signed-in users.
+    """
+
+    def __init__(self, max_entries=10000, max_anonymous=1000):
+        self.max_entries = max_entries
+        self.max_anonymous = max_anonymous
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._anonymous = OrderedDict()
+
+    def load(self, sid):
+        with self._lock:
+            for entries in (self._entries, self._anonymous):
+                entry = entries.get(sid)
+                if entry is None:
+                    continue
+                if entry[1] <= time.time():
+                    del entries[sid]
+                    return None
+                entries.move_to_end(sid)
+                return entry
+            return None
+
+    def save(self, sid, data, ttl, anonymous=False):
+        if anonymous:
+            entries, other, limit = self._anonymous, self._entries, self.max_anonymous
+        else:
+            entries, other, limit = self._entries, self._anonymous, self.max_entries
+        with self._lock:
+            other.pop(sid, None)
+            entries[sid] = (data, time.time() + ttl)
+            entries.move_to_end(sid)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+            self._anonymous.pop(sid, None)
+
+
+class SQLiteSessionStore:
+    """
+    Sessions shared by every worker process on one host. Unbounded, so
+    anonymous sessions are kept in check by their short TTL alone.
+    """
+
+    # Expired rows are swept on every PURGE_EVERY-th save
+    PURGE_EVERY = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self._saves = 0
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS web_sessions (
+                    sid TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        # One short-lived connection per call keeps the store thread-safe
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def load(self, sid):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT data, expires_at FROM web_sessions"
+                " WHERE sid = ? AND expires_at > ?",
+                (sid, time.time())
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def save(self, sid, data, ttl, anonymous=False):
+        now = time.time()
+        self._saves += 1
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO web_sessions (sid, data, expires_at)"
+                " VALUES (?, ?, ?)",
+                (sid, data, now + ttl)
+            )
+            if self._saves % self.PURGE_EVERY == 0:
+                conn.execute("DELETE FROM web_sessions WHERE expires_at <= ?", (now,))
+        finally:
+            conn.close()
+
+    def delete(self, sid):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM web_sessions WHERE sid = ?", (sid,))
+        finally:
+            conn.close()
+
+
+def make_session_store(path=None, max_entries=10000, max_anonymous=1000):
+    if path:
+        return SQLiteSessionStore(path)
+    return MemorySessionStore(max_entries, max_anonymous)
+
+
+# -------------------------------------------------
+# FLASK SESSION INTERFACE
+# -------------------------------------------------
+class ServerSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+        self.replaced_sid = None
+
+    def regenerate(self):
+        """Move the session to a fresh id, e.g. at login, so a planted id is useless."""
+        if not self.new:
+            self.replaced_sid = self.sid
+        self.sid = new_session_id()
+        self.modified = True
+
+
+class ServerSessionInterface(SessionInterface):
+    """
+    Keeps session data in a session store; the cookie only carries the
+    session id. Data is written when it changes, and again once half its
+    lifetime (PERMANENT_SESSION_LIFETIME) has passed, so active users stay
+    signed in without a store write on every request.
+
+    Sessions without identity_key (a flash or role pick before sign-in)
+    only live for anonymous_ttl seconds.
+    """
+
+    def __init__(self, store, anonymous_ttl=600, identity_key="user_id"):
+        self.store = store
+        self.anonymous_ttl = anonymous_ttl
+        self.identity_key = identity_key
+
+    def open_session(self, app, request):
+        preloaded = request.environ.pop(PRELOADED_SESSION, None)
+        if preloaded is not None:
+            return preloaded
+
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            stored = self.store.load(sid)
+            if stored is not None:
+                data, expires_at = stored
+                return ServerSession(json.loads(data), sid=sid, expires_at=expires_at)
+        return ServerSession(sid=new_session_id(), new=True)
+
+    def create(self, app, data):
+        """Store a new session outside any request and return its id."""
+        sid = new_session_id()
+        self.store.save(
+            sid, json.dumps(data), app.permanent_session_lifetime.total_seconds()
+        )
+        return sid
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.replaced_sid:
+            self.store.delete(session.replaced_sid)
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        anonymous = self.identity_key not in session
+        if anonymous:
+            ttl = self.anonymous_ttl
+        else:
+            ttl = app.permanent_session_lifetime.total_seconds()
+        refresh = (
+            session.expires_at is not None
+            and session.expires_at - time.time() < ttl / 2
+        )
+        if not (session.modified or refresh):
+            return
+
+        self.store.save(session.sid, json.dumps(dict(session)), ttl, anonymous)
+        response.vary.add("Cookie")
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
@@ -0,0 +1,87 @@
+import os
+
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+
+from cache import MemoryCache
+
+
+# -------------------------------------------------
+# FRAGMENT CACHE
+# -------------------------------------------------
+class FragmentCacheExtension(Extension):
+    """
+    {% cache "sidebar", session.get("role"), session.get("user_id") %}
+        ...
+    {% endcache %}
+
+    Renders the block once per distinct key and serves the stored markup
+    until it expires. The key is the fragment name plus every value the
+    block depends on; anything left out of it is shared between users.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        key = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            key.append(parser.parse_expression())
+
+        body = parser.parse_statements(["name:endcache"], drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cached", [nodes.List(key)]), [], [], body
+        ).set_lineno(lineno)
+
+    def _cached(self, key, caller):
+        cache = self.environment.fragment_cache
+        if cache is None:
+            return caller()
+
+        key = "fragment:" + ":".join(str(part) for part in key)
+        markup = cache.get(key)
+        if markup is None:
+            markup = caller()
+            cache.set(key, markup)
+        return markup
+
+
+# -------------------------------------------------
+# SETUP
+# -------------------------------------------------
+def init_template_caching(app):
+    """
+    Jinja bytecode cache on disk, so a fresh worker loads compiled
+    templates instead of compiling them, plus the {% cache %} fragment
+    tag. Call before the first template renders. Returns the fragment
+    cache, or None when FRAGMENT_CACHE_TTL is 0.
+    """
+    cache_dir = app.config["TEMPLATE_BYTECODE_CACHE_DIR"]
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    env = app.jinja_env
+    # Without a directory Jinja uses one under the system temp dir, shared
+    # by every worker on the host and kept across restarts
+    env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    env.add_extension(FragmentCacheExtension)
+
+    # Per worker: fragments are cheap to rebuild, so no shared backend
+    if app.config["FRAGMENT_CACHE_TTL"]:
+        env.fragment_cache = MemoryCache(
+            max_entries=app.config["FRAGMENT_CACHE_SIZE"],
+            default_ttl=app.config["FRAGMENT_CACHE_TTL"]
+        )
+    return env.fragment_cache
+
+
+def compile_templates(app):
+    """Load every template once, filling the bytecode cache. Returns the count."""
+    names = app.jinja_env.list_templates(extensions=["html"])
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
@@ -0,0 +1,133 @@
+import os
+import random
+import sys
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# The app is a flat set of modules; make them importable as in app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks", "schema_sqlite.sql"
+)
+
+PITCH_SCORES = [0, 59, 60, 79, 80, 95]
+
+
+# -------------------------------------------------
+# BASELINE SCORING
+# -------------------------------------------------
+def _baseline_score(founder, investor, pitch_score):
+    """
+    The per-pair scoring generate_matches ran before batch scoring and
+    scoring models, with its focus checks as token overlap (focus.py).
+    """
+    wants = founder["focus"]
+    offers = investor["focus"]
+    score = 0
+    reasons = []
+
+    if not wants["stage"].isdisjoint(offers["stage"]):
+        score += 30
+        reasons.append("stage alignment")
+
+    if not wants["sector"].isdisjoint(offers["sector"]):
+        score += 25
+        reasons.append("sector alignment")
+
+    if (
+        investor["typical_check_min"]
+        and investor["typical_check_max"]
+        and founder["min_check_size"]
+    ):
+        if investor["typical_check_min"] <= founder["min_check_size"] <= investor["typical_check_max"]:
+            score += 15
+            reasons.append("check size compatibility")
+
+    if not wants["country"].isdisjoint(offers["country"]):
+        score += 10
+        reasons.append("geographic focus")
+
+    if investor["verification_status"] == "verified":
+        score += 6
+        reasons.append("verified investor")
+
+    if investor["activity_status"] == "active":
+        score += 4
+
+    if pitch_score >= 80:
+        score += 10
+        reasons.append("strong pitch readiness")
+    elif pitch_score >= 60:
+        score += 5
+
+    return score, ", ".join(reasons)
+
+
+@pytest.fixture
+def baseline_score():
+    return _baseline_score
+
+
+# -------------------------------------------------
+# SEEDED PROFILES
+# -------------------------------------------------
+def _focus(rng):
+    return {
+        field: frozenset(rng.sample(range(1, 7), rng.randint(0, 2)))
+        for field in ("stage", "sector", "country")
+    }
+
+
+@pytest.fixture
+def investors():
+    rng = random.Random(7)
+    return [
+        {
+            "id": i,
+            "focus": _focus(rng),
+            "typical_check_min": rng.choice([None, 0, Decimal("10000"), Decimal("50000.5")]),
+            "typical_check_max": rng.choice([None, 0, Decimal("100000"), Decimal("60000")]),
+            "verification_status": rng.choice(["verified", "pending"]),
+            "activity_status": rng.choice(["active", "dormant"]),
+        }
+        for i in range(1, 501)
+    ]
+
+
+@pytest.fixture
+def founders():
+    rng = random.Random(11)
+    return [
+        {
+            "id": i,
+            "focus": _focus(rng),
+            "min_check_size": rng.choice([None, 0, Decimal("50000"), Decimal("20000")]),
+            "pitch_score": rng.choice(PITCH_SCORES),
+        }
+        for i in range(1, 61)
+    ]
+
+
+# -------------------------------------------------
+# DATABASE
+# -------------------------------------------------
+@pytest.fixture
+def session():
+    """A session on an in-memory SQLite database with the app's schema."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    raw = engine.raw_connection()
+    try:
+        with open(SCHEMA_PATH) as f:
+            raw.executescript(f.read())
+    finally:
+        raw.close()
+
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
@@ -0,0 +1,99 @@
+import time
+import tracemalloc
+import zlib
+
+from deck_analysis import (
+    MAX_INFLATED_BYTES,
+    MAX_STREAM_BYTES,
+    analyze_pdf,
+    extract_pdf
+)
+
+
+def write_pdf(tmp_path, *streams):
+    """A minimal PDF body: (dict entries, payload) per stream."""
+    body = b"%PDF-1.7\n"
+    for n, (entries, payload) in enumerate(streams, start=1):
+        body += (
+            b"%d 0 obj\n<< %s /Length %d >>\nstream\n" % (n, entries, len(payload))
+            + payload + b"\nendstream\nendobj\n"
+        )
+    path = tmp_path / "deck.pdf"
+    path.write_bytes(body + b"%%EOF\n")
+    return path
+
+
+def test_zlib_bomb_is_capped(tmp_path):
+    # ~100 KB of deflate that would inflate to 256 MB
+    bomb = zlib.compress(b" " * (256 * 1024 * 1024), 9)
+    path = write_pdf(
+        tmp_path,
+        (b"/Filter /FlateDecode", bomb),
+        (b"/Type /ObjStm /Filter /FlateDecode", bomb),
+        (b"/Filter /FlateDecode", zlib.compress(b"(Problem) Tj")),
+    )
+
+    tracemalloc.start()
+    try:
+        extract_pdf(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 2 * MAX_INFLATED_BYTES
+
+
+def test_hex_strings_are_extracted(tmp_path):
+    content = (
+        b"BT <50726f626c656d> Tj "
+        b"[<536f6c7574696f6e> -120 (Market)] TJ ET"
+    )
+    path = write_pdf(tmp_path, (b"/Filter /FlateDecode", zlib.compress(content)))
+
+    _, text = extract_pdf(path)
+
+    assert "Problem" in text
+    assert "Solution" in text
+    assert "Market" in text
+
+
+def test_pages_in_object_streams_are_counted(tmp_path):
+    objects = b"3 0 4 40 << /Type /Page /Parent 2 0 R >> << /Type /Page /Parent 2 0 R >>"
+    path = write_pdf(
+        tmp_path,
+        (b"/Type /ObjStm /N 2 /First 8 /Filter /FlateDecode", zlib.compress(objects)),
+    )
+
+    assert analyze_pdf(path)["page_count"] == 2
+
+
+def test_pathological_streams_finish_quickly(tmp_path):
+    # Strings that are never shown, and ones that never close: a
+    # backtracking scan of these takes minutes
+    size = MAX_STREAM_BYTES - 1024
+    shown_never = b"(a) " * (size // 4)
+    unclosed = b"((a " * (size // 4)
+    arrays = b"[(a) " * (size // 5)
+    path = write_pdf(
+        tmp_path,
+        (b"", shown_never),
+        (b"", unclosed),
+        (b"/Filter /FlateDecode", zlib.compress(shown_never)),
+        (b"/Filter /FlateDecode", zlib.compress(arrays)),
+    )
+
+    started = time.perf_counter()
+    extract_pdf(path)
+
+    assert time.perf_counter() - started < 5
+
+
+def test_nested_and_escaped_literals(tmp_path):
+    content = b"BT (Problem (and) pain) Tj (Team \\(cont.\\)) ' (hidden) ET"
+    path = write_pdf(tmp_path, (b"", content))
+
+    _, text = extract_pdf(path)
+
+    assert "Problem (and) pain" in text
+    assert "Team (cont.)" in text
+    assert "hidden" not in text
@@ -0,0 +1,43 @@
+import pytest
+
+from focus import investor_tokens, normalize_token, tokenize
+
+
+@pytest.mark.parametrize("value, token", [
+    ("Pre-Seed", "pre seed"),
+    (" PRE_SEED ", "pre seed"),
+    ("Series A+", "series a"),
+    ("Series A +", "series a"),
+])
+def test_normalize_token(value, token):
+    assert normalize_token(value) == token
+
+
+def matches(founder_value, investor_value):
+    return bool(tokenize(founder_value) & investor_tokens(investor_value))
+
+
+@pytest.mark.parametrize("founder_value, investor_value", [
+    ("Series A+", "Seed, Series A"),
+    ("Canada", "US & Canada"),
+    ("US", "US & Canada"),
+    ("SaaS", "B2B SaaS"),
+    ("India", "India and Southeast Asia"),
+    ("Southeast Asia", "India and Southeast Asia"),
+    ("AI", "AI+ML"),
+])
+def test_focus_matches(founder_value, investor_value):
+    assert matches(founder_value, investor_value)
+
+
+@pytest.mark.parametrize("founder_value, investor_value", [
+    ("AI", "Retail"),
+    ("Series A", "Series B"),
+    ("Brand", "Consumer Brands"),
+])
+def test_focus_does_not_match_inside_words(founder_value, investor_value):
+    assert not matches(founder_value, investor_value)
+
+
+def test_and_only_splits_whole_words():
+    assert tokenize("Brand Strategy, Andorra") == {"brand strategy", "andorra"}
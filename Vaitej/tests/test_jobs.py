@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from jobs import DONE, RUNNING, InMemoryJobStore, JobQueue, SQLiteJobStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryJobStore()
+    return SQLiteJobStore(str(tmp_path / "jobs.db"))
+
+
+def test_queued_job_is_deduplicated(store):
+    queue = JobQueue(store, max_workers=1)
+    release = threading.Event()
+    runs = []
+
+    queue.submit("busy", release.wait)  # holds the only worker
+    queue.submit("founder", runs.append, 1)
+    queue.submit("founder", runs.append, 2)  # still queued: same job
+    release.set()
+
+    assert queue.wait_idle(timeout=5)
+    assert runs == [1]
+    assert queue.status("founder")["status"] == DONE
+
+
+def test_submit_while_running_runs_once_more(store):
+    queue = JobQueue(store, max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    runs = []
+
+    def job():
+        runs.append(len(runs))
+        started.set()
+        release.wait()
+
+    queue.submit("founder", job)
+    assert started.wait(timeout=5)
+    queue.submit("founder", job)  # may have read stale inputs: rerun
+    queue.submit("founder", job)  # already flagged: no extra run
+    release.set()
+
+    assert queue.wait_idle(timeout=5)
+    assert runs == [0, 1]
+    assert queue.status("founder")["status"] == DONE
+
+
+def test_long_running_job_is_not_stale(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    queue = JobQueue(SQLiteJobStore(path, stale_after=0.5), heartbeat_interval=0.1)
+    release = threading.Event()
+
+    queue.submit("founder", release.wait)
+    time.sleep(1.0)  # twice stale_after
+
+    # Another worker sharing the store finds the job alive
+    job, created = SQLiteJobStore(path, stale_after=0.5).claim("founder")
+    release.set()
+
+    assert not created
+    assert job["status"] == RUNNING
+    assert queue.wait_idle(timeout=5)
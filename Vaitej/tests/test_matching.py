@@ -0,0 +1,35 @@
+from sqlalchemy import text
+
+from matching import InvestorFrame, calculate_match_score, upsert_matches
+from scoring_model import load_model
+
+
+def test_batch_scoring_matches_per_pair_scoring(founders, investors, baseline_score):
+    model = load_model()
+    frame = InvestorFrame(investors)
+
+    for founder in founders:
+        pitch_score = founder["pitch_score"]
+        expected = []
+        for investor in investors:
+            score, reason = baseline_score(founder, investor, pitch_score)
+            assert calculate_match_score(founder, investor, pitch_score, model) == (score, reason)
+            if score >= 40:
+                expected.append((investor["id"], score, reason))
+
+        rows = frame.match_rows(founder, pitch_score, model)
+
+        assert [(r["iid"], r["score"], r["reason"]) for r in rows] == expected
+
+
+def test_upsert_keeps_status(session):
+    row = {"fid": 1, "iid": 2, "score": 50, "status": "new", "reason": "stage alignment", "model": 1}
+    upsert_matches(session, [row])
+    session.execute(text("UPDATE matches SET status = 'interested'"))
+
+    upsert_matches(session, [dict(row, score=71, reason="sector alignment")])
+
+    match = session.execute(
+        text("SELECT match_score, status, ai_reason FROM matches")
+    ).one()
+    assert tuple(match) == (71, "interested", "sector alignment")
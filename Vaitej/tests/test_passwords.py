@@ -0,0 +1,18 @@
+from werkzeug.security import check_password_hash
+
+from passwords import PasswordHasher
+
+
+def test_hashing_recovers_after_a_pool_process_dies():
+    hasher = PasswordHasher("pbkdf2:sha256:1000", max_workers=1)
+    hasher.start()
+    hasher.hash("warm-up")  # the pool starts its process on first use
+
+    for process in list(hasher._pool._processes.values()):
+        process.kill()
+        process.join()
+
+    password_hash = hasher.hash("s3cret")
+
+    assert check_password_hash(password_hash, "s3cret")
+    assert hasher.verify(password_hash, "s3cret")
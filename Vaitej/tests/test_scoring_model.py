@@ -0,0 +1,66 @@
+from sqlalchemy import text
+
+from focus import store_investor_focus
+from matching import calculate_match_score
+from rematch import rescore_stale
+from scoring_model import load_model
+
+
+def test_v1_scores_like_the_hard_coded_weights(founders, investors, baseline_score):
+    model = load_model()
+
+    assert (model.version, model.threshold) == (1, 40)
+    for founder in founders:
+        for investor in investors:
+            pitch_score = founder["pitch_score"]
+            assert (
+                calculate_match_score(founder, investor, pitch_score, model)
+                == baseline_score(founder, investor, pitch_score)
+            )
+
+
+def test_rescore_stale_only_touches_other_versions(session):
+    session.execute(text("""
+        INSERT INTO users (id, role, full_name, email, country)
+        VALUES (1, 'founder', 'F', 'f@example.com', 'India')
+    """))
+    session.execute(text("""
+        INSERT INTO founder_profiles (id, user_id, stage, sector, min_check_size)
+        VALUES (1, 1, 'Seed', 'AI', 50000)
+    """))
+    session.execute(text("""
+        INSERT INTO pitch_decks (founder_id, deck_score, scoring_status)
+        VALUES (1, 85, 'scored')
+    """))
+    session.execute(text("""
+        INSERT INTO investor_profiles
+        (id, user_id, investment_stage, sector_focus, geography_focus,
+         typical_check_min, typical_check_max, verification_status)
+        VALUES
+        (1, 2, 'Seed, Series A', 'AI, SaaS', 'India', 10000, 100000, 'verified'),
+        (2, 3, 'Series B', 'Fintech', 'US', NULL, NULL, 'pending'),
+        (3, 4, 'Series A', 'B2B SaaS', 'India and Southeast Asia', 10000, 40000, 'verified')
+    """))
+    store_investor_focus(session, [1, 2, 3])
+    session.execute(text("""
+        INSERT INTO matches
+        (founder_id, investor_id, match_score, status, ai_reason, model_version)
+        VALUES
+        (1, 1, 1, 'new', 'current', 1),
+        (1, 2, 99, 'new', 'stale', 0),
+        (1, 3, 99, 'interested', 'unscored', NULL)
+    """))
+    session.commit()
+
+    rescored, _ = rescore_stale(session, load_model())
+
+    rows = session.execute(text("""
+        SELECT investor_id, match_score, status, ai_reason, model_version
+        FROM matches ORDER BY investor_id
+    """)).all()
+    assert rescored == 2
+    assert [tuple(r) for r in rows] == [
+        (1, 1, "new", "current", 1),
+        (2, 14, "new", "strong pitch readiness", 1),
+        (3, 30, "interested", "geographic focus, verified investor, strong pitch readiness", 1),
+    ]
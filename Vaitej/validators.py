@@ -1,26 +1,233 @@
+import re
+from collections import namedtuple
+from datetime import date
+
+# -------------------------------------------------
+# FIELD PARSERS
+# -------------------------------------------------
+# A parser takes the stripped, non-empty raw string and returns the
+# normalized value, or raises ValueError with a message for the user.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+$")  # what <input type="email"> accepts
+LIST_SEPARATORS_RE = re.compile(r"\s*[,;/|]\s*")
+INTEGER_NOISE_RE = re.compile(r"[\s,_$]")
+
+
+def text(max_length=255):
+    def parse(value):
+        if len(value) > max_length:
+            raise ValueError(f"must be at most {max_length} characters")
+        return value
+    return parse
+
+
+def email(value):
+    if len(value) > 255 or not EMAIL_RE.match(value):
+        raise ValueError("must be a valid email address")
+    return value
+
+
+def integer(minimum, maximum):
+    def parse(value):
+        try:
+            number = int(INTEGER_NOISE_RE.sub("", value))
+        except ValueError:
+            raise ValueError("must be a whole number")
+        if not minimum <= number <= maximum:
+            # Thousands separators for amounts, not for years
+            spec = "," if maximum >= 10000 else ""
+            raise ValueError(
+                f"must be between {minimum:{spec}} and {maximum:{spec}}"
+            )
+        return number
+    return parse
+
+
+def _choice_key(value):
+    return re.sub(r"[^a-z0-9+]", "", value.lower())
+
+
+def choice(options, aliases=None, multiple=False):
+    """
+    One of options, matched ignoring case, spaces and punctuation, and
+    returned in its canonical spelling. With multiple=True the value is a
+    comma/semicolon/slash separated list of options.
+    """
+    lookup = {_choice_key(o): o for o in options}
+    lookup.update({_choice_key(k): v for k, v in (aliases or {}).items()})
+    message = "must be one of: " + ", ".join(options)
+
+    def one(value):
+        try:
+            return lookup[_choice_key(value)]
+        except KeyError:
+            raise ValueError(message)
+
+    if not multiple:
+        one.memoize = True
+        return one
+
+    def parse(value):
+        picked = []
+        for part in LIST_SEPARATORS_RE.split(value):
+            if part:
+                option = one(part)
+                if option not in picked:
+                    picked.append(option)
+        if not picked:
+            raise ValueError(message)
+        return ", ".join(picked)
+
+    parse.memoize = True
+    return parse
+
+
+# Yes/no selects post "1" / "0"; imports may spell it out
+flag = choice(
+    ["1", "0"],
+    aliases={"yes": "1", "y": "1", "true": "1", "no": "0", "n": "0", "false": "0"}
+)
+
+
+# -------------------------------------------------
+# SCHEMAS
+# -------------------------------------------------
+class Field:
+    def __init__(self, name, label, parse=None, required=True, strip=True):
+        self.name = name
+        self.label = label
+        self.parse = parse or text()
+        self.required = required
+        self.strip = strip
+        # Enum-like fields repeat the same few values, so a batch parses
+        # each distinct raw value once
+        self.memoize = getattr(self.parse, "memoize", False)
+
+
+class ValidationResult(namedtuple("ValidationResult", ["values", "errors"])):
+    """values: field -> normalized value; errors: field -> message."""
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def messages(self):
+        return list(self.errors.values())
+
+
+class Schema:
+    """
+    A fixed set of fields compiled into a flat list of checks. validate()
+    handles one record (a form or dict); validate_many() runs the same
+    checks column by column over a whole batch.
+    """
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self._checks = [
+            (f.name, f"{f.label} {{}}", f.parse, f.required, f.strip, f.memoize)
+            for f in self.fields
+        ]
+
+    def __add__(self, other):
+        return Schema(self.fields + other.fields)
+
+    @property
+    def names(self):
+        return [f.name for f in self.fields]
+
+    def validate(self, record):
+        return self.validate_many([record])[0]
+
+    def validate_many(self, records):
+        values = [{} for _ in records]
+        errors = [{} for _ in records]
+
+        for name, message, parse, required, strip, memoize in self._checks:
+            seen = {}
+            for i, raw in enumerate([r.get(name) for r in records]):
+                if raw is None:
+                    raw = ""
+                elif not isinstance(raw, str):
+                    raw = str(raw)
+                if strip:
+                    raw = raw.strip()
+
+                if not raw:
+                    if required:
+                        errors[i][name] = message.format("is required")
+                    else:
+                        values[i][name] = None
+                    continue
+
+                if memoize and raw in seen:
+                    parsed, error = seen[raw]
+                else:
+                    try:
+                        parsed, error = parse(raw), None
+                    except ValueError as e:
+                        parsed, error = None, message.format(e)
+                    if memoize:
+                        seen[raw] = (parsed, error)
+
+                if error:
+                    errors[i][name] = error
+                else:
+                    values[i][name] = parsed
+
+        return [ValidationResult(v, e) for v, e in zip(values, errors)]
+
+
+FOUNDER_STAGES = ["Idea", "Pre-seed", "Seed", "Series A+"]
+INVESTOR_STAGES = ["Pre-seed", "Seed", "Series A", "Series B", "Growth"]
+
+stage = choice(FOUNDER_STAGES, aliases={"Series A": "Series A+"})
+
+investment_stages = choice(INVESTOR_STAGES, multiple=True)
+
+COMMON_SCHEMA = Schema([
+    Field("full_name", "Full name"),
+    Field("email", "Email", email),
+    Field("password", "Password", text(1024), strip=False),
+    Field("phone", "Phone", text(32)),
+    Field("country", "Country", text(100)),
+    Field("referral", "Referral", required=False),
+])
+
+FOUNDER_SCHEMA = Schema([
+    Field("company_name", "Company name"),
+    Field("founding_year", "Founding year", integer(1900, date.today().year + 1)),
+    Field("stage", "Stage", stage),
+    Field("sector", "Sector"),
+    Field("business_model", "Business model"),
+    Field("actively_raising", "Actively raising", flag),
+])
+
+INVESTOR_SCHEMA = Schema([
+    Field("fund_name", "Fund name"),
+    Field("investment_stage", "Investment stage", investment_stages),
+    Field("sector_focus", "Sector focus"),
+    Field("geography_focus", "Geography focus"),
+    Field("check_size", "Check size", integer(1, 10 ** 12)),
+    Field("accredited", "Accredited", flag),
+])
+
+# Everything a registration (form post or import row) needs, per role
+REGISTRATION_SCHEMAS = {
+    "founder": COMMON_SCHEMA + FOUNDER_SCHEMA,
+    "investor": COMMON_SCHEMA + INVESTOR_SCHEMA,
+}
+
+
+# -------------------------------------------------
+# BOOLEAN WRAPPERS
+# -------------------------------------------------
 def validate_common(data):
-    required = ["full_name", "email", "password", "phone", "country"]
-    return all(data.get(field) for field in required)
+    return COMMON_SCHEMA.validate(data).ok
 
 
 def validate_founder(data):
-    required = [
-        "company_name",
-        "founding_year",
-        "stage",
-        "sector",
-        "business_model",
-        "actively_raising"
-    ]
-    return all(data.get(field) for field in required)
+    return FOUNDER_SCHEMA.validate(data).ok
 
 
 def validate_investor(data):
-    required = [
-        "fund_name",
-        "investment_stage",
-        "sector_focus",
-        "geography_focus",
-        "check_size"
-    ]
-    return all(data.get(field) for field in required)
+    return INVESTOR_SCHEMA.validate(data).ok
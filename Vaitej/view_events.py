@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import text
+
+import counters
+
+INSERT_VIEWS_SQL = text("""
+    INSERT INTO investor_profile_views (founder_id, investor_id, viewed_at)
+    VALUES (:fid, :iid, :viewed_at)
+""")
+
+
+def write_view_events(session, events):
+    """
+    Insert a batch of (founder_id, investor_id, viewed_at) events.
+
+    One executemany (a multi-row INSERT on PyMySQL) plus the matching
+    dashboard rollups, all in the caller's transaction.
+    """
+    if not events:
+        return
+
+    session.execute(INSERT_VIEWS_SQL, [
+        {"fid": fid, "iid": iid, "viewed_at": viewed_at}
+        for fid, iid, viewed_at in events
+    ])
+    counters.add_views(session, Counter(
+        (fid, viewed_at.date()) for fid, _, viewed_at in events
+    ))
+
+
+class ViewEventBuffer:
+    """
+    Collects profile-view events in memory and hands them to flush_fn in
+    batches, when batch_size events are waiting or every flush_interval
+    seconds, whichever comes first.
+
+    At most capacity events are held. When the buffer is full, record()
+    waits up to enqueue_timeout for the flusher to drain it and then
+    rejects the event, so a slow database pushes back on callers instead
+    of growing memory.
+
+    flush_fn must write each call in its own transaction: if a batch
+    fails, its events are retried one per call, so a bad event only
+    loses itself. on_error(error, events) gets the events that were
+    dropped and the last error.
+    """
+
+    def __init__(self, flush_fn, batch_size=500, flush_interval=1.0,
+                 capacity=10000, enqueue_timeout=0.05, on_error=None):
+        self.flush_fn = flush_fn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self.enqueue_timeout = enqueue_timeout
+        self.on_error = on_error
+
+        self._cond = threading.Condition()
+        self._events = []
+        self._closed = False
+        self._thread = None
+
+    def record(self, founder_id, investor_id, viewed_at=None):
+        event = (founder_id, investor_id, viewed_at or datetime.now())
+
+        with self._cond:
+            if self._closed:
+                return False
+
+            self._ensure_started()
+
+            if len(self._events) >= self.capacity:
+                self._cond.notify_all()
+                deadline = time.monotonic() + self.enqueue_timeout
+                while len(self._events) >= self.capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._closed:
+                        return False  # backpressure: caller should shed load
+                    self._cond.wait(remaining)
+
+            self._events.append(event)
+            if len(self._events) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def pending(self):
+        with self._cond:
+            return len(self._events)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="view-events", daemon=True
+            )
+            self._thread.start()
+
+    def _take_batch(self):
+        batch = self._events[:self.batch_size]
+        del self._events[:self.batch_size]
+        self._cond.notify_all()  # wake producers waiting on capacity
+        return batch
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._events) >= self.batch_size,
+                    timeout=self.flush_interval
+                )
+                if self._closed:
+                    return
+                batch = self._take_batch()
+            self._flush(batch)
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        try:
+            self.flush_fn(batch)
+            return
+        except Exception as e:
+            error = e
+            if len(batch) == 1:
+                dropped = batch
+            else:
+                dropped = []
+                for event in batch:
+                    try:
+                        self.flush_fn([event])
+                    except Exception as e:
+                        error = e
+                        dropped.append(event)
+
+        if dropped and self.on_error:
+            self.on_error(error, dropped)
+
+    def flush(self):
+        """Synchronously write everything buffered so far."""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._flush(batch)
+
+    def close(self):
+        """Stop the flusher thread and write out what is left."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+        self.flush()